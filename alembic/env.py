@@ -24,6 +24,7 @@ from src.notification.models import *  # noqa
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
+from src.upload.models import *  # noqa
 from src.user.models import *  # noqa
 from src.websocket.models import *  # noqa
 
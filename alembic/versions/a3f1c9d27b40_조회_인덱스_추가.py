@@ -0,0 +1,76 @@
+"""조회 인덱스 추가
+
+Revision ID: a3f1c9d27b40
+Revises: 8e46d4333dd2
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c9d27b40"
+down_revision: Union[str, None] = "8e46d4333dd2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, partial 조건)
+INDEXES: list[tuple[str, str, list[str], Union[str, None]]] = [
+    (
+        "ix_diaries_user_id_created_at",
+        "diaries",
+        ["user_id", "created_at", "id"],
+        "deleted_at IS NULL",
+    ),
+    (
+        "ix_diaries_user_id_write_date",
+        "diaries",
+        ["user_id", "write_date"],
+        "deleted_at IS NULL",
+    ),
+    (
+        "ix_ex_diaries_friend_id_created_at",
+        "ex_diaries",
+        ["friend_id", "created_at"],
+        None,
+    ),
+    ("ix_messages_friend_id_created_at", "messages", ["friend_id", "created_at"], None),
+    ("ix_friends_user_id1_is_accept", "friends", ["user_id1", "is_accept"], None),
+    ("ix_friends_user_id2_is_accept", "friends", ["user_id2", "is_accept"], None),
+    (
+        "ix_notifications_user_id_created_at",
+        "notifications",
+        ["user_id", "created_at"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블에 락을 잡지 않도록 CONCURRENTLY 로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,38 @@
+"""이미지 변환 키 컬럼
+
+Revision ID: a4c7e2d9b610
+Revises: f2c8d6b3a915
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c7e2d9b610"
+down_revision: Union[str, None] = "f2c8d6b3a915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 이미지는 변환 이미지가 없으므로 목록에서도 원본을 그대로 사용
+    for table, length in (("diaries", 255), ("ex_diaries", 255), ("users", None)):
+        column_type = sa.String(length) if length else sa.String()
+        op.add_column(table, sa.Column("img_thumbnail_key", column_type, nullable=True))
+        op.add_column(table, sa.Column("img_webp_key", column_type, nullable=True))
+    op.add_column(
+        "friend_summaries",
+        sa.Column("friend_profile_thumbnail_key", sa.String(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("friend_summaries", "friend_profile_thumbnail_key")
+    for table in ("users", "ex_diaries", "diaries"):
+        op.drop_column(table, "img_webp_key")
+        op.drop_column(table, "img_thumbnail_key")
@@ -0,0 +1,44 @@
+"""일기 검색 인덱스
+
+Revision ID: b7d2e4f81c93
+Revises: a3f1c9d27b40
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e4f81c93"
+down_revision: Union[str, None] = "a3f1c9d27b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # src.diary.models.search_document 와 같은 식이어야 검색 쿼리가 인덱스를 사용함
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_diaries_search",
+            "diaries",
+            [sa.text("to_tsvector('simple'::regconfig, title || ' ' || content)")],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_diaries_search",
+            table_name="diaries",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,58 @@
+"""이미지 참조 카운트 테이블
+
+Revision ID: b8e5f3a1c720
+Revises: a4c7e2d9b610
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e5f3a1c720"
+down_revision: Union[str, None] = "a4c7e2d9b610"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "image_blobs",
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("has_variants", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("url"),
+    )
+    op.create_index(
+        "ix_image_blobs_unused",
+        "image_blobs",
+        ["url"],
+        unique=False,
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+    # 기존 이미지의 참조 수 (삭제 대기 중인 일기도 참조로 셈)
+    op.execute(
+        """
+        INSERT INTO image_blobs (url, ref_count, has_variants, created_at)
+        SELECT img_url, COUNT(*), bool_or(img_thumbnail_key IS NOT NULL), now()
+        FROM (
+            SELECT img_url, img_thumbnail_key FROM diaries
+            UNION ALL
+            SELECT img_url, img_thumbnail_key FROM ex_diaries
+            UNION ALL
+            SELECT img_url, img_thumbnail_key FROM users
+        ) AS images
+        WHERE img_url IS NOT NULL AND img_url <> ''
+        GROUP BY img_url
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_image_blobs_unused", table_name="image_blobs")
+    op.drop_table("image_blobs")
@@ -0,0 +1,100 @@
+"""이미지 객체 키 컬럼
+
+Revision ID: c3f9a6d1e284
+Revises: b8e5f3a1c720
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f9a6d1e284"
+down_revision: Union[str, None] = "b8e5f3a1c720"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# "{NCP_ENDPOINT_URL}/{버킷}/{키}" 형식의 URL 에서 키만 남김
+# (예전 AWS S3 URL 은 이 버킷의 객체가 아니므로 키를 채우지 않음)
+URL_PREFIX = "'^https?://[^/]+/[^/]+/'"
+
+
+def object_key_sql(column: str) -> str:
+    return f"regexp_replace({column}, {URL_PREFIX}, '')"
+
+
+def bucket_url_sql(column: str) -> str:
+    return (
+        f"{column} ~ '^https?://[^/]+/[^/]+/.+' "
+        f"AND {column} NOT LIKE '%.amazonaws.com/%'"
+    )
+
+
+def upgrade() -> None:
+    op.add_column("diaries", sa.Column("img_key", sa.String(255), nullable=True))
+    op.add_column("ex_diaries", sa.Column("img_key", sa.String(255), nullable=True))
+    op.add_column("users", sa.Column("img_key", sa.String(), nullable=True))
+    for table in ("diaries", "ex_diaries", "users"):
+        op.execute(
+            f"UPDATE {table} SET img_key = {object_key_sql('img_url')} "
+            f"WHERE {bucket_url_sql('img_url')}"
+        )
+
+    # image_blobs 도 URL 대신 객체 키로 식별
+    op.add_column("image_blobs", sa.Column("key", sa.String(), nullable=True))
+    op.execute(
+        f"UPDATE image_blobs SET key = {object_key_sql('url')} "
+        f"WHERE {bucket_url_sql('url')}"
+    )
+    op.execute("DELETE FROM image_blobs WHERE key IS NULL")
+    op.drop_index("ix_image_blobs_unused", table_name="image_blobs")
+    op.drop_constraint("image_blobs_pkey", "image_blobs", type_="primary")
+    op.drop_column("image_blobs", "url")
+    op.alter_column("image_blobs", "key", nullable=False)
+    op.create_primary_key("image_blobs_pkey", "image_blobs", ["key"])
+    op.create_index(
+        "ix_image_blobs_unused",
+        "image_blobs",
+        ["key"],
+        unique=False,
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.add_column("image_blobs", sa.Column("url", sa.String(), nullable=True))
+    # 키를 참조하는 행의 URL 로 되돌림
+    op.execute(
+        """
+        UPDATE image_blobs SET url = images.img_url
+        FROM (
+            SELECT img_key, img_url FROM diaries
+            UNION ALL
+            SELECT img_key, img_url FROM ex_diaries
+            UNION ALL
+            SELECT img_key, img_url FROM users
+        ) AS images
+        WHERE images.img_key = image_blobs.key
+        """
+    )
+    op.execute("DELETE FROM image_blobs WHERE url IS NULL")
+    op.drop_index("ix_image_blobs_unused", table_name="image_blobs")
+    op.drop_constraint("image_blobs_pkey", "image_blobs", type_="primary")
+    op.drop_column("image_blobs", "key")
+    op.alter_column("image_blobs", "url", nullable=False)
+    op.create_primary_key("image_blobs_pkey", "image_blobs", ["url"])
+    op.create_index(
+        "ix_image_blobs_unused",
+        "image_blobs",
+        ["url"],
+        unique=False,
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+    op.drop_column("users", "img_key")
+    op.drop_column("ex_diaries", "img_key")
+    op.drop_column("diaries", "img_key")
@@ -0,0 +1,49 @@
+"""기분 카운터 테이블
+
+Revision ID: c41e9a7f05d2
+Revises: b7d2e4f81c93
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e9a7f05d2"
+down_revision: Union[str, None] = "b7d2e4f81c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_mood_counts",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "mood",
+            postgresql.ENUM(name="moodenum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "mood"),
+    )
+    # 기존 일기로 카운터 채우기 (삭제되지 않은 일기 기준)
+    op.execute(
+        """
+        INSERT INTO user_mood_counts (user_id, mood, count)
+        SELECT user_id, mood, count(*)
+        FROM diaries
+        WHERE deleted_at IS NULL AND user_id IS NOT NULL
+        GROUP BY user_id, mood
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_mood_counts")
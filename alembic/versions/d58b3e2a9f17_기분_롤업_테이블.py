@@ -0,0 +1,67 @@
+"""기분 롤업 테이블
+
+Revision ID: d58b3e2a9f17
+Revises: c41e9a7f05d2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d58b3e2a9f17"
+down_revision: Union[str, None] = "c41e9a7f05d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mood_rollups",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(length=16), nullable=False),
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column(
+            "mood",
+            postgresql.ENUM(name="moodenum", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "source", "period", "period_start", "mood"),
+    )
+
+    # 기존 일기/교환일기로 롤업 채우기 (date_trunc('week') 는 월요일 시작)
+    # 교환일기 기분은 ex_moodenum 타입이므로 이름(text)을 거쳐 moodenum 으로 변환
+    for period in ("week", "month"):
+        op.execute(
+            f"""
+            INSERT INTO mood_rollups (user_id, source, period, period_start, mood, count)
+            SELECT user_id, 'diary', '{period}',
+                   date_trunc('{period}', write_date)::date, mood, count(*)
+            FROM diaries
+            WHERE deleted_at IS NULL AND user_id IS NOT NULL
+            GROUP BY user_id, date_trunc('{period}', write_date)::date, mood
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO mood_rollups (user_id, source, period, period_start, mood, count)
+            SELECT user_id, 'ex_diary', '{period}',
+                   date_trunc('{period}', write_date)::date,
+                   mood::text::moodenum, count(*)
+            FROM ex_diaries
+            WHERE user_id IS NOT NULL
+            GROUP BY user_id, date_trunc('{period}', write_date)::date, mood
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("mood_rollups")
@@ -0,0 +1,80 @@
+"""친구 목록 요약 테이블
+
+Revision ID: e3b7c9a41f62
+Revises: d58b3e2a9f17
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b7c9a41f62"
+down_revision: Union[str, None] = "d58b3e2a9f17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "friend_summaries",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("friend_id", sa.Integer(), nullable=False),
+        sa.Column("friend_user_id", sa.Integer(), nullable=False),
+        sa.Column("friend_nickname", sa.String(), nullable=False),
+        sa.Column("friend_profile_img", sa.String(), nullable=True),
+        sa.Column("friend_introduce", sa.String(), nullable=True),
+        sa.Column("ex_diary_cnt", sa.Integer(), nullable=False),
+        sa.Column("last_ex_date", sa.DateTime(), nullable=True),
+        sa.Column("latest_message", sa.Text(), nullable=True),
+        sa.Column("latest_message_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["friend_id"], ["friends.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["friend_user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "friend_id"),
+    )
+    op.create_index(
+        op.f("ix_friend_summaries_friend_user_id"),
+        "friend_summaries",
+        ["friend_user_id"],
+        unique=False,
+    )
+    # 수락된 친구 관계마다 양쪽 사용자의 요약 행 생성 (마지막 메시지 포함)
+    op.execute(
+        """
+        INSERT INTO friend_summaries (
+            user_id, friend_id, friend_user_id, friend_nickname,
+            friend_profile_img, friend_introduce, ex_diary_cnt, last_ex_date,
+            latest_message, latest_message_at, created_at
+        )
+        SELECT pair.user_id, f.id, u.id, u.nickname, u.img_url, u.introduce,
+               coalesce(f.ex_diary_cnt, 0), f.last_ex_date,
+               m.message, m.created_at, f.created_at
+        FROM friends f
+        CROSS JOIN LATERAL (
+            VALUES (f.user_id1, f.user_id2), (f.user_id2, f.user_id1)
+        ) AS pair (user_id, other_id)
+        JOIN users u ON u.id = pair.other_id
+        LEFT JOIN LATERAL (
+            SELECT message, created_at
+            FROM messages
+            WHERE messages.friend_id = f.id
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1
+        ) m ON true
+        WHERE f.is_accept
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_friend_summaries_friend_user_id"), table_name="friend_summaries"
+    )
+    op.drop_table("friend_summaries")
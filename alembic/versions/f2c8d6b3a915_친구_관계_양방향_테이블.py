@@ -0,0 +1,60 @@
+"""친구 관계 양방향 테이블
+
+Revision ID: f2c8d6b3a915
+Revises: e3b7c9a41f62
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8d6b3a915"
+down_revision: Union[str, None] = "e3b7c9a41f62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "friend_edges",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("other_user_id", sa.Integer(), nullable=False),
+        sa.Column("friend_id", sa.Integer(), nullable=False),
+        sa.Column("is_accept", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["other_user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["friend_id"], ["friends.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "other_user_id"),
+    )
+    op.create_index(
+        "ix_friend_edges_user_id_friend_id",
+        "friend_edges",
+        ["user_id", "friend_id", "is_accept"],
+        unique=False,
+    )
+    # 기존 친구 관계마다 양방향 행 생성
+    # (같은 두 사용자 사이에 중복 행이 있으면 수락된 관계, 먼저 생성된 관계 우선)
+    op.execute(
+        """
+        INSERT INTO friend_edges (user_id, other_user_id, friend_id, is_accept)
+        SELECT DISTINCT ON (pair.user_id, pair.other_user_id)
+               pair.user_id, pair.other_user_id, f.id, coalesce(f.is_accept, false)
+        FROM friends f
+        CROSS JOIN LATERAL (
+            VALUES (f.user_id1, f.user_id2), (f.user_id2, f.user_id1)
+        ) AS pair (user_id, other_user_id)
+        WHERE f.user_id1 <> f.user_id2
+        ORDER BY pair.user_id, pair.other_user_id,
+                 coalesce(f.is_accept, false) DESC, f.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_friend_edges_user_id_friend_id", table_name="friend_edges")
+    op.drop_table("friend_edges")
@@ -0,0 +1,80 @@
+"""
+authenticate 의존성 마이크로벤치마크
+
+일기(/diary) / 친구(/friends) 라우트에 들어오는 인증 요청 한 건당
+기존 방식(만료 확인 + 디코딩으로 토큰을 두 번 검증)과
+검증 토큰 캐시를 사용하는 현재 방식의 처리 시간을 비교합니다.
+
+실행: python -m benchmarks.authenticate_benchmark
+"""
+
+import asyncio
+import time
+
+import jwt
+from fastapi import Response
+from starlette.requests import Request
+
+from src.user.service.authentication import (
+    ALGORITHM,
+    SECRET_KEY,
+    authenticate,
+    encode_access_token,
+    verified_token_cache,
+)
+
+ROUTES = ["/diary", "/friends"]
+NUMBER = 20000
+
+
+def build_request(path: str, token: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def legacy_authenticate(request: Request) -> int:
+    # 캐시 도입 전 흐름: is_access_token_expired + decode_access_token
+    token = request.headers["Authorization"].split(" ", 1)[1]
+    payload = jwt.decode(token.encode("utf-8"), SECRET_KEY, algorithms=[ALGORITHM])
+    if payload["exp"] < int(time.time()):
+        raise RuntimeError("expired")
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    return int(payload["user_id"])
+
+
+async def main() -> None:
+    token = encode_access_token(user_id=1)
+
+    print(f"{'route':<10} {'legacy(us)':>12} {'cached(us)':>12} {'saved':>8}")
+    for path in ROUTES:
+        request = build_request(path, token)
+        verified_token_cache.clear()
+
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            legacy_authenticate(request)
+        legacy = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            await authenticate(request, Response())
+        cached = time.perf_counter() - started
+
+        legacy_us = legacy / NUMBER * 1_000_000
+        cached_us = cached / NUMBER * 1_000_000
+        saved = (1 - cached_us / legacy_us) * 100
+        print(f"{path:<10} {legacy_us:>12.2f} {cached_us:>12.2f} {saved:>7.1f}%")
+
+    print(
+        f"cache hits={verified_token_cache.hits} misses={verified_token_cache.misses}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,32 +1,113 @@
+import logging
+import time
+
 import redis.asyncio as redis
 from fastapi import HTTPException, status
 
 from src.config import Settings
+from src.config.cache import get_redis, pubsub_listener
+from src.user.service.bloom_filter import ExpiringBloomFilter
+from src.user.service.token_cache import token_digest
 
 settings = Settings()
-# Redis 클라이언트 설정
-redis_client = redis.Redis(
-    host="localhost", port=settings.REDIS_PORT, db=0, decode_responses=True
+logger = logging.getLogger(__name__)
+
+# 새 블랙리스트 항목을 모든 워커에 전파하는 pub/sub 채널
+REVOCATION_CHANNEL = "blacklist:revoked"
+
+# 워커별 로컬 필터 (Redis 는 필터에 걸린 경우에만 조회)
+revoked_token_filter = ExpiringBloomFilter(
+    size=settings.REVOCATION_FILTER_SIZE,
+    hash_count=settings.REVOCATION_FILTER_HASHES,
 )
 
 
+def _blacklist_key(digest: bytes) -> str:
+    return f"blacklist:{digest.hex()}"
+
+
 class TokenBlacklist:
     @staticmethod
-    async def add_to_blacklist(token: str, expires_in: int) -> None:
-        """토큰을 블랙리스트에 추가합니다."""
-        await redis_client.setex(f"blacklist:{token}", expires_in, "true")
+    async def add_to_blacklist(token: str, expires_at: int) -> None:
+        """토큰을 만료 시각까지 블랙리스트에 추가하고 다른 워커에 알립니다."""
+        expires_in = expires_at - int(time.time())
+        if expires_in <= 0:
+            return  # 이미 만료된 토큰은 블랙리스트에 올릴 필요 없음
+
+        digest = token_digest(token)
+        revoked_token_filter.add(digest, expires_at)
+
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.setex(_blacklist_key(digest), expires_in, "true")
+            pipe.publish(REVOCATION_CHANNEL, f"{digest.hex()}:{expires_at}")
+            await pipe.execute()
 
     @staticmethod
     async def is_blacklisted(token: str) -> bool:
         """토큰이 블랙리스트에 있는지 확인합니다."""
-        result = await redis_client.exists(f"blacklist:{token}")
+        digest = token_digest(token)
+
+        # 대부분의 요청은 로컬 필터에서 끝남 (네트워크 왕복 없음)
+        # 필터를 아직 채우지 못했거나 구독이 끊긴 동안에는 필터를 믿지 않고 항상 Redis 를 조회
+        if pubsub_listener.ready and not revoked_token_filter.might_contain(digest):
+            return False
+
+        try:
+            result = await get_redis().exists(_blacklist_key(digest))
+        except redis.RedisError as e:
+            # 확인이 불가능하면 거부 (fail closed)
+            logger.error(f"Blacklist lookup failed: {e}")
+            return True
         return bool(result)
 
 
-async def blacklist_token(token: str, expires_in: int = 3600) -> None:
-    print("블랙리스트에 추가")
-    """토큰을 블랙리스트에 추가하는 함수입니다."""
-    await TokenBlacklist.add_to_blacklist(token, expires_in)
+async def warm_up(batch_size: int = 1000) -> int:
+    """(재)구독 직후 Redis 에 남아 있는 블랙리스트 항목으로 로컬 필터를 다시 채웁니다."""
+    count = 0
+    keys: list[str] = []
+    async for key in get_redis().scan_iter(match="blacklist:*", count=batch_size):
+        keys.append(key)
+        if len(keys) >= batch_size:
+            count += await _load(keys)
+            keys = []
+    if keys:
+        count += await _load(keys)
+    logger.info(f"Revocation filter loaded {count} tokens")
+    return count
+
+
+async def _load(keys: list[str]) -> int:
+    now = int(time.time())
+    async with get_redis().pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+
+    count = 0
+    for key, ttl in zip(keys, ttls):
+        try:
+            digest = bytes.fromhex(key.split(":", 1)[1])
+        except ValueError:
+            continue  # 이전 형식(토큰 원문)으로 저장된 키
+        if ttl > 0:
+            revoked_token_filter.add(digest, now + ttl)
+            count += 1
+    return count
+
+
+def apply_revocation(data: str) -> None:
+    """다른 워커에서 전파된 블랙리스트 항목을 로컬 필터에 반영합니다."""
+    digest_hex, expires_at = data.split(":", 1)
+    revoked_token_filter.add(bytes.fromhex(digest_hex), int(expires_at))
+
+
+# 구독이 준비되기 전(pubsub_listener.ready 가 False)에는 필터를 믿지 않고 Redis 를 조회
+pubsub_listener.add_handler(REVOCATION_CHANNEL, apply_revocation, on_subscribe=warm_up)
+
+
+async def blacklist_token(token: str, expires_at: int) -> None:
+    """토큰을 만료 시각(exp)까지 블랙리스트에 추가하는 함수입니다."""
+    await TokenBlacklist.add_to_blacklist(token, expires_at)
 
 
 async def check_blacklist(token: str) -> None:
@@ -42,7 +123,7 @@ async def check_blacklist(token: str) -> None:
 # from .blacklist import blacklist_token, check_blacklist
 
 # 로그아웃 시
-# await blacklist_token(access_token, expires_in=3600)  # 1시간 동안 블랙리스트에 유지
+# await blacklist_token(access_token, expires_at=payload["exp"])  # 토큰 만료 시각까지 유지
 
 # 토큰 검증 시
 # await check_blacklist(access_token)
@@ -33,6 +33,71 @@ class Settings(BaseSettings):
     NCP_BUCKET_NAME: str
     NCP_ENDPOINT_URL: str
 
+    # 워커당 DB 커넥션 풀 설정 (최대 연결 수 = POOL_SIZE + MAX_OVERFLOW)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+
+    # 워커당 공유 Redis 풀 설정 (풀이 가득 차면 POOL_TIMEOUT 초까지 대기)
+    REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 20
+    REDIS_POOL_TIMEOUT: int = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_CONNECT_TIMEOUT: float = 5.0
+
+    # 워커당 공유 스토리지(NCP Object Storage) 클라이언트의 연결 풀 크기 / 타임아웃(초) / 재시도 횟수
+    STORAGE_MAX_POOL_CONNECTIONS: int = 20
+    STORAGE_CONNECT_TIMEOUT: float = 5.0
+    STORAGE_READ_TIMEOUT: float = 30.0
+    STORAGE_MAX_ATTEMPTS: int = 3
+    # 동시에 진행하는 업로드/삭제 수 상한, 멀티파트 기준/조각 크기(바이트)와 파일당 병렬 조각 수
+    STORAGE_MAX_CONCURRENCY: int = 5
+    STORAGE_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024
+    STORAGE_MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024
+    STORAGE_MULTIPART_CONCURRENCY: int = 4
+    # 업로드할 수 있는 이미지 최대 크기(바이트)
+    UPLOAD_MAX_SIZE: int = 10 * 1024 * 1024
+    # presigned 업로드 URL 유효 시간(초)
+    UPLOAD_PRESIGN_EXPIRES: int = 600
+    # 발급 후 아직 참조되지 않은 업로드를 정리 작업이 지우기 전에 더 기다리는 시간(초)
+    UPLOAD_PENDING_GRACE: int = 600
+    # 변환 이미지의 긴 변 최대 길이(px) / WebP 품질
+    IMAGE_THUMBNAIL_SIZE: int = 320
+    IMAGE_WEBP_SIZE: int = 1280
+    IMAGE_WEBP_QUALITY: int = 80
+    # 참조가 없는 이미지를 한 트랜잭션에서 삭제할 수 (이미지당 원본+변환 3개 키, delete_objects 는 최대 1000개)
+    IMAGE_PURGE_BATCH_SIZE: int = 300
+    # 보관 기간이 지난 일기를 한 트랜잭션에서 삭제할 행 수
+    EXPIRED_DELETE_BATCH_SIZE: int = 1000
+    # 탈퇴 회원 삭제: 한 번에 가져올 회원 수 / 회원의 일기, 메시지 등을 한 트랜잭션에서 삭제할 행 수
+    ACCOUNT_PURGE_BATCH_SIZE: int = 100
+    ACCOUNT_PURGE_CHUNK_SIZE: int = 1000
+
+    # 기분 통계를 카운터 테이블(user_mood_counts)에서 읽을지 여부 (False 면 GROUP BY 집계)
+    MOOD_STATS_FROM_COUNTERS: bool = True
+
+    # 야간 롤업 복구 작업이 다시 계산하는 최근 일수 (해당 날짜가 속한 달부터)
+    MOOD_ROLLUP_REPAIR_DAYS: int = 62
+
+    # 교환 횟수(friends.ex_diary_cnt) 검증 작업이 한 트랜잭션에서 확인하는 친구 관계 수
+    EX_DIARY_RECONCILE_BATCH_SIZE: int = 1000
+
+    # 검증된 JWT payload 캐시 최대 항목 수 (워커당)
+    TOKEN_CACHE_MAXSIZE: int = 4096
+
+    # 수락된 친구 관계 캐시 최대 항목 수 / 유지 시간(초) (워커당)
+    FRIENDSHIP_CACHE_MAXSIZE: int = 10000
+    FRIENDSHIP_CACHE_TTL: int = 60
+
+    # bcrypt 해싱 프로세스 풀 크기 / 최대 대기 작업 수 (초과 시 503)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # 로그아웃 토큰 필터 셀 수 / 해시 함수 수 (셀당 4 bytes)
+    REVOCATION_FILTER_SIZE: int = 1 << 20
+    REVOCATION_FILTER_HASHES: int = 4
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
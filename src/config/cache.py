@@ -1,13 +1,191 @@
-from redis import Redis
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import redis.asyncio as redis
 
 from src.config import Settings
 
 settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+def redis_url(db: Optional[int] = None) -> str:
+    """Celery broker/backend 등 URL 로 접속하는 곳에서 쓰는 Redis 주소입니다."""
+    return (
+        f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/"
+        f"{settings.REDIS_DB if db is None else db}"
+    )
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """
+    연결 획득 대기 시간과 타임아웃 횟수를 기록하는 BlockingConnectionPool 입니다.
+    풀이 가득 차면 새 연결을 만드는 대신 REDIS_POOL_TIMEOUT 초까지 기다립니다.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+
+    async def get_connection(  # type: ignore
+        self, command_name: str, *keys: Any, **options: Any
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(  # type: ignore
+                command_name, *keys, **options
+            )
+        except redis.ConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                self.timeouts += 1
+            raise
+        # 타임아웃은 따로 세고, 평균 대기 시간은 성공한 획득만으로 계산
+        self.wait_seconds += time.perf_counter() - started
+        self.acquired += 1
+        return connection
+
+    def stats(self) -> dict[str, Any]:
+        in_use = len(self._in_use_connections)
+        idle = len(self._available_connections)
+        return {
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": idle,
+            "created": in_use + idle,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                round(self.wait_seconds / self.acquired * 1000, 3)
+                if self.acquired
+                else 0.0
+            ),
+        }
+
+
+_pool: Optional[InstrumentedConnectionPool] = None
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    워커 전체가 공유하는 비동기 Redis 클라이언트를 반환합니다.
+    풀은 이벤트 루프 안에서 처음 사용할 때 만들어집니다. (asyncio.Condition 이 루프에 묶이므로)
+    """
+    global _pool, _client
+    if _client is None:
+        _pool = InstrumentedConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            # 읽기 타임아웃은 두지 않음 (pub/sub 구독 연결은 오래 대기하므로)
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        _client = redis.Redis(connection_pool=_pool)
+    return _client
+
+
+async def ping_redis() -> bool:
+    try:
+        return bool(await get_redis().ping())
+    except redis.RedisError:
+        return False
+
+
+async def close_redis() -> None:
+    """앱 종료 시 풀의 모든 연결을 닫습니다."""
+    global _pool, _client
+    if _client is not None:
+        await _client.aclose()
+    if _pool is not None:
+        await _pool.disconnect()
+    _pool = None
+    _client = None
+
+
+def redis_pool_stats() -> dict[str, Any]:
+    if _pool is None:
+        return {"max_connections": settings.REDIS_MAX_CONNECTIONS, "created": 0}
+    return _pool.stats()
+
+
+class PubSubListener:
+    """
+    워커마다 Redis pub/sub 연결 하나로 여러 채널을 구독하고 채널별 처리 함수에 메시지를 넘깁니다.
+    (재)구독 직후에는 on_subscribe 로 등록된 함수를 실행해서 끊긴 동안 놓친 상태를 다시 채웁니다.
+    ready 는 구독과 on_subscribe 가 모두 끝난 뒤에만 True 이고, 연결이 끊기면 다시 False 가 됩니다.
+    """
+
+    def __init__(self, retry_interval: float = 5.0) -> None:
+        self.retry_interval = retry_interval
+        self.handlers: dict[str, Callable[[str], None]] = {}
+        self.subscribe_hooks: list[Callable[[], Awaitable[Any]]] = []
+        self.ready = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def add_handler(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_subscribe: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        """채널 메시지 처리 함수를 등록합니다. (start() 전에, 모듈 import 시점에 등록)"""
+        self.handlers[channel] = handler
+        if on_subscribe is not None:
+            self.subscribe_hooks.append(on_subscribe)
+
+    def dispatch(self, message: dict[str, Any]) -> None:
+        handler = self.handlers.get(message["channel"])
+        if handler is None:
+            return
+        try:
+            handler(message["data"])
+        except ValueError:
+            logger.warning(f"Invalid {message['channel']} message: {message}")
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*self.handlers)
+                for hook in self.subscribe_hooks:
+                    await hook()
+                self.ready = True
+
+                async for message in pubsub.listen():
+                    self.dispatch(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.ready = False
+                logger.error(f"Pub/sub listener error: {e}")
+                await asyncio.sleep(self.retry_interval)
+            finally:
+                self.ready = False
+                await pubsub.aclose()  # type: ignore
+
+    def start(self) -> None:
+        if self._task is None and self.handlers:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
 
-redis_client = Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=0,
-    encoding="utf-8",
-    decode_responses=True,
-)
+# 워커 전체가 공유하는 구독 연결 (lifespan 에서 한 번 시작)
+pubsub_listener = PubSubListener()
@@ -1,12 +1,40 @@
 from celery.schedules import crontab
 
+from src.config import Settings
+
+settings = Settings()
+
+# 워커가 시작할 때 불러와서 등록할 작업 모듈 (beat 스케줄의 작업은 모두 여기 있는 모듈에 있어야 함)
+CELERY_IMPORTS = (
+    "src.diary.service.tasks",
+    "src.friend.service.tasks",
+    "src.upload.service.tasks",
+    "src.user.service.tasks",
+)
+
 CELERYBEAT_SCHEDULE = {
     "delete-expired-diaries": {
         "task": "tasks.delete_expired_diaries",
         "schedule": crontab(hour="6", minute="0"),  # 매일 오전 6시에 실행
     },
+    "repair-mood-rollups": {
+        "task": "tasks.repair_mood_rollups",
+        "schedule": crontab(hour="6", minute="10"),  # 매일 오전 6시 10분에 실행
+    },
     "delete-expired-users": {
         "task": "tasks.delete_expired_users",
         "schedule": crontab(hour="6", minute="20"),  # 매일 오전 6시 20분에 실행
     },
+    "reconcile-ex-diary-counts": {
+        "task": "tasks.reconcile_ex_diary_counts",
+        "schedule": crontab(hour="6", minute="30"),  # 매일 오전 6시 30분에 실행
+    },
+    "purge-unused-images": {
+        "task": "tasks.purge_unused_images",
+        "schedule": crontab(hour="6", minute="40"),  # 매일 오전 6시 40분에 실행
+    },
 }
+
+# 워커 프로세스당 Redis 연결 수 상한 (API 의 REDIS_MAX_CONNECTIONS 와 동일하게 맞춤)
+BROKER_POOL_LIMIT = settings.REDIS_MAX_CONNECTIONS
+CELERY_REDIS_MAX_CONNECTIONS = settings.REDIS_MAX_CONNECTIONS
@@ -1,18 +1,76 @@
-from typing import AsyncGenerator
+import time
+from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from src.config import Settings
 
 settings = Settings()
 
-async_engine = create_async_engine(
-    settings.DATABASE_URL,
-    pool_size=10,  # 연결 풀 크기
-    max_overflow=20,  # 최대 추가 연결 수
-    pool_timeout=30,  # 연결 대기 시간
-    pool_recycle=3600,  # 연결 재사용 시간
-)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """연결 획득 대기 시간과 타임아웃 횟수를 기록하는 커넥션 풀입니다."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return entry
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                round(self.wait_seconds / self.checkouts * 1000, 3)
+                if self.checkouts
+                else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+def create_engine_from_settings(url: str = settings.DATABASE_URL) -> AsyncEngine:
+    # 워커당 최대 연결 수 = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,  # 연결 풀 크기
+        max_overflow=settings.DB_MAX_OVERFLOW,  # 최대 추가 연결 수
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # 연결 대기 시간
+        pool_recycle=settings.DB_POOL_RECYCLE,  # 연결 재사용 시간
+        pool_pre_ping=True,  # 끊어진 연결을 꺼내기 전에 확인
+    )
+
+
+# 앱 전체에서 공유하는 단일 엔진
+async_engine = create_engine_from_settings()
 
 AsyncSessionFactory = async_sessionmaker(
     bind=async_engine,
@@ -28,3 +86,10 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
     finally:
         await session.close()  # db에 커넥션 종료
+
+
+def pool_stats() -> dict[str, Any]:
+    pool = async_engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.stats()
+    return {"status": pool.status()}
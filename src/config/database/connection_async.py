@@ -1,15 +1,11 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import Settings
+# 별도 엔진을 만들지 않고 connection.py 의 공유 풀을 사용
+from src.config.database.connection import AsyncSessionFactory, async_engine
 
-settings = Settings()
-
-async_engine = create_async_engine(settings.DATABASE_URL)
-AsyncSessionFactory = async_sessionmaker(
-    bind=async_engine, autocommit=False, autoflush=False, expire_on_commit=False
-)
+__all__ = ["AsyncSessionFactory", "async_engine", "get_db"]
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -1,3 +1,18 @@
+from typing import Any, Callable
+
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+
+def upsert_insert(session: AsyncSession) -> Callable[[Any], Any]:
+    """
+    세션의 DB 에 맞는 insert 를 반환합니다.
+    (PostgreSQL / SQLite 모두 on_conflict_do_update 로 카운터 upsert 가능)
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return postgresql_insert
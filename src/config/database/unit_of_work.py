@@ -0,0 +1,92 @@
+import inspect
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database.connection import get_async_session
+
+# session.info 에 저장하는 키 (unit_of_work 블록 안인지 표시)
+UNIT_OF_WORK = "unit_of_work"
+# session.info 에 저장하는 키 (커밋된 뒤에 실행할 작업 목록)
+AFTER_COMMIT = "after_commit"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Any]) -> None:
+    """
+    트랜잭션이 실제로 커밋된 뒤에 실행할 작업(캐시 무효화 등)을 등록합니다.
+    unit_of_work 블록 안이면 바깥 블록의 커밋 뒤에 실행되고, 롤백되면 버려집니다.
+    """
+    session.info.setdefault(AFTER_COMMIT, []).append(callback)
+
+
+async def when_committed(session: AsyncSession, callback: Callable[[], Any]) -> None:
+    """
+    repository 의 commit() 을 호출한 뒤에 실행할 작업(Celery 작업 등록 등)을 실행합니다.
+    unit_of_work 블록 안이면 바깥 블록이 커밋될 때까지 미루고, 아니면 이미 커밋됐으므로 바로 실행합니다.
+    """
+    if session.info.get(UNIT_OF_WORK):
+        after_commit(session, callback)
+        return
+
+    result = callback()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _run_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop(AFTER_COMMIT, []):
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    블록 안에서 호출한 repository 들의 쓰기를 하나의 트랜잭션으로 묶습니다.
+    repository 의 commit() 은 flush 만 하고, 블록이 정상 종료될 때 한 번만 커밋합니다.
+    예외가 발생하면 전체를 롤백합니다. (중첩된 블록은 바깥 블록을 따름)
+    """
+    if session.info.get(UNIT_OF_WORK):
+        yield session
+        return
+
+    session.info[UNIT_OF_WORK] = True
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        session.info.pop(AFTER_COMMIT, None)
+        await session.rollback()
+        raise
+    finally:
+        session.info.pop(UNIT_OF_WORK, None)
+    await _run_after_commit(session)
+
+
+async def commit(session: AsyncSession) -> None:
+    """repository 용 커밋. unit_of_work 블록 안이면 flush 만 합니다."""
+    if session.info.get(UNIT_OF_WORK):
+        await session.flush()
+        return
+
+    try:
+        await session.commit()
+    except BaseException:
+        session.info.pop(AFTER_COMMIT, None)
+        raise
+    await _run_after_commit(session)
+
+
+async def get_unit_of_work(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncIterator[AsyncSession]:
+    """
+    요청 전체를 하나의 unit_of_work 로 묶는 의존성입니다. (쓰기 라우트에서 사용)
+    get_async_session 은 요청 안에서 캐시되므로, 같은 요청의 repository 들은 이 세션을 공유합니다.
+    라우트가 정상 종료되면 응답을 보내기 전에 한 번만 커밋하고, 예외가 나면 전체를 롤백합니다.
+    """
+    async with unit_of_work(session):
+        yield session
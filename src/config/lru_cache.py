@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ExpiringLRUCache(Generic[K, V]):
+    """
+    항목마다 만료 시각을 가진 LRU 캐시입니다. 워커 프로세스마다 하나씩 존재합니다.
+    maxsize 를 넘으면 가장 오래 사용하지 않은 항목부터 버리고, 만료된 항목은 조회할 때 제거합니다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[K, tuple[float, V]]" = OrderedDict()
+        # 동기 의존성은 스레드풀에서 실행되므로 잠금이 필요
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def now(self) -> float:
+        """만료 시각의 기준 시계 (기본은 유닉스 시간)"""
+        return time.time()
+
+    def lookup(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self.now():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, key: K, value: V, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: Iterable[K]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
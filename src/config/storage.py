@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import IO, Any, Callable, Optional, TypeVar
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, status
+
+from src.config import Settings
+
+settings = Settings()
+
+R = TypeVar("R")
+
+_client: Optional[Any] = None
+# 업로드/삭제를 실행하는 스레드 풀. 워커 수가 곧 동시에 진행되는 스토리지 요청 수의 상한
+_executor: Optional[ThreadPoolExecutor] = None
+# boto3 클라이언트 생성은 스레드 안전하지 않으므로 최초 생성만 잠금
+_lock = Lock()
+
+# 큰 파일은 멀티파트로 나눠 병렬 업로드
+# (STORAGE_MAX_CONCURRENCY * STORAGE_MULTIPART_CONCURRENCY 가 연결 풀 크기를 넘지 않도록 설정)
+transfer_config = TransferConfig(
+    multipart_threshold=settings.STORAGE_MULTIPART_THRESHOLD,
+    multipart_chunksize=settings.STORAGE_MULTIPART_CHUNKSIZE,
+    max_concurrency=settings.STORAGE_MULTIPART_CONCURRENCY,
+)
+
+
+def create_storage_client() -> Any:
+    """NCP Object Storage(S3 호환) 클라이언트를 만듭니다. 연결 풀은 클라이언트마다 하나입니다."""
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.NCP_ACCESS_KEY,
+        aws_secret_access_key=settings.NCP_SECRET_KEY,
+        endpoint_url=settings.NCP_ENDPOINT_URL,
+        config=Config(
+            max_pool_connections=settings.STORAGE_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.STORAGE_CONNECT_TIMEOUT,
+            read_timeout=settings.STORAGE_READ_TIMEOUT,
+            retries={"max_attempts": settings.STORAGE_MAX_ATTEMPTS, "mode": "standard"},
+        ),
+    )
+
+
+def get_storage() -> Any:
+    """
+    워커 전체가 공유하는 스토리지 클라이언트를 반환합니다.
+    앱 시작 시(lifespan) 만들어지며, Celery 작업처럼 lifespan 이 없는 곳에서는 처음 사용할 때 만들어집니다.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = create_storage_client()
+    return _client
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.STORAGE_MAX_CONCURRENCY,
+                    thread_name_prefix="storage",
+                )
+    return _executor
+
+
+def close_storage() -> None:
+    """앱 종료 시 진행 중인 업로드를 마치고 스레드 풀과 클라이언트의 연결 풀을 닫습니다."""
+    global _client, _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+    _executor = None
+    if _client is not None:
+        _client.close()
+    _client = None
+
+
+async def _run(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    # boto3 는 동기 I/O 이므로 스레드 풀에서 실행하고 이벤트 루프는 결과만 기다림
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), partial(func, *args, **kwargs))
+
+
+def public_url(key: str) -> str:
+    return f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/{key}"
+
+
+# 파일 앞부분의 시그니처로 실제 이미지 형식을 판별 (클라이언트가 보낸 Content-Type 은 믿지 않음)
+# 컨테이너 형식은 컨테이너 헤더(RIFF, ftyp)와 브랜드를 모두 확인해야 우연히 일치하는 파일을 걸러냄
+IMAGE_SIGNATURES: list[tuple[tuple[tuple[int, bytes], ...], str]] = [
+    (((0, b"\xff\xd8\xff"),), "image/jpeg"),
+    (((0, b"\x89PNG\r\n\x1a\n"),), "image/png"),
+    (((0, b"GIF87a"),), "image/gif"),
+    (((0, b"GIF89a"),), "image/gif"),
+    (((0, b"RIFF"), (8, b"WEBP")), "image/webp"),
+    (((4, b"ftyp"), (8, b"heic")), "image/heic"),
+    (((4, b"ftyp"), (8, b"heix")), "image/heic"),
+    (((4, b"ftyp"), (8, b"mif1")), "image/heif"),
+]
+
+IMAGE_EXTENSIONS: dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+    "image/heif": ".heif",
+}
+
+
+def image_size(fileobj: IO[bytes]) -> int:
+    """
+    파일 끝으로 seek 해서 크기를 구합니다. 내용을 메모리로 읽지 않습니다.
+    UPLOAD_MAX_SIZE 를 넘으면 413 을 반환합니다.
+    """
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(0)
+    if size > settings.UPLOAD_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"이미지는 {settings.UPLOAD_MAX_SIZE // (1024 * 1024)}MB 이하만 업로드할 수 있습니다.",
+        )
+    return size
+
+
+def sniff_image_type(fileobj: IO[bytes]) -> str:
+    """앞 16바이트로 이미지 형식을 판별합니다. 지원하지 않는 형식이면 415 를 반환합니다."""
+    fileobj.seek(0)
+    head = fileobj.read(16)
+    fileobj.seek(0)
+    content_type = image_type(head)
+    if content_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="지원하지 않는 이미지 형식입니다.",
+        )
+    return content_type
+
+
+def image_type(head: bytes) -> Optional[str]:
+    for parts, content_type in IMAGE_SIGNATURES:
+        if all(
+            head[offset : offset + len(signature)] == signature
+            for offset, signature in parts
+        ):
+            return content_type
+    return None
+
+
+async def file_digest(fileobj: IO[bytes]) -> str:
+    """
+    파일을 조각 단위로 읽으면서 SHA-256 을 계산합니다.
+    파일 전체를 메모리에 올리지 않고, 해시 계산은 스레드 풀에서 합니다.
+    """
+    fileobj.seek(0)
+    digest = await _run(hashlib.file_digest, fileobj, "sha256")
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+
+async def upload_file(
+    fileobj: IO[bytes], key: str, content_type: Optional[str] = None
+) -> str:
+    """
+    파일을 공개 읽기 권한으로 업로드하고 공개 URL 을 반환합니다.
+    파일은 통째로 읽지 않고 멀티파트 조각 단위로 스트리밍하므로 업로드당 메모리는 사진 크기와 무관합니다.
+    """
+    extra_args = {"ACL": "public-read"}
+    if content_type:
+        extra_args["ContentType"] = content_type
+    await _run(
+        get_storage().upload_fileobj,
+        fileobj,
+        settings.NCP_BUCKET_NAME,
+        key,
+        ExtraArgs=extra_args,
+        Config=transfer_config,
+    )
+    return public_url(key)
+
+
+# 원본 옆에 저장하는 변환 이미지 (원본 키의 확장자를 바꾼 키)
+IMAGE_VARIANTS = ("thumb", "display")
+
+
+def variant_key(key: str, variant: str) -> str:
+    return f"{os.path.splitext(key)[0]}.{variant}.webp"
+
+
+def with_variants(key: str) -> list[str]:
+    """원본과 변환 이미지의 객체 키 목록."""
+    return [key, *(variant_key(key, variant) for variant in IMAGE_VARIANTS)]
+
+
+# delete_objects 한 번에 지울 수 있는 최대 키 수
+DELETE_BATCH_SIZE = 1000
+
+
+async def delete_images(keys: list[str]) -> None:
+    """
+    이미지들의 원본과 변환 이미지를 delete_objects 로 묶어서 삭제합니다.
+    요청 한 번에 최대 DELETE_BATCH_SIZE 개의 키를 지웁니다.
+    """
+    objects = [{"Key": k} for key in keys for k in with_variants(key)]
+    for start in range(0, len(objects), DELETE_BATCH_SIZE):
+        await _run(
+            get_storage().delete_objects,
+            Bucket=settings.NCP_BUCKET_NAME,
+            Delete={
+                "Objects": objects[start : start + DELETE_BATCH_SIZE],
+                "Quiet": True,
+            },
+        )
+
+
+async def delete_key(key: str) -> None:
+    await _run(get_storage().delete_object, Bucket=settings.NCP_BUCKET_NAME, Key=key)
+
+
+def presigned_post(key: str, content_type: str) -> dict[str, Any]:
+    """
+    클라이언트가 API 서버를 거치지 않고 스토리지에 바로 올릴 수 있는 presigned POST 를 만듭니다.
+    키, Content-Type, 공개 읽기 권한, 최대 크기(UPLOAD_MAX_SIZE)가 서명된 정책에 고정됩니다.
+    서명은 로컬에서 계산하므로 스토리지 요청이 없습니다.
+    """
+    return get_storage().generate_presigned_post(  # type: ignore
+        Bucket=settings.NCP_BUCKET_NAME,
+        Key=key,
+        Fields={"acl": "public-read", "Content-Type": content_type},
+        Conditions=[
+            {"acl": "public-read"},
+            {"Content-Type": content_type},
+            ["content-length-range", 1, settings.UPLOAD_MAX_SIZE],
+        ],
+        ExpiresIn=settings.UPLOAD_PRESIGN_EXPIRES,
+    )
+
+
+async def read_file(key: str) -> bytes:
+    """객체 전체를 읽습니다. (UPLOAD_MAX_SIZE 이하로 올라온 이미지 처리용)"""
+    response = await _run(
+        get_storage().get_object, Bucket=settings.NCP_BUCKET_NAME, Key=key
+    )
+    body = response["Body"]
+    try:
+        return await _run(body.read)
+    finally:
+        body.close()
+
+
+async def read_head(key: str, length: int = 16) -> Optional[tuple[int, bytes]]:
+    """
+    객체의 전체 크기와 앞 length 바이트를 Range 요청 한 번으로 읽습니다.
+    객체가 없으면(아직 업로드되지 않았으면) None 을 반환합니다.
+    """
+    try:
+        response = await _run(
+            get_storage().get_object,
+            Bucket=settings.NCP_BUCKET_NAME,
+            Key=key,
+            Range=f"bytes=0-{length - 1}",
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404", "InvalidRange"):
+            return None
+        raise
+
+    body = response["Body"]
+    try:
+        head = await _run(body.read)
+    finally:
+        body.close()
+    # "bytes 0-15/12345" 에서 전체 크기
+    content_range = response.get("ContentRange")
+    size = int(content_range.rsplit("/", 1)[1]) if content_range else len(head)
+    return size, head
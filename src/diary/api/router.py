@@ -1,10 +1,8 @@
 import logging
-import os
-import uuid
 from datetime import date, datetime
-from typing import Dict, Optional, Union
+from functools import partial
+from typing import Dict, Literal, Optional, Union
 
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import (
     APIRouter,
@@ -20,16 +18,27 @@ from fastapi import (
 from fastapi_pagination import Page, Params
 
 from src.config import Settings
+from src.config.database.unit_of_work import get_unit_of_work, when_committed
+from src.config.storage import image_size, public_url, sniff_image_type
 from src.diary.models import Diary, MoodEnum, WeatherEnum
 from src.diary.repository import DiaryRepository
 from src.diary.schema.response import (
     DiaryAnalysisResponse,
     DiaryBriefResponse,
+    DiaryCalendarDay,
+    DiaryCalendarResponse,
+    DiaryCursorPage,
     DiaryDetailResponse,
     DiaryListResponse,
     MoodStatisticsResponse,
+    MoodTrendPoint,
+    MoodTrendResponse,
 )
 from src.diary.service.AIAnalysis import analyze_diary_entry
+from src.diary.service.rollup import ROLLUP_SOURCES, RollupPeriod
+from src.upload.service.blobs import store_image
+from src.upload.service.tasks import enqueue_process_image
+from src.upload.service.uploads import claim_uploaded_image
 from src.user.schema.response import BasicResponse
 from src.user.service.authentication import authenticate
 
@@ -44,6 +53,7 @@ logger = logging.getLogger(__name__)
     summary="일기 작성",
     response_model=BasicResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def write_diary(
     user_id: int = Depends(authenticate),
@@ -53,39 +63,29 @@ async def write_diary(
     mood: MoodEnum = Form(...),
     content: str = Form(...),
     image: Union[UploadFile, str] = File(default=None),
+    image_key: Optional[str] = Form(
+        default=None, description="/uploads/presign 으로 업로드한 이미지 키"
+    ),
     diary_repo: DiaryRepository = Depends(),
 ) -> BasicResponse:
-    # S3 클라이언트 설정
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-
-    img_url: Optional[str] = None
+    img_key: Optional[str] = None
 
-    # 이미지 업로드 처리
-    if image and image.filename:  # type: ignore
+    # 이미지 처리: presigned POST 로 스토리지에 직접 올린 이미지 키를 우선 사용
+    if image_key:
         try:
-            # 파일 포인터 초기화
-            image.file.seek(0)  # type: ignore
-
-            # 파일 크기 확인
-            file_size = len(image.file.read())  # type: ignore
-            # 다시 포인터 초기화
-            image.file.seek(0)  # type: ignore
-
-            # print(f"File details:")
-            # print(f"Filename: {image.filename}")
-            # print(f"File size: {file_size} bytes")
-            # print(f"Content type: {image.content_type}")
+            img_key = await claim_uploaded_image(
+                diary_repo.session, "diary", user_id, image_key
+            )
+        except ClientError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"S3 업로드 오류: {str(e)}",
+            )
+    # (이전 방식) multipart 로 받은 이미지를 서버에서 업로드
+    elif image and image.filename:  # type: ignore
+        try:
+            # 파일 크기 확인 (내용을 읽지 않고 seek/tell 로 확인, 최대 크기 초과 시 413)
+            file_size = image_size(image.file)  # type: ignore
 
             if file_size == 0:
                 print("Warning: Empty file received")
@@ -94,28 +94,14 @@ async def write_diary(
                     status="warning",
                 )
 
-            # 고유한 파일명 생성
-            image_filename = f"diary_{user_id}_{uuid.uuid4()}{os.path.splitext(image.filename)[1]}"  # type: ignore
-
-            # S3에 업로드
-            s3_key = f"diaries/{image_filename}"
-            # s3_client.upload_fileobj(
-            #     image.file,  # type: ignore
-            #     settings.S3_BUCKET_NAME,
-            #     s3_key,
-            #     ExtraArgs={"ContentType": image.content_type},  # type: ignore
-            # )
-            s3_client.upload_fileobj(
+            # 실제 이미지 형식 확인 후 내용 해시 키로 저장 (같은 이미지는 다시 올리지 않음)
+            # 참조 수는 일기 저장과 같은 트랜잭션에서 커밋
+            img_key = await store_image(
+                diary_repo.session,
                 image.file,  # type: ignore
-                settings.NCP_BUCKET_NAME,
-                s3_key,
-                ExtraArgs={"ACL": "public-read"},
+                sniff_image_type(image.file),  # type: ignore
             )
 
-            # 공개 URL 생성
-            # img_url = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            img_url = f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/{s3_key}"
-
         except ClientError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -133,7 +119,8 @@ async def write_diary(
         weather=weather,
         mood=mood,
         content=content,
-        img_url=img_url or "",
+        img_url=public_url(img_key) if img_key else "",
+        img_key=img_key,
     )
 
     try:
@@ -141,6 +128,13 @@ async def write_diary(
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    # 썸네일/WebP 변환은 Celery 워커에서 처리 (워커가 일기를 찾을 수 있도록 커밋된 뒤에 등록)
+    if img_key:
+        await when_committed(
+            diary_repo.session,
+            partial(enqueue_process_image, "diary", new_diary.id),  # type: ignore
+        )
+
     return BasicResponse(
         message="일기가 성공적으로 생성되었습니다.",
         status="success",
@@ -157,8 +151,8 @@ async def diary_list(
     user_id: int = Depends(authenticate),
     params: Params = Depends(),
     word: Optional[str] = Query(None, description="검색 키워드"),
-    year: Optional[int] = Query(None, description="검색 연도"),
-    month: Optional[int] = Query(None, description="검색 월"),
+    year: Optional[int] = Query(None, ge=1900, le=2100, description="검색 연도"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="검색 월"),
     diary_repo: DiaryRepository = Depends(),
 ) -> Page[DiaryBriefResponse]:
     diaries = await diary_repo.get_diary_list(
@@ -174,10 +168,62 @@ async def diary_list(
             },
         )
 
-    return diaries  # type: ignore
+    return diaries
     # return DiaryListResponse.build(diaries=list(diaries))
 
 
+@router.get(
+    path="/scroll",
+    summary="일기 목록 커서 기반 조회 (무한 스크롤)",
+    status_code=status.HTTP_200_OK,
+    response_model=DiaryCursorPage,
+)
+async def diary_list_by_cursor(
+    user_id: int = Depends(authenticate),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    word: Optional[str] = Query(None, description="검색 키워드"),
+    year: Optional[int] = Query(None, ge=1900, le=2100, description="검색 연도"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="검색 월"),
+    include_total: bool = Query(False, description="전체 개수 포함 여부"),
+    diary_repo: DiaryRepository = Depends(),
+) -> DiaryCursorPage:
+    return await diary_repo.get_diary_list_by_cursor(
+        user_id,
+        cursor=cursor,
+        size=size,
+        word=word,
+        year=year,
+        month=month,
+        include_total=include_total,
+    )
+
+
+@router.get(
+    path="/calendar",
+    summary="월별 달력 (날짜별 일기 수, 대표 기분)",
+    status_code=status.HTTP_200_OK,
+    response_model=DiaryCalendarResponse,
+)
+async def diary_calendar(
+    user_id: int = Depends(authenticate),
+    year: int = Query(..., ge=1900, le=2100, description="연도"),
+    month: int = Query(..., ge=1, le=12, description="월"),
+    diary_repo: DiaryRepository = Depends(),
+) -> DiaryCalendarResponse:
+    rows = await diary_repo.get_calendar(user_id, year, month)
+    return DiaryCalendarResponse(
+        year=year,
+        month=month,
+        days=[
+            DiaryCalendarDay(
+                write_date=row.write_date, count=row.diary_count, mood=row.mood
+            )
+            for row in rows
+        ],
+    )
+
+
 @router.get(
     path="/deleted",
     summary="삭제된 일기(7일 이내) 확인",
@@ -217,20 +263,59 @@ async def get_mood_statistics(
     사용자가 작성한 일기들에서 기분별 개수를 반환합니다.
     """
     try:
-        # 사용자의 모든 일기를 가져오기
-        user_diaries = await diary_repo.get_all_by_user(user_id)
-
-        # 기분별 개수 집계
-        mood_stats = {mood: 0 for mood in MoodEnum}
-        for diary in user_diaries:
-            mood_stats[diary.mood] += 1
+        # 카운터 테이블 기본키 조회 (비활성화 시 GROUP BY 집계)
+        if settings.MOOD_STATS_FROM_COUNTERS:
+            counts = await diary_repo.get_mood_counts(user_id)
+        else:
+            counts = await diary_repo.count_moods(user_id)
 
+        mood_stats = {mood: counts.get(mood, 0) for mood in MoodEnum}
         return MoodStatisticsResponse.build(mood_stats=mood_stats)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 계산 중 오류 발생: {str(e)}")
 
 
+@router.get(
+    path="/mood-trends",
+    summary="기간별(주/월) 기분 추이 조회",
+    response_model=MoodTrendResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_mood_trends(
+    start: date = Query(..., description="조회 시작일"),
+    end: date = Query(..., description="조회 종료일"),
+    period: RollupPeriod = Query("week", description="집계 단위 (week / month)"),
+    source: Literal["diary", "ex_diary", "all"] = Query(
+        "all", description="일기 / 교환일기 / 전체"
+    ),
+    user_id: int = Depends(authenticate),
+    diary_repo: DiaryRepository = Depends(),
+) -> MoodTrendResponse:
+    if start > end or (end - start).days > 366 * 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회 기간은 시작일부터 최대 2년까지 가능합니다.",
+        )
+
+    trends = await diary_repo.get_mood_trends(
+        user_id,
+        period,
+        start,
+        end,
+        sources=ROLLUP_SOURCES if source == "all" else (source,),
+    )
+    return MoodTrendResponse(
+        period=period,
+        start=start,
+        end=end,
+        points=[
+            MoodTrendPoint.from_counts(period_start, mood_stats)
+            for period_start, mood_stats in trends.items()
+        ],
+    )
+
+
 @router.get(
     path="/{diary_id}",
     summary="선택한 일기(1개) 조회",
@@ -241,7 +326,7 @@ async def diary_detail(
     diary_id: int = Path(..., description="조회할 일기의 고유 식별자"),
     user_id: int = Depends(authenticate),
     diary_repo: DiaryRepository = Depends(),
-) -> Diary:
+) -> DiaryDetailResponse:
 
     if not (diary := await diary_repo.get_diary_detail(diary_id=diary_id)):
         raise HTTPException(
@@ -255,13 +340,14 @@ async def diary_detail(
             detail="You can only access your own diary entries.",
         )
 
-    return DiaryDetailResponse.model_validate(diary)  # type: ignore
+    return DiaryDetailResponse.build(diary)
 
 
 @router.delete(
     path="/{diary_id}",
     summary="선택한 일기 삭제",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def delete_diary(
     diary_id: int,
@@ -285,12 +371,16 @@ async def delete_diary(
     # return BasicResponse(message="Diary entry successfully deleted.", status="success")
 
 
-@router.patch("/{diary_id}/restore", response_model=DiaryDetailResponse)
+@router.patch(
+    "/{diary_id}/restore",
+    response_model=DiaryDetailResponse,
+    dependencies=[Depends(get_unit_of_work)],
+)
 async def restore_diary(
     diary_id: int,
     user_id: int = Depends(authenticate),
     diary_repo: DiaryRepository = Depends(),
-) -> Diary:
+) -> DiaryDetailResponse:
     restored_diary = await diary_repo.restore_diary(diary_id=diary_id, user_id=user_id)
 
     if not restored_diary:
@@ -299,7 +389,7 @@ async def restore_diary(
             detail="Diary not found or cannot be restored",
         )
 
-    return DiaryDetailResponse.model_validate(restored_diary)  # type: ignore
+    return DiaryDetailResponse.build(restored_diary)
 
 
 @router.post(
@@ -1,9 +1,27 @@
 from datetime import datetime
 from enum import Enum as PyEnum
+from typing import Any, Optional
 
-from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    case,
+    event,
+    func,
+    literal_column,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.sql.elements import ColumnClause, ColumnElement
 
 from src.config.database.orm import Base
 
@@ -24,6 +42,20 @@ class MoodEnum(str, PyEnum):
     sad = "슬픔"
 
 
+# 검색용 텍스트 검색 설정 (한국어 형태소 사전이 없으므로 공백 단위 토큰 + 접두어 검색)
+SEARCH_CONFIG: ColumnClause[Any] = literal_column("'simple'::regconfig")
+
+
+def search_document(title: Any, content: Any) -> ColumnElement[Any]:
+    """
+    제목과 본문을 합친 tsvector 식입니다.
+    GIN 인덱스와 검색 쿼리가 같은 식을 써야 인덱스를 탈 수 있으므로 한 곳에서 만듭니다.
+    """
+    return func.to_tsvector(
+        SEARCH_CONFIG, title.op("||")(literal_column("' '")).op("||")(content)
+    )
+
+
 class Diary(Base):
     __tablename__ = "diaries"
 
@@ -36,9 +68,41 @@ class Diary(Base):
     mood: Mapped[MoodEnum] = Column(Enum(MoodEnum), nullable=False)
     content = Column(Text, nullable=False)
     img_url = Column(String(255), nullable=True)
+    # 스토리지 객체 키 (URL 을 파싱하지 않고 삭제/변환에 사용)
+    img_key = Column(String(255), nullable=True)
+    # 백그라운드 작업이 만든 변환 이미지 키 (만들어지기 전에는 원본 사용)
+    img_thumbnail_key = Column(String(255), nullable=True)
+    img_webp_key = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.now)
     deleted_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # 일기 목록 (삭제되지 않은 일기만, 최신순)
+        Index(
+            "ix_diaries_user_id_created_at",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # 연/월 검색 (write_date 기준 정렬)
+        Index(
+            "ix_diaries_user_id_write_date",
+            "user_id",
+            "write_date",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # 제목/본문 전문 검색 (SQLite 는 아래 FTS5 테이블 사용)
+        Index(
+            "ix_diaries_search",
+            search_document(title, content),
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
     async def soft_delete(self, session: AsyncSession) -> None:
         self.deleted_at = datetime.now()
         await session.commit()
@@ -57,6 +121,7 @@ class Diary(Base):
         mood: MoodEnum,
         content: str,
         img_url: str,
+        img_key: Optional[str] = None,
     ) -> "Diary":
         return cls(
             user_id=user_id,
@@ -66,4 +131,74 @@ class Diary(Base):
             mood=mood,
             content=content,
             img_url=img_url,
+            img_key=img_key,
         )
+
+
+class UserMoodCount(Base):
+    """
+    사용자별 기분 개수 (삭제되지 않은 일기 기준).
+    일기 작성/삭제/복구와 같은 트랜잭션에서 갱신되어 기분 통계를 기본키 조회로 제공합니다.
+    """
+
+    __tablename__ = "user_mood_counts"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    mood: Mapped[MoodEnum] = Column(Enum(MoodEnum), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class MoodRollup(Base):
+    """
+    사용자별 주간/월간 기분 개수 (일기, 교환일기 각각).
+    작성/삭제 시 증분 갱신되고 매일 밤 Celery 작업이 최근 기간을 다시 계산합니다.
+    """
+
+    __tablename__ = "mood_rollups"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    source = Column(String(16), primary_key=True)  # diary / ex_diary
+    period = Column(String(8), primary_key=True)  # week / month
+    period_start = Column(Date, primary_key=True)  # 주 시작(월요일) 또는 월 1일
+    mood: Mapped[MoodEnum] = Column(Enum(MoodEnum), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+def mood_sort_key() -> ColumnElement[int]:
+    """DB 종류와 상관없이 MoodEnum 정의 순서로 정렬하기 위한 식입니다."""
+    return case(*[(Diary.mood == mood, i) for i, mood in enumerate(MoodEnum)])
+
+
+# SQLite(테스트 환경) 전문 검색용 FTS5 external content 테이블과 동기화 트리거
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS diaries_fts USING fts5("
+    "title, content, content='diaries', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS diaries_fts_ai AFTER INSERT ON diaries BEGIN "
+    "INSERT INTO diaries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS diaries_fts_ad AFTER DELETE ON diaries BEGIN "
+    "INSERT INTO diaries_fts(diaries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS diaries_fts_au AFTER UPDATE ON diaries BEGIN "
+    "INSERT INTO diaries_fts(diaries_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO diaries_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+]
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(
+        Diary.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),  # type: ignore
+    )
+
+event.listen(
+    Diary.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS diaries_fts").execute_if(dialect="sqlite"),  # type: ignore
+)
@@ -1,13 +1,27 @@
-from typing import Optional, Sequence
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
 
 from fastapi import Depends
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import extract, or_, select
+from sqlalchemy import Row, Select, extract, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database.connection import get_async_session
-from src.diary.models import Diary
+from src.config.database.orm import upsert_insert
+from src.config.database.unit_of_work import commit
+from src.diary.models import Diary, MoodEnum, MoodRollup, UserMoodCount, mood_sort_key
+from src.diary.schema.response import DiaryBriefResponse, DiaryCursorPage
+from src.diary.service.cursor import decode_cursor, encode_cursor
+from src.diary.service.period import date_range
+from src.diary.service.rollup import (
+    RollupPeriod,
+    RollupSource,
+    add_to_rollups,
+    period_start,
+    period_starts,
+)
+from src.diary.service.search import get_diary_search, search_terms
 
 
 class DiaryRepository:
@@ -16,7 +30,31 @@ class DiaryRepository:
 
     async def save(self, diary: Diary) -> None:
         self.session.add(diary)
-        await self.session.commit()
+        # 기분 카운터/롤업도 같은 트랜잭션에서 갱신
+        await self._record_mood(diary, 1)
+        await commit(self.session)
+
+    async def _record_mood(self, diary: Diary, delta: int) -> None:
+        await self._add_mood_count(diary.user_id, diary.mood, delta)  # type: ignore
+        await add_to_rollups(
+            self.session,
+            diary.user_id,  # type: ignore
+            "diary",
+            diary.write_date,  # type: ignore
+            diary.mood,
+            delta,
+        )
+
+    async def _add_mood_count(self, user_id: int, mood: MoodEnum, delta: int) -> None:
+        insert = upsert_insert(self.session)
+        await self.session.execute(
+            insert(UserMoodCount)
+            .values(user_id=user_id, mood=mood, count=max(delta, 0))
+            .on_conflict_do_update(
+                index_elements=[UserMoodCount.user_id, UserMoodCount.mood],
+                set_={"count": UserMoodCount.count + delta},
+            )
+        )
 
     # async def get_diary_list(self, user_id: int) -> Sequence[Diary] | None:
     #     query = (
@@ -39,34 +77,46 @@ class DiaryRepository:
     #     )
     #
     #     return await paginate(self.session, query)  # type: ignore
-    async def get_diary_list(
+    def _diary_list_query(
         self,
         user_id: int,
-        params: Params = Depends(),
         word: Optional[str] = None,
         year: Optional[int] = None,
         month: Optional[int] = None,
-    ) -> Page[Diary]:
+        rank: bool = True,
+    ) -> Select[Any]:
         query = (
             select(Diary)
             .where(Diary.user_id == user_id)
             .where(Diary.deleted_at.is_(None))
         )
 
-        # 키워드 검색 (제목, 내용)
-        if word:
-            query = query.where(
-                or_(Diary.title.ilike(f"%{word}%"), Diary.content.ilike(f"%{word}%"))
-            )
+        # 키워드 검색 (제목, 내용) - 전문 검색 인덱스 사용, 관련도 순 정렬 후 아래 정렬 적용
+        terms = search_terms(word) if word else []
+        if terms:
+            query = get_diary_search(self.session).apply(query, terms, rank=rank)
 
-        # 연도 검색
+        # 연도(+월) 검색은 반열린 날짜 구간으로 비교 (write_date 인덱스 사용)
         if year:
-            query = query.where(extract("year", Diary.write_date) == year)
+            start, end = date_range(year, month)
+            query = query.where(Diary.write_date >= start, Diary.write_date < end)
 
-        # 월 검색
-        if month:
+        # 연도 없이 월만 검색하는 경우는 구간으로 바꿀 수 없으므로 기존 방식 유지
+        elif month:
             query = query.where(extract("month", Diary.write_date) == month)
 
+        return query
+
+    async def get_diary_list(
+        self,
+        user_id: int,
+        params: Params = Depends(),
+        word: Optional[str] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> Page[DiaryBriefResponse]:
+        query = self._diary_list_query(user_id, word=word, year=year, month=month)
+
         # 정렬 조건 변경
         if year or month:
             # 연도나 월로 검색 시 write_date 기준 내림차순 정렬
@@ -75,7 +125,112 @@ class DiaryRepository:
             # 기본적으로는 created_at 기준 내림차순 정렬
             query = query.order_by(Diary.created_at.desc())
 
-        return await paginate(self.session, query)  # type: ignore
+        return await paginate(  # type: ignore
+            self.session, query, transformer=self._to_brief_responses
+        )
+
+    async def get_diary_list_by_cursor(
+        self,
+        user_id: int,
+        cursor: Optional[str] = None,
+        size: int = 20,
+        word: Optional[str] = None,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        include_total: bool = False,
+    ) -> DiaryCursorPage:
+        """
+        (정렬 값, id) 기준 keyset 페이지네이션입니다.
+        OFFSET 없이 인덱스 범위 스캔 한 번으로 다음 페이지를 가져오며,
+        include_total=False 면 COUNT 쿼리도 실행하지 않습니다.
+        검색 시에도 관련도 대신 정렬 키 순서로 반환합니다.
+        """
+        query = self._diary_list_query(
+            user_id, word=word, year=year, month=month, rank=False
+        )
+
+        # 연도나 월로 검색 시 write_date, 기본은 created_at 기준 (동률은 id 로 구분)
+        sort_key = "write_date" if year or month else "created_at"
+        sort_column = Diary.write_date if sort_key == "write_date" else Diary.created_at
+
+        total = None
+        if include_total:
+            # snippet 등 추가 컬럼은 개수에 필요 없으므로 id 만 남김
+            total = await self.session.scalar(
+                select(func.count()).select_from(
+                    query.with_only_columns(Diary.id).subquery()
+                )
+            )
+
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_key)
+            query = query.where(tuple_(sort_column, Diary.id) < (value, last_id))
+
+        # 다음 페이지 존재 여부를 알기 위해 1개 더 조회
+        query = query.order_by(sort_column.desc(), Diary.id.desc()).limit(size + 1)
+        rows = list((await self.session.execute(query)).all())
+
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            last = rows[-1][0]
+            next_cursor = encode_cursor(sort_key, getattr(last, sort_key), last.id)
+
+        return DiaryCursorPage(
+            items=self._to_brief_responses(
+                [row if len(row) > 1 else row[0] for row in rows]
+            ),
+            next_cursor=next_cursor,
+            total=total,
+        )
+
+    @staticmethod
+    def _to_brief_responses(items: Sequence[Any]) -> list[DiaryBriefResponse]:
+        # 검색 시에는 (Diary, snippet) 행, 아니면 Diary 객체
+        return [
+            (
+                DiaryBriefResponse.build(item[0], snippet=item[1])
+                if isinstance(item, Row)
+                else DiaryBriefResponse.build(item)
+            )
+            for item in items
+        ]
+
+    async def get_calendar(
+        self, user_id: int, year: int, month: int
+    ) -> Sequence[Row[Any]]:
+        """
+        해당 월의 날짜별 일기 수와 가장 많이 기록한 기분을 한 번의 쿼리로 조회합니다.
+        기분 개수가 같으면 MoodEnum 정의 순서가 앞선 기분을 사용합니다.
+        """
+        start, end = date_range(year, month)
+        mood_count = func.count(Diary.id)
+        per_mood = (
+            select(
+                Diary.write_date,
+                Diary.mood,
+                func.sum(mood_count)
+                .over(partition_by=Diary.write_date)
+                .label("diary_count"),
+                func.row_number()
+                .over(
+                    partition_by=Diary.write_date,
+                    order_by=(mood_count.desc(), mood_sort_key()),
+                )
+                .label("mood_rank"),
+            )
+            .where(Diary.user_id == user_id)
+            .where(Diary.deleted_at.is_(None))
+            .where(Diary.write_date >= start, Diary.write_date < end)
+            .group_by(Diary.write_date, Diary.mood)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(per_mood.c.write_date, per_mood.c.diary_count, per_mood.c.mood)
+            .where(per_mood.c.mood_rank == 1)
+            .order_by(per_mood.c.write_date)
+        )
+        return result.all()
 
     async def get_deleted_diary_list(self, user_id: int) -> Sequence[Diary] | None:
         query = (
@@ -98,23 +253,81 @@ class DiaryRepository:
         return diary
 
     async def delete(self, diary: Diary) -> None:
-        await diary.soft_delete(self.session)
+        # 삭제되지 않은 일기일 때만 삭제 표시하고 카운터를 줄임 (확인과 변경을 UPDATE 한 번으로)
+        # 같은 일기를 동시에 삭제해도 한 요청만 행을 돌려받으므로 카운터는 한 번만 줄어듦
+        deleted = await self.session.scalar(
+            update(Diary)
+            .where(Diary.id == diary.id, Diary.deleted_at.is_(None))
+            .values(deleted_at=datetime.now())
+            .returning(Diary)
+        )
+        if deleted is not None:
+            await self._record_mood(deleted, -1)
+        await commit(self.session)
 
     async def restore_diary(self, diary_id: int, user_id: int) -> Diary | None:
-        query = (
-            select(Diary)
+        # 삭제된 일기일 때만 복구하고 카운터를 늘림 (삭제와 같은 이유로 조건부 UPDATE)
+        diary = await self.session.scalar(
+            update(Diary)
             .where(Diary.id == diary_id)
             .where(Diary.user_id == user_id)  # 사용자 검증 추가
             .where(Diary.deleted_at.is_not(None))  # 삭제된 일기만 복구 가능
+            .values(deleted_at=None)
+            .returning(Diary)
         )
-        result = await self.session.execute(query)
-        diary = result.scalars().first()
 
         if diary:
-            await diary.restore(self.session)
+            await self._record_mood(diary, 1)
+            await commit(self.session)
             return diary
         return None
 
+    async def count_moods(self, user_id: int) -> dict[MoodEnum, int]:
+        """삭제되지 않은 일기의 기분별 개수를 GROUP BY 로 집계합니다."""
+        result = await self.session.execute(
+            select(Diary.mood, func.count())
+            .where(Diary.user_id == user_id, Diary.deleted_at.is_(None))
+            .group_by(Diary.mood)
+        )
+        return {mood: count for mood, count in result.all()}
+
+    async def get_mood_counts(self, user_id: int) -> dict[MoodEnum, int]:
+        """작성/삭제/복구 시 갱신되는 카운터 테이블에서 기분별 개수를 읽습니다."""
+        result = await self.session.execute(
+            select(UserMoodCount.mood, UserMoodCount.count).where(
+                UserMoodCount.user_id == user_id
+            )
+        )
+        return {mood: count for mood, count in result.all()}
+
+    async def get_mood_trends(
+        self,
+        user_id: int,
+        period: RollupPeriod,
+        start: date,
+        end: date,
+        sources: Sequence[RollupSource],
+    ) -> dict[date, dict[MoodEnum, int]]:
+        """롤업 테이블에서 기간별 기분 개수를 읽습니다. (start, end 를 포함하는 기간 전체)"""
+        result = await self.session.execute(
+            select(MoodRollup.period_start, MoodRollup.mood, func.sum(MoodRollup.count))
+            .where(
+                MoodRollup.user_id == user_id,
+                MoodRollup.source.in_(sources),
+                MoodRollup.period == period,
+                MoodRollup.period_start >= period_start(period, start),
+                MoodRollup.period_start <= end,
+            )
+            .group_by(MoodRollup.period_start, MoodRollup.mood)
+        )
+        trends: dict[date, dict[MoodEnum, int]] = {
+            start_date: {mood: 0 for mood in MoodEnum}
+            for start_date in period_starts(period, start, end)
+        }
+        for start_date, mood, count in result.all():
+            trends[start_date][mood] = int(count)
+        return trends
+
     async def get_all_by_user(self, user_id: int) -> Sequence[Diary]:
         """
         특정 사용자가 작성한 모든 일기를 반환합니다.
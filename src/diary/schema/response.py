@@ -1,8 +1,9 @@
 from datetime import date
-from typing import Dict
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 
+from src.config.storage import public_url
 from src.diary.models import Diary, MoodEnum
 
 
@@ -11,17 +12,31 @@ class DiaryBriefResponse(BaseModel):
     title: str
     write_date: date
     content: str
+    snippet: Optional[str] = None  # 검색 시 검색어가 강조된 본문 일부
+    thumbnail_url: Optional[str] = None  # 썸네일 (아직 만들어지지 않았으면 원본)
 
     @classmethod
-    def build(cls, diary: Diary) -> "DiaryBriefResponse":
+    def build(cls, diary: Diary, snippet: Optional[str] = None) -> "DiaryBriefResponse":
         return cls(
             id=diary.id or 0,
             title=diary.title or "",
             write_date=diary.write_date or date.today(),
             content=diary.content or "",
+            snippet=snippet,
+            thumbnail_url=(
+                public_url(diary.img_thumbnail_key)
+                if diary.img_thumbnail_key
+                else diary.img_url or None
+            ),
         )
 
 
+class DiaryCursorPage(BaseModel):
+    items: list[DiaryBriefResponse]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
+    total: Optional[int] = None  # include_total=true 인 경우에만 계산
+
+
 class DiaryListResponse(BaseModel):
     diaries: list[DiaryBriefResponse]
 
@@ -37,11 +52,33 @@ class DiaryDetailResponse(BaseModel):
     weather: str
     mood: str
     content: str
+    # EXIF(위치 정보 등)를 지운 화면용 WebP, 아직 만들어지지 않았으면 원본
     img_url: str
+    webp_url: Optional[str] = None  # 화면 크기로 줄인 WebP (만들어진 경우)
 
     class Config:
         from_attributes = True
 
+    @classmethod
+    def build(cls, diary: Diary) -> "DiaryDetailResponse":
+        response = cls.model_validate(diary)
+        if diary.img_webp_key:
+            response.webp_url = public_url(diary.img_webp_key)
+            response.img_url = response.webp_url
+        return response
+
+
+class DiaryCalendarDay(BaseModel):
+    write_date: date
+    count: int
+    mood: MoodEnum  # 그날 가장 많이 기록한 기분
+
+
+class DiaryCalendarResponse(BaseModel):
+    year: int
+    month: int
+    days: list[DiaryCalendarDay]
+
 
 class DiaryAnalysisResponse(BaseModel):
     diary_id: int
@@ -66,3 +103,23 @@ class MoodStatisticsResponse(BaseModel):
             tired=mood_stats[MoodEnum.tired],
             sad=mood_stats[MoodEnum.sad],
         )
+
+
+class MoodTrendPoint(MoodStatisticsResponse):
+    period_start: date  # 주 시작일(월요일) 또는 월 1일
+
+    @classmethod
+    def from_counts(
+        cls, period_start: date, mood_stats: Dict[MoodEnum, int]
+    ) -> "MoodTrendPoint":
+        return cls(
+            period_start=period_start,
+            **MoodStatisticsResponse.build(mood_stats=mood_stats).model_dump(),
+        )
+
+
+class MoodTrendResponse(BaseModel):
+    period: str
+    start: date
+    end: date
+    points: list[MoodTrendPoint]
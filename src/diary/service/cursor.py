@@ -0,0 +1,35 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Union
+
+from fastapi import HTTPException, status
+
+SortValue = Union[datetime, date]
+
+
+def encode_cursor(sort_key: str, value: SortValue, row_id: int) -> str:
+    """마지막 행의 (정렬 값, id) 를 클라이언트가 해석하지 않는 문자열로 만듭니다."""
+    raw = json.dumps([sort_key, value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> tuple[SortValue, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if key != sort_key or not isinstance(row_id, int):
+            raise ValueError(key)
+        parsed: SortValue = (
+            datetime.fromisoformat(value)
+            if sort_key == "created_at"
+            else date.fromisoformat(value)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        # 다른 정렬 조건에서 받은 커서도 여기서 거부
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다.",
+        )
+    return parsed, row_id
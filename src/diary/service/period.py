@@ -0,0 +1,14 @@
+from datetime import date
+from typing import Optional
+
+
+def date_range(year: int, month: Optional[int] = None) -> tuple[date, date]:
+    """
+    연도(또는 연/월)를 [시작일, 다음 기간 시작일) 반열린 구간으로 바꿉니다.
+    extract() 비교와 달리 write_date 인덱스의 범위 스캔으로 처리됩니다.
+    """
+    if month is None:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    if month == 12:
+        return date(year, 12, 1), date(year + 1, 1, 1)
+    return date(year, month, 1), date(year, month + 1, 1)
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Literal, Union
+
+from sqlalchemy import and_, delete, func, insert, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database.orm import upsert_insert
+from src.diary.models import Diary, MoodEnum, MoodRollup
+from src.ex_diary.models import ExDiary
+
+RollupSource = Literal["diary", "ex_diary"]
+RollupPeriod = Literal["week", "month"]
+
+ROLLUP_SOURCES: tuple[RollupSource, ...] = ("diary", "ex_diary")
+ROLLUP_PERIODS: tuple[RollupPeriod, ...] = ("week", "month")
+
+
+def period_start(period: RollupPeriod, value: Union[date, datetime]) -> date:
+    """주(월요일 시작) 또는 월의 첫날을 반환합니다."""
+    day = value.date() if isinstance(value, datetime) else value
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def next_period_start(period: RollupPeriod, start: date) -> date:
+    if period == "week":
+        return start + timedelta(days=7)
+    if start.month == 12:
+        return date(start.year + 1, 1, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+def period_starts(period: RollupPeriod, start: date, end: date) -> list[date]:
+    """start ~ end 를 포함하는 모든 기간의 시작일입니다. (빈 기간도 0 으로 채우기 위함)"""
+    current, starts = period_start(period, start), []
+    while current <= end:
+        starts.append(current)
+        current = next_period_start(period, current)
+    return starts
+
+
+async def add_to_rollups(
+    session: AsyncSession,
+    user_id: int,
+    source: RollupSource,
+    write_date: Union[date, datetime],
+    mood: MoodEnum,
+    delta: int,
+) -> None:
+    """작성(+1) / 삭제(-1) 시 호출자의 트랜잭션 안에서 주간/월간 롤업을 갱신합니다."""
+    insert_stmt = upsert_insert(session)
+    for period in ROLLUP_PERIODS:
+        await session.execute(
+            insert_stmt(MoodRollup)
+            .values(
+                user_id=user_id,
+                source=source,
+                period=period,
+                period_start=period_start(period, write_date),
+                mood=mood,
+                count=max(delta, 0),
+            )
+            .on_conflict_do_update(
+                index_elements=[
+                    MoodRollup.user_id,
+                    MoodRollup.source,
+                    MoodRollup.period,
+                    MoodRollup.period_start,
+                    MoodRollup.mood,
+                ],
+                set_={"count": MoodRollup.count + delta},
+            )
+        )
+
+
+async def rebuild_rollups(session: AsyncSession, since: date) -> int:
+    """
+    since 가 속한 달부터의 롤업을 원본 테이블에서 다시 계산합니다.
+    (친구 삭제로 교환일기가 함께 지워지는 등 증분 갱신이 놓친 변경을 복구)
+    """
+    month_from = period_start("month", since)
+    week_from = period_start("week", month_from)
+
+    await session.execute(
+        delete(MoodRollup).where(
+            or_(
+                and_(MoodRollup.period == "week", MoodRollup.period_start >= week_from),
+                and_(
+                    MoodRollup.period == "month", MoodRollup.period_start >= month_from
+                ),
+            )
+        )
+    )
+
+    # 날짜 단위로 먼저 집계한 뒤 주/월 단위로 합산 (DB 별 날짜 함수 차이 회피)
+    counts: dict[tuple[Any, ...], int] = defaultdict(int)
+    sources: Iterable[tuple[RollupSource, Any, Any]] = (
+        ("diary", Diary, Diary.deleted_at.is_(None)),
+        ("ex_diary", ExDiary, true()),
+    )
+    for source, model, condition in sources:
+        rows = await session.execute(
+            select(model.user_id, model.write_date, model.mood, func.count())
+            .where(
+                model.write_date >= week_from,
+                model.user_id.is_not(None),
+                condition,
+            )
+            .group_by(model.user_id, model.write_date, model.mood)
+        )
+        for user_id, write_date, mood, count in rows.all():
+            counts[
+                (user_id, source, "week", period_start("week", write_date), mood)
+            ] += count
+            if write_date >= month_from:
+                counts[
+                    (user_id, source, "month", period_start("month", write_date), mood)
+                ] += count
+
+    if counts:
+        await session.execute(
+            insert(MoodRollup),
+            [
+                {
+                    "user_id": user_id,
+                    "source": source,
+                    "period": period,
+                    "period_start": start,
+                    "mood": mood,
+                    "count": count,
+                }
+                for (user_id, source, period, start, mood), count in counts.items()
+            ],
+        )
+    return len(counts)
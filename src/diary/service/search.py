@@ -0,0 +1,90 @@
+import re
+from typing import Any, Protocol
+
+from sqlalchemy import Select, column, func, literal_column, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnClause
+
+from src.diary.models import SEARCH_CONFIG, Diary, search_document
+
+# 검색어에서 사용할 최대 단어 수 (긴 문장을 붙여넣는 경우 대비)
+MAX_SEARCH_TERMS = 8
+
+HIGHLIGHT_START = "<b>"
+HIGHLIGHT_STOP = "</b>"
+
+
+def search_terms(word: str) -> list[str]:
+    """검색어를 단어 단위로 나눕니다. 특수문자는 검색 문법과 충돌하므로 제거합니다."""
+    return re.findall(r"\w+", word)[:MAX_SEARCH_TERMS]
+
+
+class DiarySearch(Protocol):
+    def apply(
+        self, query: Select[Any], terms: list[str], rank: bool = True
+    ) -> Select[Any]:
+        """
+        검색 조건을 추가하고 snippet 컬럼을 덧붙입니다.
+        rank=False 면 관련도 정렬을 생략합니다. (커서 페이지네이션은 정렬 키가 고정)
+        """
+        ...
+
+
+class PostgresDiarySearch:
+    """tsvector GIN 인덱스(ix_diaries_search)를 사용하는 검색입니다."""
+
+    HEADLINE_OPTIONS = (
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+        "MaxFragments=1, MaxWords=20, MinWords=5"
+    )
+
+    def apply(
+        self, query: Select[Any], terms: list[str], rank: bool = True
+    ) -> Select[Any]:
+        # 각 단어를 접두어로 검색 ("학교" -> "학교에서" 도 검색됨)
+        tsquery = func.to_tsquery(
+            SEARCH_CONFIG, " & ".join(f"{term}:*" for term in terms)
+        )
+        document = search_document(Diary.title, Diary.content)
+
+        query = query.where(document.op("@@")(tsquery)).add_columns(
+            func.ts_headline(
+                SEARCH_CONFIG, Diary.content, tsquery, self.HEADLINE_OPTIONS
+            ).label("snippet")
+        )
+        if rank:
+            query = query.order_by(func.ts_rank_cd(document, tsquery).desc())
+        return query
+
+
+class SqliteDiarySearch:
+    """테스트 환경(SQLite)용 FTS5 검색입니다. (diaries_fts 테이블은 models.py 에서 생성)"""
+
+    fts = table("diaries_fts", column("rowid"))
+
+    def apply(
+        self, query: Select[Any], terms: list[str], rank: bool = True
+    ) -> Select[Any]:
+        match = " ".join(f'"{term}"*' for term in terms)
+        fts_table: ColumnClause[Any] = literal_column("diaries_fts")
+
+        query = (
+            query.join(self.fts, self.fts.c.rowid == Diary.id)
+            .where(text("diaries_fts MATCH :match").bindparams(match=match))
+            .add_columns(
+                func.snippet(
+                    fts_table, 1, HIGHLIGHT_START, HIGHLIGHT_STOP, "...", 16
+                ).label("snippet")
+            )
+        )
+        if rank:
+            # bm25 는 값이 작을수록 관련도가 높음
+            query = query.order_by(func.bm25(fts_table))
+        return query
+
+
+def get_diary_search(session: AsyncSession) -> DiarySearch:
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return SqliteDiarySearch()
+    return PostgresDiarySearch()
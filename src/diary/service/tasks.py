@@ -1,74 +1,90 @@
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-import boto3
-from botocore.exceptions import ClientError
 from celery import shared_task
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import Settings
-from src.config.database.connection import AsyncSessionFactory
+from src.config.database.connection import AsyncSessionFactory, async_engine
 from src.diary.models import Diary
+from src.diary.service.rollup import rebuild_rollups
+from src.upload.service.blobs import release_images
 
 settings = Settings()
 logger = logging.getLogger(__name__)
 
 
-async def delete_expired_diaries_task() -> None:
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-
+async def delete_expired_diaries_task() -> int:
     async with AsyncSessionFactory() as session:
-        async with session.begin():
-            await delete_expired_diaries(session, s3_client)
+        return await delete_expired_diaries(session)
 
 
 @shared_task(name="tasks.delete_expired_diaries")  # type: ignore
-async def delete_expired_diaries(
-    session: AsyncSession, s3_client: boto3.client
-) -> None:
+def delete_expired_diaries_job() -> int:
+    async def run() -> int:
+        try:
+            return await delete_expired_diaries_task()
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이전 루프에 묶인 연결을 남기지 않음
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def delete_expired_diaries(session: AsyncSession) -> int:
     seven_days_ago = datetime.now() - timedelta(days=7)
+    batch_size = settings.EXPIRED_DELETE_BATCH_SIZE
 
     logger.info("Deleting expired diaries started...")
 
-    # 삭제 예정 일기 먼저 조회
-    expired_diaries = await session.execute(
-        select(Diary).where(
-            Diary.deleted_at.isnot(None), Diary.deleted_at <= seven_days_ago
+    # batch_size 개씩 삭제하면서 이미지 키를 받아 참조 해제, 배치마다 커밋
+    # (잠금과 트랜잭션을 짧게 유지하고, 중간에 실패해도 다음 실행이 남은 행부터 이어서 삭제)
+    # 참조가 모두 없어진 이미지는 정리 작업이 스토리지에서 묶어서 삭제
+    deleted = 0
+    while True:
+        expired_ids = (
+            select(Diary.id)
+            .where(Diary.deleted_at.isnot(None), Diary.deleted_at <= seven_days_ago)
+            .limit(batch_size)
         )
-    )
-
-    # S3에서 이미지 대량 삭제
-    for diary in expired_diaries.scalars():
-        if diary.img_url:
-            try:
-                s3_key = diary.img_url.split(
-                    # f"{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/"
-                    f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/"
-                )[1]
-
-                s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-            except ClientError as e:
-                # 로깅 추천
-                logger.error(f"S3 이미지 삭제 실패: {diary.id}, {str(e)}")
-    logger.info(f"Deleted S3 image for user/diary {diary.id}")
-
-    # 데이터베이스에서 대량 삭제
-    await session.execute(
-        delete(Diary).where(
-            Diary.deleted_at.isnot(None), Diary.deleted_at <= seven_days_ago
+        result = await session.execute(
+            delete(Diary)
+            .where(Diary.id.in_(expired_ids))
+            .returning(Diary.img_key)
+            .execution_options(synchronize_session=False)
         )
-    )
-    await session.commit()
-    logger.info("Expired diaries deletion completed.")
+        img_keys = list(result.scalars())
+        await release_images(session, img_keys)
+        await session.commit()
+        deleted += len(img_keys)
+        if len(img_keys) < batch_size:
+            break
+
+    logger.info(f"Expired diaries deletion completed: {deleted}")
+    return deleted
+
+
+async def repair_mood_rollups_task() -> int:
+    # 최근 MOOD_ROLLUP_REPAIR_DAYS 일이 속한 기간의 롤업을 원본 기준으로 다시 계산
+    since = date.today() - timedelta(days=settings.MOOD_ROLLUP_REPAIR_DAYS)
+
+    logger.info("Repairing mood rollups started...")
+    async with AsyncSessionFactory() as session:
+        async with session.begin():
+            rows = await rebuild_rollups(session, since)
+    logger.info(f"Mood rollups repaired since {since}: {rows} rows")
+    return rows
+
+
+@shared_task(name="tasks.repair_mood_rollups")  # type: ignore
+def repair_mood_rollups() -> int:
+    async def run() -> int:
+        try:
+            return await repair_mood_rollups_task()
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이전 루프에 묶인 연결을 남기지 않음
+            await async_engine.dispose()
+
+    return asyncio.run(run())
@@ -1,9 +1,7 @@
-import os
-import uuid
 from datetime import date, datetime
+from functools import partial
 from typing import Optional, Union
 
-import boto3
 from botocore.exceptions import ClientError
 from fastapi import (
     APIRouter,
@@ -16,19 +14,21 @@ from fastapi import (
     status,
 )
 
-from src.config import Settings
+from src.config.database.unit_of_work import get_unit_of_work, when_committed
+from src.config.storage import image_size, public_url, sniff_image_type
 from src.diary.models import MoodEnum, WeatherEnum
 from src.ex_diary.models import ExDiary
 from src.ex_diary.repository import ExDiaryRepository
 from src.ex_diary.schema.response import ExDiaryListResponse, ExDiaryResponse
-from src.friend.models import Friend
-from src.friend.repository import FriendRepository
+from src.ex_diary.service.validate import ExDiaryService
+from src.upload.service.blobs import store_image
+from src.upload.service.tasks import enqueue_process_image
+from src.upload.service.uploads import claim_uploaded_image
 from src.user.repository import UserRepository
 from src.user.schema.response import BasicResponse
 from src.user.service.authentication import authenticate
 
 router = APIRouter(prefix="/ex_diary", tags=["Exchange Diary"])
-settings = Settings()
 
 
 # 교환일기 작성 시 친구테이블에서 교환일기 수 증가하게 해야함, 마지막 교환 일자 업데이트도
@@ -37,6 +37,7 @@ settings = Settings()
     summary="교환일기 작성",
     response_model=BasicResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def write_ex_diary(
     friend_id: int = Path(..., description="친구 관계 id(친구의 유저 id(X))"),
@@ -47,39 +48,31 @@ async def write_ex_diary(
     mood: MoodEnum = Form(...),
     content: str = Form(...),
     image: Union[UploadFile, str] = File(default=None),
+    image_key: Optional[str] = Form(
+        default=None, description="/uploads/presign 으로 업로드한 이미지 키"
+    ),
     ex_diary_repo: ExDiaryRepository = Depends(),  # 수정된 부분
-    friend_repo: FriendRepository = Depends(),  # 수정된 부분
 ) -> BasicResponse:
-    # S3 클라이언트 설정
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-    img_url: Optional[str] = None
+    # 친구 관계가 아닌 friend_id 접근 차단 (워커 캐시로 대부분 DB 조회 없음)
+    await ExDiaryService.validate_friendship(user_id, friend_id, ex_diary_repo.session)
+    img_key: Optional[str] = None
 
-    # 이미지 업로드 처리
-    if image and image.filename:  # type: ignore
+    # 이미지 처리: presigned POST 로 스토리지에 직접 올린 이미지 키를 우선 사용
+    if image_key:
         try:
-            # 파일 포인터 초기화
-            image.file.seek(0)  # type: ignore
-
-            # 파일 크기 확인
-            file_size = len(image.file.read())  # type: ignore
-            # 다시 포인터 초기화
-            image.file.seek(0)  # type: ignore
-
-            # print(f"File details:")
-            # print(f"Filename: {image.filename}")
-            # print(f"File size: {file_size} bytes")
-            # print(f"Content type: {image.content_type}")
+            img_key = await claim_uploaded_image(
+                ex_diary_repo.session, "ex_diary", user_id, image_key
+            )
+        except ClientError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"S3 업로드 오류: {str(e)}",
+            )
+    # (이전 방식) multipart 로 받은 이미지를 서버에서 업로드
+    elif image and image.filename:  # type: ignore
+        try:
+            # 파일 크기 확인 (내용을 읽지 않고 seek/tell 로 확인, 최대 크기 초과 시 413)
+            file_size = image_size(image.file)  # type: ignore
 
             if file_size == 0:
                 print("Warning: Empty file received")
@@ -87,28 +80,14 @@ async def write_ex_diary(
                     message="이미지 파일이 비어있습니다.", status="warning"
                 )
 
-            # 고유한 파일명 생성
-            image_filename = f"ex_diary_{user_id}_{uuid.uuid4()}{os.path.splitext(image.filename)[1]}"  # type: ignore
-
-            # S3에 업로드
-            s3_key = f"ex_diaries/{image_filename}"
-            # s3_client.upload_fileobj(
-            #     image.file,  # type: ignore
-            #     settings.S3_BUCKET_NAME,
-            #     s3_key,
-            #     ExtraArgs={"ContentType": image.content_type},  # type: ignore
-            # )
-            s3_client.upload_fileobj(
+            # 실제 이미지 형식 확인 후 내용 해시 키로 저장 (같은 이미지는 다시 올리지 않음)
+            # 참조 수는 일기 저장과 같은 트랜잭션에서 커밋
+            img_key = await store_image(
+                ex_diary_repo.session,
                 image.file,  # type: ignore
-                settings.NCP_BUCKET_NAME,
-                s3_key,
-                ExtraArgs={"ACL": "public-read"},
+                sniff_image_type(image.file),  # type: ignore
             )
 
-            # 공개 URL 생성
-            # img_url = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            img_url = f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/{s3_key}"
-
         except ClientError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -127,23 +106,23 @@ async def write_ex_diary(
         weather=weather,
         mood=mood,
         content=content,
-        img_url=img_url or "",
+        img_url=public_url(img_key) if img_key else "",
+        img_key=img_key,
     )
 
     try:
+        # 일기 저장과 Friend 테이블의 교환 횟수/마지막 교환일 갱신을 한 트랜잭션으로 처리
         await ex_diary_repo.save(new_ex_diary)
-
-        # Friend 테이블 업데이트는 여기에 추가
-        await friend_repo.update(
-            friend_id=friend_id,
-            data={
-                "ex_diary_cnt": Friend.ex_diary_cnt + 1,
-                "last_ex_date": datetime.now(),
-            },
-        )
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    # 썸네일/WebP 변환은 Celery 워커에서 처리 (워커가 일기를 찾을 수 있도록 커밋된 뒤에 등록)
+    if img_key:
+        await when_committed(
+            ex_diary_repo.session,
+            partial(enqueue_process_image, "ex_diary", new_ex_diary.id),  # type: ignore
+        )
+
     return BasicResponse(message="일기가 성공적으로 생성되었습니다.", status="success")
 
 
@@ -158,6 +137,8 @@ async def ex_diary_list(
     user_id: int = Depends(authenticate),
     ex_diary_repo: ExDiaryRepository = Depends(),
 ) -> ExDiaryListResponse:
+    # 친구 관계가 아닌 friend_id 접근 차단 (워커 캐시로 대부분 DB 조회 없음)
+    await ExDiaryService.validate_friendship(user_id, friend_id, ex_diary_repo.session)
     ex_diaries = await ex_diary_repo.get_ex_diary_list(friend_id)
 
     if not ex_diaries:
@@ -186,6 +167,8 @@ async def ex_diary_detail(
     ex_diary_repo: ExDiaryRepository = Depends(),
     user_repo: UserRepository = Depends(),
 ) -> ExDiaryResponse:
+    # 친구 관계가 아닌 friend_id 접근 차단 (워커 캐시로 대부분 DB 조회 없음)
+    await ExDiaryService.validate_friendship(user_id, friend_id, ex_diary_repo.session)
     ex_diary = await ex_diary_repo.get_ex_diary_detail(
         friend_id=friend_id, ex_diary_id=ex_diary_id
     )
@@ -207,57 +190,19 @@ async def ex_diary_detail(
     path="/{friend_id}/{ex_diary_id}",
     summary="교환일기 삭제",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def ex_diary_delete(
     user_id: int = Depends(authenticate),
     friend_id: int = Path(..., description="친구 관계 id(친구의 유저 id (X))"),
     ex_diary_id: int = Path(..., description="삭제할 교환일기 id"),
     ex_diary_repo: ExDiaryRepository = Depends(),
-    friend_repo: FriendRepository = Depends(),
 ) -> None:
-    # S3 클라이언트 설정
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-
-    # 삭제할 일기 정보 조회
-    ex_diary = await ex_diary_repo.get_ex_diary_detail(
-        friend_id=friend_id, ex_diary_id=ex_diary_id
-    )
-
-    # S3에 이미지가 있다면 삭제
-    if ex_diary.img_url:  # type: ignore
-        try:
-            # S3 키 추출 (URL에서 버킷명과 키 분리)
-            s3_key = ex_diary.img_url.split(  # type: ignore
-                # f"{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/"
-                f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/"
-            )[1]
-
-            # S3에서 이미지 삭제
-            s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-        except Exception as e:
-            # S3 삭제 실패해도 로깅하고 진행
-            print(f"S3 이미지 삭제 실패: {str(e)}")
+    # 친구 관계가 아닌 friend_id 접근 차단 (워커 캐시로 대부분 DB 조회 없음)
+    await ExDiaryService.validate_friendship(user_id, friend_id, ex_diary_repo.session)
 
-    # 일기 삭제
+    # 일기 삭제 (Friend 테이블의 교환 횟수도 같은 트랜잭션에서 감소)
+    # 이미지는 작성자 확인 후 repository 에서 삭제
     await ex_diary_repo.delete_ex_diary(
         user_id=user_id, friend_id=friend_id, ex_diary_id=ex_diary_id
     )
-
-    # Friend 테이블 업데이트
-    await friend_repo.update(
-        friend_id=friend_id,
-        data={
-            "ex_diary_cnt": Friend.ex_diary_cnt - 1,
-        },
-    )
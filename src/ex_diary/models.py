@@ -1,7 +1,17 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Date, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, relationship
 
 from src.config.database.orm import Base
@@ -23,8 +33,18 @@ class ExDiary(Base):
     mood: Mapped[MoodEnum] = Column(Enum(MoodEnum, name="ex_moodenum"), nullable=False)
     content = Column(Text, nullable=False)
     img_url = Column(String(255), nullable=True)
+    # 스토리지 객체 키 (URL 을 파싱하지 않고 삭제/변환에 사용)
+    img_key = Column(String(255), nullable=True)
+    # 백그라운드 작업이 만든 변환 이미지 키 (만들어지기 전에는 원본 사용)
+    img_thumbnail_key = Column(String(255), nullable=True)
+    img_webp_key = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.now)
 
+    # 친구별 교환일기 목록 (최신순)
+    __table_args__ = (
+        Index("ix_ex_diaries_friend_id_created_at", "friend_id", "created_at"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="ex_diaries")  # type: ignore
     friend = relationship("Friend", back_populates="ex_diaries", uselist=True)  # type: ignore
@@ -40,6 +60,7 @@ class ExDiary(Base):
         mood: MoodEnum,
         content: str,
         img_url: Optional[str] = None,
+        img_key: Optional[str] = None,
     ) -> "ExDiary":
         return cls(
             user_id=user_id,
@@ -50,4 +71,5 @@ class ExDiary(Base):
             mood=mood,
             content=content,
             img_url=img_url,
+            img_key=img_key,
         )
@@ -1,14 +1,13 @@
-import boto3
-from botocore.exceptions import ClientError
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import Settings
 from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import commit, unit_of_work
+from src.diary.service.rollup import add_to_rollups
 from src.ex_diary.models import ExDiary
-
-settings = Settings()
+from src.friend.service.exchange import update_exchange_count
+from src.upload.service.blobs import release_image
 
 
 class ExDiaryRepository:
@@ -16,8 +15,23 @@ class ExDiaryRepository:
         self.session = session
 
     async def save(self, ex_diary: ExDiary) -> None:
-        self.session.add(ex_diary)
-        await self.session.commit()
+        # 기분 롤업, 친구 관계의 교환 횟수도 같은 트랜잭션에서 갱신
+        # (예외가 나면 unit_of_work 가 롤백하며, 바깥 블록이 있으면 바깥 블록 전체가 롤백)
+        async with unit_of_work(self.session):
+            self.session.add(ex_diary)
+            await self._record_mood(ex_diary, 1)
+            if await update_exchange_count(self.session, ex_diary.friend_id, 1) is None:  # type: ignore
+                raise ValueError("해당 친구를 찾을 수 없습니다.")
+
+    async def _record_mood(self, ex_diary: ExDiary, delta: int) -> None:
+        await add_to_rollups(
+            self.session,
+            ex_diary.user_id,  # type: ignore
+            "ex_diary",
+            ex_diary.write_date,  # type: ignore
+            ex_diary.mood,
+            delta,
+        )
 
     async def get_ex_diary_list(self, friend_id: int) -> list[ExDiary]:
 
@@ -72,27 +86,10 @@ class ExDiaryRepository:
                 },
             )
 
-        # S3 이미지 삭제 로직 추가
-        if ex_diary.img_url:
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION,
-            )
-
-            # S3 키 추출 (URL에서 버킷 이름 제외한 키 부분 추출)
-            s3_key = ex_diary.img_url.split(
-                f"{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/"
-            )[1]
-
-            try:
-                # S3에서 이미지 삭제
-                s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-            except ClientError as e:
-                # S3 삭제 실패해도 일기 삭제 진행
-                print(f"S3 이미지 삭제 실패: {str(e)}")
-
-        # 교환일기 삭제 및 커밋
+        # 교환일기 삭제 및 커밋 (교환 횟수 감소, 이미지 참조 해제도 같은 트랜잭션)
+        # 이미지는 참조가 모두 없어지면 정리 작업이 스토리지에서 삭제
+        await self._record_mood(ex_diary, -1)
         await self.session.delete(ex_diary)
-        await self.session.commit()
+        await update_exchange_count(self.session, friend_id, -1)
+        await release_image(self.session, ex_diary.img_key)
+        await commit(self.session)
@@ -1,7 +1,9 @@
 from datetime import date, datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
+from src.config.storage import public_url
 from src.ex_diary.models import ExDiary
 from src.user.models import User
 
@@ -12,7 +14,7 @@ class ExDiaryBriefResponse(BaseModel):
     title: str
     write_date: date
     content: str
-    img_url: str
+    img_url: str  # 목록에서는 썸네일 (아직 만들어지지 않았으면 원본)
     created_at: datetime
 
     @classmethod
@@ -27,7 +29,11 @@ class ExDiaryBriefResponse(BaseModel):
             title=ex_diary.title or "",
             write_date=ex_diary.write_date or date.today(),
             content=ex_diary.content or "",
-            img_url=ex_diary.img_url or "",
+            img_url=(
+                public_url(ex_diary.img_thumbnail_key)
+                if ex_diary.img_thumbnail_key
+                else ex_diary.img_url or ""
+            ),
             created_at=ex_diary.created_at or datetime.now(),
         )
 
@@ -53,11 +59,14 @@ class ExDiaryResponse(BaseModel):
     weather: str
     mood: str
     content: str
+    # EXIF(위치 정보 등)를 지운 화면용 WebP, 아직 만들어지지 않았으면 원본
     img_url: str
+    webp_url: Optional[str] = None  # 화면 크기로 줄인 WebP (만들어진 경우)
     created_at: datetime
 
     @classmethod
     def build(cls, ex_diary: ExDiary, user: User) -> "ExDiaryResponse":
+        webp_url = public_url(ex_diary.img_webp_key) if ex_diary.img_webp_key else None
         return cls(
             id=ex_diary.id or 0,
             title=ex_diary.title or "",
@@ -66,6 +75,7 @@ class ExDiaryResponse(BaseModel):
             weather=ex_diary.weather or "",
             mood=ex_diary.mood or "",
             content=ex_diary.content or "",
-            img_url=ex_diary.img_url or "",
+            img_url=webp_url or ex_diary.img_url or "",
+            webp_url=webp_url,
             created_at=ex_diary.created_at or datetime.now(),
         )
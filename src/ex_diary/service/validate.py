@@ -1,5 +1,4 @@
 from fastapi import HTTPException, status
-from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -8,17 +7,9 @@ class ExDiaryService:
     async def validate_friendship(
         user_id: int, friend_id: int, session: AsyncSession
     ) -> None:
-        from src.friend.models import Friend
+        from src.friend.repository import FriendRepository
 
-        friend_record = await session.execute(
-            select(Friend).filter(
-                or_(Friend.user_id1 == user_id, Friend.user_id2 == user_id),
-                Friend.id == friend_id,
-                Friend.is_accept == True,
-            )
-        )
-
-        result = friend_record.scalar_one_or_none()
+        result = await FriendRepository(session).is_friend(user_id, friend_id)
 
         if not result:
             raise HTTPException(
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import get_unit_of_work, unit_of_work
 from src.friend.repository import FriendRepository
 from src.friend.schema.request import (
     AcceptFriendRequest,
@@ -25,7 +26,6 @@ from src.notification.repository import NotificationRepository
 from src.notification.service.websocket import manager
 from src.user.repository import UserRepository
 from src.user.service.authentication import authenticate
-from src.websocket.repository import ChatRepository
 
 router = APIRouter(prefix="/friends", tags=["Friend"])
 
@@ -70,14 +70,16 @@ async def send_friend_request_by_id(
             user_id=target_user.id, title="친구 요청", message=message
         )
 
+        # 알림과 친구 신청을 한 트랜잭션으로 저장
         noti_repo = NotificationRepository(session)
-        await noti_repo.create_notification(notification)
+        async with unit_of_work(session):
+            await noti_repo.create_notification(notification)
+            await friend_repo.create_friend_request(current_user_id, target_user.id)
 
+        # 커밋된 뒤에 알림 전송 (알림 목록을 바로 조회해도 보이도록)
         await manager.send_personal_message(
             message="새로운 알림이 있습니다.", user_id=target_user.id
         )
-
-        await friend_repo.create_friend_request(current_user_id, target_user.id)
         return FriendRequestByEmailResponse(success=True, message="친구 신청 완료.")
     except Exception as e:
         raise HTTPException(status_code=500, detail="친구 신청 실패.")
@@ -145,7 +147,11 @@ async def list_sent_friend_requests(
     )
 
 
-@router.patch("/{friend_id}", summary="내가 받은 친구 요청 수락")
+@router.patch(
+    "/{friend_id}",
+    summary="내가 받은 친구 요청 수락",
+    dependencies=[Depends(get_unit_of_work)],
+)
 async def accept_friend(
     friend_id: int,
     current_user_id: int = Depends(authenticate),
@@ -169,38 +175,21 @@ async def accept_friend(
 async def list_friends(
     current_user_id: int = Depends(authenticate),
     frd_repo: FriendRepository = Depends(),
-    msg_repo: ChatRepository = Depends(),
 ) -> FriendsListResponse:
-    # Fetch friends for the current user
-    friends = await frd_repo.get_friends(current_user_id)
-
-    # Fetch latest messages for all friends
-    latest_messages = await msg_repo.get_latest_messages_by_room(current_user_id)
-
-    # Prepare response data
-    response_data = [
-        FriendsResponse(
-            id=friend.id,
-            is_accept=friend.is_accept,
-            ex_diary_cnt=friend.ex_diary_cnt,
-            last_ex_date=friend.last_ex_date,
-            created_at=friend.created_at,
-            friend_nickname=friend.user2.nickname if friend.user_id1 == current_user_id else friend.user1.nickname,  # type: ignore
-            friend_profile_img=friend.user2.img_url if friend.user_id1 == current_user_id else friend.user1.img_url,  # type: ignore
-            friend_introduce=friend.user2.introduce if friend.user_id1 == current_user_id else friend.user1.introduce,  # type: ignore
-            latest_message=(
-                latest_messages.get(friend.id).message  # type: ignore
-                if latest_messages.get(friend.id)
-                else None
-            ),
-        )
-        for friend in friends
-    ]
-    return FriendsListResponse(friends=response_data)
+    # 요약 테이블(friend_summaries)에서 한 번에 조회
+    summaries = await frd_repo.get_friend_summaries(current_user_id)
+    return FriendsListResponse(
+        friends=[FriendsResponse.build(summary) for summary in summaries]
+    )
 
 
 # 친구 거절 시에도 테이블에서 삭제 동작하게 함.
-@router.delete("/{friend_id}", summary="친구 삭제", response_model=DeleteFriendResponse)
+@router.delete(
+    "/{friend_id}",
+    summary="친구 삭제",
+    response_model=DeleteFriendResponse,
+    dependencies=[Depends(get_unit_of_work)],
+)
 async def delete_friend(
     friend_id: int,
     current_user_id: int = Depends(authenticate),
@@ -1,7 +1,16 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
@@ -11,7 +20,12 @@ from src.ex_diary.models import ExDiary
 
 class Friend(Base):
     __tablename__ = "friends"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # 보낸/받은 요청, 친구 목록은 user_id1 / user_id2 각각으로 조회
+        Index("ix_friends_user_id1_is_accept", "user_id1", "is_accept"),
+        Index("ix_friends_user_id2_is_accept", "user_id2", "is_accept"),
+        {"extend_existing": True},
+    )
 
     id = Column(Integer, primary_key=True)
     user_id1 = Column(
@@ -44,4 +58,63 @@ class Friend(Base):
         return None
 
 
-__all__ = ["Friend", "Base"]
+class FriendEdge(Base):
+    """
+    친구 관계의 방향별 행 (A-B 관계마다 A->B, B->A 두 행).
+    user_id1 / user_id2 를 OR 로 조회하지 않고 인덱스 한 번으로 친구 여부와 목록을 찾습니다.
+    friends 행이 생성/수락/삭제될 때 FriendRepository 에서 함께 갱신합니다.
+    """
+
+    __tablename__ = "friend_edges"
+    __table_args__ = (
+        # 친구 관계 id 로 권한 확인 (인덱스만으로 처리)
+        Index("ix_friend_edges_user_id_friend_id", "user_id", "friend_id", "is_accept"),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    other_user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    friend_id = Column(
+        Integer, ForeignKey("friends.id", ondelete="CASCADE"), nullable=False
+    )
+    is_accept = Column(Boolean, nullable=False, default=False)
+
+
+class FriendSummary(Base):
+    """
+    친구 목록 화면용 요약 (친구 관계마다 양쪽 사용자에 대해 한 행씩).
+    친구 수락, 채팅, 교환일기 작성/삭제, 프로필 수정 시 갱신되어
+    GET /friends 를 user_id 기본키 범위 조회 한 번으로 처리합니다.
+    """
+
+    __tablename__ = "friend_summaries"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    friend_id = Column(
+        Integer, ForeignKey("friends.id", ondelete="CASCADE"), primary_key=True
+    )
+    # 상대방 정보 (프로필 수정 시 friend_user_id 로 찾아서 갱신)
+    friend_user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    friend_nickname = Column(String, nullable=False)
+    friend_profile_img = Column(String, nullable=True)
+    friend_profile_thumbnail_key = Column(String, nullable=True)
+    friend_introduce = Column(String, nullable=True)
+
+    ex_diary_cnt = Column(Integer, nullable=False, default=0)
+    last_ex_date = Column(DateTime, nullable=True)
+    latest_message = Column(Text, nullable=True)
+    latest_message_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=True)  # 친구 관계 생성일
+
+
+__all__ = ["Friend", "FriendEdge", "FriendSummary", "Base"]
@@ -1,12 +1,20 @@
+from functools import partial
 from typing import Any, Dict, Optional
 
 from fastapi import Depends
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from src.config.database.connection import get_async_session
-from src.friend.models import Friend
+from src.config.database.unit_of_work import after_commit, commit
+from src.friend.models import Friend, FriendEdge, FriendSummary
+from src.friend.service.friendship_cache import friendship_cache
+from src.friend.service.summary import (
+    create_friend_summaries,
+    delete_friend_summaries,
+    sync_exchange_stats,
+)
 
 
 class FriendRepository:
@@ -19,8 +27,21 @@ class FriendRepository:
             user_id1=user_id1, user_id2=user_id2
         )  # 현재 유저 id 가 user_id1
         self.session.add(friend_request)
-        await self.session.commit()
-        await self.session.refresh(friend_request)
+        await self.session.flush()
+        # 양방향 친구 관계 행 추가
+        await self.session.execute(
+            insert(FriendEdge),
+            [
+                {
+                    "user_id": user_id,
+                    "other_user_id": other_id,
+                    "friend_id": friend_request.id,
+                    "is_accept": False,
+                }
+                for user_id, other_id in ((user_id1, user_id2), (user_id2, user_id1))
+            ],
+        )
+        await commit(self.session)
         return friend_request
 
     # 받은 친구 요청 목록 조회 repo
@@ -64,47 +85,97 @@ class FriendRepository:
 
         if friend_request.user_id2 == current_user_id:
             friend_request.is_accept = True
+            # 친구 관계 행과 친구 목록 요약 행도 같은 트랜잭션에서 갱신
+            await self.session.execute(
+                update(FriendEdge)
+                .where(FriendEdge.friend_id == friend_id)
+                .values(is_accept=True)
+            )
+            await self.session.flush()
+            await create_friend_summaries(self.session, friend_request)
 
-        await self.session.commit()
-        await self.session.refresh(friend_request)
+        user_ids = (friend_request.user_id1, friend_request.user_id2)
+        after_commit(
+            self.session,
+            partial(friendship_cache.invalidate, friend_id, user_ids),  # type: ignore
+        )
+        await commit(self.session)
 
         return True
 
     # 친구 목록 조회 repo
     async def get_friends(self, user_id: int) -> list[Friend]:
+        # 상대방 프로필까지 한 번의 쿼리로 조회 (selectinload 는 관계마다 쿼리가 추가됨)
         result = await self.session.execute(
             select(Friend)
-            .options(selectinload(Friend.user1), selectinload(Friend.user2))
-            .filter(
-                ((Friend.user_id1 == user_id) | (Friend.user_id2 == user_id))
-                & (Friend.is_accept == True)
-            )
+            .join(FriendEdge, FriendEdge.friend_id == Friend.id)
+            .options(joinedload(Friend.user1), joinedload(Friend.user2))
+            .where(FriendEdge.user_id == user_id, FriendEdge.is_accept == True)
+        )
+        return list(result.scalars().all())
+
+    async def get_friend_summaries(self, user_id: int) -> list[FriendSummary]:
+        # 친구 목록 화면에 필요한 값이 모두 들어있는 요약 행을 기본키 범위로 조회
+        result = await self.session.execute(
+            select(FriendSummary)
+            .where(FriendSummary.user_id == user_id)
+            .order_by(FriendSummary.friend_id)
         )
         return list(result.scalars().all())
 
     async def check_friendship(self, user_id: int, friend_id: int) -> Optional[Friend]:
+        # (user_id, other_user_id) 기본키 조회 후 friends 기본키로 조인
         result = await self.session.execute(
-            select(Friend).filter(
-                ((Friend.user_id1 == user_id) & (Friend.user_id2 == friend_id))
-                | ((Friend.user_id1 == friend_id) & (Friend.user_id2 == user_id))
-            )
+            select(Friend)
+            .join(FriendEdge, FriendEdge.friend_id == Friend.id)
+            .where(FriendEdge.user_id == user_id, FriendEdge.other_user_id == friend_id)
         )
         return result.scalar_one_or_none()
 
+    async def is_friend(self, user_id: int, friend_id: int) -> bool:
+        """
+        friend_id(친구 관계 id) 가 user_id 의 수락된 친구 관계인지 확인합니다.
+        워커의 friendship_cache 에 있으면 DB 를 조회하지 않습니다.
+        """
+        if friendship_cache.get(user_id, friend_id):
+            return True
+
+        result = await self.session.execute(
+            select(FriendEdge.user_id).where(
+                FriendEdge.user_id == user_id,
+                FriendEdge.friend_id == friend_id,
+                FriendEdge.is_accept == True,
+            )
+        )
+        if result.first() is None:
+            return False
+        friendship_cache.put(user_id, friend_id)
+        return True
+
     # 친구 삭제 repo
     async def delete_friend(self, user_id: int, friend_id: int) -> bool:
         result = await self.session.execute(
-            select(Friend).filter(
-                (Friend.id == friend_id)
-                & ((Friend.user_id1 == user_id) | (Friend.user_id2 == user_id))
+            select(FriendEdge.friend_id).where(
+                FriendEdge.user_id == user_id, FriendEdge.friend_id == friend_id
             )
         )
-        friend = result.scalar_one_or_none()
-        if not friend:
+        if result.first() is None:
             return False
 
+        await delete_friend_summaries(self.session, friend_id)
+        deleted = await self.session.execute(
+            delete(FriendEdge)
+            .where(FriendEdge.friend_id == friend_id)
+            .returning(FriendEdge.user_id)
+        )
+        user_ids = list(deleted.scalars())
         await self.session.execute(delete(Friend).where(Friend.id == friend_id))
-        await self.session.commit()
+        # 캐시는 삭제가 커밋된 뒤에 무효화 (롤백되면 그대로 둠)
+        after_commit(
+            self.session,
+            partial(friendship_cache.broadcast_invalidation, friend_id, user_ids),  # type: ignore
+        )
+        await commit(self.session)
         return True
 
     # 교환 일기 정보 업데이트 레포
@@ -123,8 +194,12 @@ class FriendRepository:
             for key, value in data.items():
                 setattr(friend, key, value)
 
-            await self.session.commit()
-            await self.session.refresh(friend)
+            # 교환 횟수/날짜가 바뀌면 친구 목록 요약 행에도 반영
+            if {"ex_diary_cnt", "last_ex_date"} & data.keys():
+                await self.session.flush()
+                await sync_exchange_stats(self.session, friend_id)
+
+            await commit(self.session)
 
             return True
 
@@ -3,6 +3,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from src.config.storage import public_url
+from src.friend.models import FriendSummary
+
 
 class FriendCreate(BaseModel):
     user_id1: int
@@ -62,6 +65,25 @@ class FriendsResponse(BaseModel):
     class Config:
         from_attributes = True  # ORM 모델에서 Pydantic 모델로 변환을 쉽게 해줍니다.
 
+    @classmethod
+    def build(cls, summary: FriendSummary) -> "FriendsResponse":
+        return cls(
+            id=summary.friend_id,
+            is_accept=True,  # 요약 행은 수락된 친구 관계만 존재
+            ex_diary_cnt=summary.ex_diary_cnt,
+            last_ex_date=summary.last_ex_date,
+            created_at=summary.created_at,
+            friend_nickname=summary.friend_nickname,  # type: ignore
+            # 친구 목록에서는 프로필 썸네일 (아직 만들어지지 않았으면 원본)
+            friend_profile_img=(
+                public_url(summary.friend_profile_thumbnail_key)
+                if summary.friend_profile_thumbnail_key
+                else summary.friend_profile_img
+            ),
+            friend_introduce=summary.friend_introduce,
+            latest_message=summary.latest_message,
+        )
+
 
 # 친구 목록 전체를 감싸는 모델
 class FriendsListResponse(BaseModel):
@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ex_diary.models import ExDiary
+from src.friend.models import Friend, FriendSummary
+
+
+async def update_exchange_count(
+    session: AsyncSession, friend_id: int, delta: int
+) -> Optional[tuple[int, Optional[datetime]]]:
+    """
+    교환일기 작성(+1) / 삭제(-1) 시 호출자의 트랜잭션 안에서 교환 횟수를 원자적으로 갱신합니다.
+    UPDATE ... RETURNING 한 번으로 처리하므로 동시에 작성해도 증가분이 사라지지 않습니다.
+    친구 관계가 없으면 None 을 반환합니다.
+    """
+    count = func.coalesce(Friend.ex_diary_cnt, 0) + delta
+    values: dict[str, Any] = {"ex_diary_cnt": case((count < 0, 0), else_=count)}
+    if delta > 0:
+        values["last_ex_date"] = datetime.now()
+
+    result = await session.execute(
+        update(Friend)
+        .where(Friend.id == friend_id)
+        .values(**values)
+        .returning(Friend.ex_diary_cnt, Friend.last_ex_date)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    ex_diary_cnt, last_ex_date = row
+    await set_summary_exchange_stats(session, friend_id, ex_diary_cnt, last_ex_date)
+    return ex_diary_cnt, last_ex_date
+
+
+async def set_summary_exchange_stats(
+    session: AsyncSession,
+    friend_id: int,
+    ex_diary_cnt: int,
+    last_ex_date: Optional[datetime],
+) -> None:
+    await session.execute(
+        update(FriendSummary)
+        .where(FriendSummary.friend_id == friend_id)
+        .values(ex_diary_cnt=ex_diary_cnt, last_ex_date=last_ex_date)
+    )
+
+
+async def reconcile_exchange_counts(
+    session: AsyncSession, after_id: int = 0, batch_size: int = 1000
+) -> tuple[int, Optional[int]]:
+    """
+    friends.ex_diary_cnt 를 ex_diaries 의 COUNT(*) 와 비교해서 다른 행만 고칩니다.
+    id 순으로 batch_size 개씩 처리하며 (고친 행 수, 다음 배치 시작 id) 를 반환합니다.
+    마지막 배치면 다음 시작 id 는 None 입니다.
+    """
+    ids = list(
+        await session.scalars(
+            select(Friend.id)
+            .where(Friend.id > after_id)
+            .order_by(Friend.id)
+            .limit(batch_size)
+        )
+    )
+    if not ids:
+        return 0, None
+
+    # 세는 것과 고치는 것을 UPDATE 한 문장으로 처리 (행 잠금 안에서 세므로
+    # 그 사이에 작성된 교환일기의 증가분을 덮어쓰지 않음)
+    actual = (
+        select(func.count())
+        .select_from(ExDiary)
+        .where(ExDiary.friend_id == Friend.id)
+        .correlate(Friend)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(Friend)
+        .where(Friend.id.in_(ids), Friend.ex_diary_cnt.is_distinct_from(actual))
+        .values(ex_diary_cnt=actual)
+        .returning(Friend.id)
+        .execution_options(synchronize_session=False)
+    )
+    fixed_ids = list(result.scalars())
+
+    # 친구 목록 요약 행에도 고친 값을 복사
+    if fixed_ids:
+        await session.execute(
+            update(FriendSummary)
+            .where(FriendSummary.friend_id.in_(fixed_ids))
+            .values(
+                ex_diary_cnt=select(Friend.ex_diary_cnt)
+                .where(Friend.id == FriendSummary.friend_id)
+                .scalar_subquery(),
+                last_ex_date=select(Friend.last_ex_date)
+                .where(Friend.id == FriendSummary.friend_id)
+                .scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    next_id = ids[-1] if len(ids) == batch_size else None
+    return len(fixed_ids), next_id
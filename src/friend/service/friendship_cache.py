@@ -0,0 +1,69 @@
+import logging
+import time
+from typing import Iterable
+
+import redis.asyncio as redis
+
+from src.config import Settings
+from src.config.cache import get_redis, pubsub_listener
+from src.config.lru_cache import ExpiringLRUCache
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+# 친구 관계 삭제를 모든 워커에 전파하는 pub/sub 채널 (메시지: "{friend_id}:{user_id},{user_id}")
+INVALIDATION_CHANNEL = "friends:invalidated"
+
+
+class FriendshipCache(ExpiringLRUCache[tuple[int, int], bool]):
+    """
+    수락된 친구 관계 (user_id, friend_id) 를 ttl 초 동안 기억하는 LRU 캐시입니다.
+    워커 프로세스마다 하나씩 존재하며, 교환일기/채팅 요청마다 친구 여부를 DB 에서 다시 확인하지 않게 합니다.
+
+    친구가 아닌 결과는 저장하지 않으므로 수락 직후에도 바로 접근할 수 있고,
+    친구 삭제는 pub/sub 으로 모든 워커에 전파됩니다. (전파에 실패해도 ttl 이 지나면 반영)
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def get(self, user_id: int, friend_id: int) -> bool:
+        return self.lookup((user_id, friend_id)) is not None
+
+    def put(self, user_id: int, friend_id: int) -> None:
+        self.store((user_id, friend_id), True, self.now() + self.ttl)
+
+    def invalidate(self, friend_id: int, user_ids: Iterable[int]) -> None:
+        self.discard((user_id, friend_id) for user_id in user_ids)
+
+    async def broadcast_invalidation(
+        self, friend_id: int, user_ids: Iterable[int]
+    ) -> None:
+        """이 워커에서 바로 지우고 다른 워커에도 삭제를 알립니다."""
+        user_ids = list(user_ids)
+        self.invalidate(friend_id, user_ids)
+        try:
+            await get_redis().publish(
+                INVALIDATION_CHANNEL,
+                f"{friend_id}:{','.join(str(user_id) for user_id in user_ids)}",
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Friendship invalidation publish failed: {e}")
+
+    def apply(self, data: str) -> None:
+        """다른 워커에서 전파된 삭제를 반영합니다."""
+        friend_id, user_ids = data.split(":", 1)
+        self.invalidate(
+            int(friend_id), [int(user_id) for user_id in user_ids.split(",") if user_id]
+        )
+
+
+friendship_cache = FriendshipCache(
+    maxsize=settings.FRIENDSHIP_CACHE_MAXSIZE, ttl=settings.FRIENDSHIP_CACHE_TTL
+)
+# 다른 워커의 친구 삭제를 공유 구독 연결로 받아 반영
+pubsub_listener.add_handler(INVALIDATION_CHANNEL, friendship_cache.apply)
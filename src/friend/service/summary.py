@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database.orm import upsert_insert
+from src.friend.models import Friend, FriendSummary
+from src.user.models import User
+
+# 요약 행은 모두 호출자의 트랜잭션 안에서 갱신하고 커밋은 호출자가 합니다.
+
+
+async def create_friend_summaries(session: AsyncSession, friend: Friend) -> None:
+    """친구 수락 시 양쪽 사용자의 요약 행을 만듭니다. (중복 수락은 덮어쓰기)"""
+    users = {
+        user.id: user
+        for user in (
+            await session.execute(
+                select(User).where(User.id.in_([friend.user_id1, friend.user_id2]))
+            )
+        ).scalars()
+    }
+    insert_stmt = upsert_insert(session)
+    for user_id, other_id in (
+        (friend.user_id1, friend.user_id2),
+        (friend.user_id2, friend.user_id1),
+    ):
+        other = users[other_id]  # type: ignore
+        profile = {
+            "friend_nickname": other.nickname,
+            "friend_profile_img": other.img_url,
+            "friend_profile_thumbnail_key": other.img_thumbnail_key,
+            "friend_introduce": other.introduce,
+        }
+        await session.execute(
+            insert_stmt(FriendSummary)
+            .values(
+                user_id=user_id,
+                friend_id=friend.id,
+                friend_user_id=other_id,
+                ex_diary_cnt=friend.ex_diary_cnt or 0,
+                last_ex_date=friend.last_ex_date,
+                created_at=friend.created_at,
+                **profile,
+            )
+            .on_conflict_do_update(
+                index_elements=[FriendSummary.user_id, FriendSummary.friend_id],
+                set_=profile,
+            )
+        )
+
+
+async def delete_friend_summaries(session: AsyncSession, friend_id: int) -> None:
+    await session.execute(
+        delete(FriendSummary).where(FriendSummary.friend_id == friend_id)
+    )
+
+
+async def record_latest_message(
+    session: AsyncSession,
+    friend_id: int,
+    message: Optional[str],
+    created_at: Optional[datetime] = None,
+) -> None:
+    """채팅 메시지 저장 시 양쪽 요약 행의 마지막 메시지를 갱신합니다."""
+    await session.execute(
+        update(FriendSummary)
+        .where(FriendSummary.friend_id == friend_id)
+        .values(latest_message=message, latest_message_at=created_at or datetime.now())
+    )
+
+
+async def sync_exchange_stats(session: AsyncSession, friend_id: int) -> None:
+    """교환일기 작성/삭제 후 friends 테이블의 교환 횟수와 마지막 교환일을 복사합니다."""
+    await session.execute(
+        update(FriendSummary)
+        .where(FriendSummary.friend_id == friend_id)
+        .values(
+            ex_diary_cnt=select(Friend.ex_diary_cnt)
+            .where(Friend.id == friend_id)
+            .scalar_subquery(),
+            last_ex_date=select(Friend.last_ex_date)
+            .where(Friend.id == friend_id)
+            .scalar_subquery(),
+        )
+    )
+
+
+async def update_friend_profile(session: AsyncSession, user: User) -> None:
+    """프로필 수정 시 이 사용자를 친구로 가진 요약 행들을 갱신합니다."""
+    await session.execute(
+        update(FriendSummary)
+        .where(FriendSummary.friend_user_id == user.id)
+        .values(
+            friend_nickname=user.nickname,
+            friend_profile_img=user.img_url,
+            friend_profile_thumbnail_key=user.img_thumbnail_key,
+            friend_introduce=user.introduce,
+        )
+    )
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+
+from celery import shared_task
+
+from src.config import Settings
+from src.config.database.connection import AsyncSessionFactory, async_engine
+from src.friend.service.exchange import reconcile_exchange_counts
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_ex_diary_counts_task() -> int:
+    # 배치마다 별도 트랜잭션으로 커밋해서 긴 잠금을 피함
+    logger.info("Reconciling ex_diary counts started...")
+    fixed, after_id = 0, 0
+    while True:
+        async with AsyncSessionFactory() as session:
+            async with session.begin():
+                count, next_id = await reconcile_exchange_counts(
+                    session, after_id, settings.EX_DIARY_RECONCILE_BATCH_SIZE
+                )
+        fixed += count
+        if next_id is None:
+            break
+        after_id = next_id
+    logger.info(f"Ex_diary counts reconciled: {fixed} friends fixed")
+    return fixed
+
+
+@shared_task(name="tasks.reconcile_ex_diary_counts")  # type: ignore
+def reconcile_ex_diary_counts() -> int:
+    async def run() -> int:
+        try:
+            return await reconcile_ex_diary_counts_task()
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이전 루프에 묶인 연결을 남기지 않음
+            await async_engine.dispose()
+
+    return asyncio.run(run())
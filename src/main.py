@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from celery import Celery
 from fastapi import FastAPI
@@ -9,9 +9,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 
 from src.config import Settings
+from src.config.cache import (
+    close_redis,
+    ping_redis,
+    pubsub_listener,
+    redis_pool_stats,
+    redis_url,
+)
 
 # 데이터베이스 관련 모듈
-from src.config.database.connection import async_engine
+from src.config.database.connection import async_engine, pool_stats
+from src.config.storage import close_storage, get_executor, get_storage
 from src.diary.api.router import router as diary_router
 from src.ex_diary.api.router import router as ex_diary_router
 from src.friend.api.router import router as friend_router
@@ -19,22 +27,21 @@ from src.notification.api.router import router as notification_router
 from src.notification.service.websocket import router as w_router
 
 # 라우터 import
+from src.upload.api.router import router as upload_router
 from src.user.api.router import router as user_router
 from src.user.models import Base
+from src.user.service.hashing import password_hasher
 from src.websocket.api.router import router as websocket_router
 
 logger = logging.getLogger(__name__)
 
 settings = Settings()
 
-REDIS_HOST = settings.REDIS_HOST
-REDIS_PORT = settings.REDIS_PORT
-
-# Celery 앱 초기화
+# Celery 앱 초기화 (API 와 같은 Redis 설정 사용)
 celery_app = Celery(
     "tasks",
-    broker="redis://{REDIS_HOST}:{REDIS_PORT}}/0",
-    backend="redis://{REDIS_HOST}:{REDIS_PORT}}/0",
+    broker=redis_url(),
+    backend=redis_url(),
 )
 celery_app.config_from_object("src.config.celery_config")  # Celery 설정 로드
 
@@ -45,8 +52,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # bcrypt 프로세스 풀 시작
+    password_hasher.start()
+    # 로그아웃 토큰 필터 / 친구 관계 캐시 동기화 (Redis pub/sub, 라우터 import 시 채널 등록)
+    pubsub_listener.start()
+    # 오브젝트 스토리지 클라이언트와 업로드 스레드 풀 (워커 전체가 공유)
+    get_storage()
+    get_executor()
+
     yield
     # 앱 종료 시 추가 정리 작업 (필요한 경우)
+    await pubsub_listener.stop()
+    password_hasher.shutdown()
+    close_storage()
+    await close_redis()
+    await async_engine.dispose()
 
 
 # FastAPI 앱 생성 with lifespan
@@ -73,6 +93,7 @@ app.include_router(user_router)
 app.include_router(friend_router)
 app.include_router(diary_router)
 app.include_router(ex_diary_router)
+app.include_router(upload_router)
 app.include_router(notification_router)
 app.include_router(websocket_router)
 app.include_router(w_router)
@@ -85,6 +106,14 @@ async def root() -> dict[str, str]:
     return {"message": "Hello World"}
 
 
+@app.get("/health")
+async def health() -> dict[str, Any]:
+    return {
+        "database": {"pool": pool_stats()},
+        "redis": {"ok": await ping_redis(), "pool": redis_pool_stats()},
+    }
+
+
 # 루트 로거 설정
 # logging.basicConfig(
 #     level=logging.INFO,  # INFO 이상의 모든 로그 기록
@@ -14,6 +14,7 @@ from src.notification.schema.response import (
 )
 from src.notification.service.websocket import manager
 from src.user.schema.response import BasicResponse
+from src.user.service.authentication import authenticate
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 settings = Settings()
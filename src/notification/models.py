@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.config.database.orm import Base
@@ -17,4 +17,9 @@ class Notification(Base):
     read_at = Column(DateTime, default=datetime.now())  # 읽은 시간
     created_at = Column(DateTime, default=datetime.now())  # 알림 보낸 시간
 
+    # 사용자별 알림 목록 (최신순)
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+    )
+
     user = relationship("User", back_populates="notifications")  # type: ignore
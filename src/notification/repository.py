@@ -3,6 +3,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import commit
 from src.notification.models import Notification
 
 
@@ -12,8 +13,7 @@ class NotificationRepository:
 
     async def create_notification(self, notification: Notification) -> Notification:
         self.session.add(notification)
-        await self.session.commit()
-        await self.session.refresh(notification)
+        await commit(self.session)
         return notification
 
     async def mark_as_read(self, notification_id: int) -> bool:
@@ -24,7 +24,7 @@ class NotificationRepository:
 
         if notification:
             notification.is_read = True
-            await self.session.commit()
+            await commit(self.session)
             return True
         else:
             return False
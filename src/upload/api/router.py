@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import commit
+from src.config.storage import presigned_post
+from src.upload.schema.request import PresignRequest
+from src.upload.schema.response import PresignResponse
+from src.upload.service.uploads import issue_upload_key
+from src.user.service.authentication import authenticate
+
+router = APIRouter(prefix="/uploads", tags=["Upload"])
+settings = Settings()
+
+
+@router.post(
+    path="/presign",
+    summary="이미지 업로드용 presigned POST 발급",
+    response_model=PresignResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def presign_upload(
+    body: PresignRequest,
+    user_id: int = Depends(authenticate),
+    session: AsyncSession = Depends(get_async_session),
+) -> PresignResponse:
+    # 클라이언트는 url 에 fields + file 을 POST 한 뒤, key 를 작성/수정 API 의 image_key 로 전달
+    key = await issue_upload_key(session, body.kind, user_id, body.content_type)
+    await commit(session)
+    post = presigned_post(key, body.content_type)
+    return PresignResponse(
+        key=key,
+        url=post["url"],
+        fields=post["fields"],
+        expires_in=settings.UPLOAD_PRESIGN_EXPIRES,
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, text
+
+from src.config.database.orm import Base
+
+
+class ImageBlob(Base):
+    """
+    스토리지에 저장된 이미지 한 개 (객체 키 기준).
+    diaries / ex_diaries / users 의 img_key 가 이 이미지를 참조하는 수를 셉니다.
+    참조가 0 이 된 이미지는 정리 작업(tasks.purge_unused_images)이 스토리지에서 삭제합니다.
+    """
+
+    __tablename__ = "image_blobs"
+
+    key = Column(String, primary_key=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+    # 썸네일/WebP 변환 이미지가 이미 만들어졌는지 (같은 이미지를 다시 변환하지 않음)
+    has_variants = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.now)
+
+    __table_args__ = (
+        # 정리 작업 대상 (참조가 없는 이미지)
+        Index(
+            "ix_image_blobs_unused",
+            "key",
+            postgresql_where=text("ref_count = 0"),
+            sqlite_where=text("ref_count = 0"),
+        ),
+    )
+
+
+__all__ = ["ImageBlob", "Base"]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+from src.upload.service.uploads import UploadKind
+
+
+class PresignRequest(BaseModel):
+    kind: UploadKind  # diary / ex_diary / profile
+    content_type: str  # 업로드할 이미지의 Content-Type (예: image/png)
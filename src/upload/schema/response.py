@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class PresignResponse(BaseModel):
+    key: str  # 업로드 후 작성/수정 API 에 image_key 로 전달
+    url: str  # multipart/form-data 로 POST 할 주소
+    fields: dict[str, str]  # 파일과 함께 그대로 보내야 하는 폼 필드
+    expires_in: int
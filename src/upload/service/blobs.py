@@ -0,0 +1,138 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import IO, Optional
+
+from sqlalchemy import case, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.config.database.orm import upsert_insert
+from src.config.storage import IMAGE_EXTENSIONS, delete_images, file_digest, upload_file
+from src.upload.models import ImageBlob
+
+settings = Settings()
+
+# 참조 수는 모두 호출자의 트랜잭션 안에서 갱신합니다.
+# 이미지를 가리키는 행(일기/교환일기/프로필)과 같은 트랜잭션에서 커밋되어야 합니다.
+
+
+def content_key(digest: str, content_type: str) -> str:
+    # 같은 내용이면 같은 키 (누가 올렸든 한 번만 저장)
+    return f"images/{digest}{IMAGE_EXTENSIONS.get(content_type, '')}"
+
+
+async def add_pending_upload(session: AsyncSession, key: str) -> bool:
+    """
+    업로드할 키를 참조 0 으로 기록하고, 새로 기록했으면 True 를 반환합니다.
+    끝내 참조되지 않은 업로드(요청 실패, 작성 안 한 presigned 업로드)도 정리 작업이 스토리지에서 삭제합니다.
+    """
+    insert_stmt = upsert_insert(session)
+    result = await session.execute(
+        insert_stmt(ImageBlob)
+        .values(key=key, ref_count=0, has_variants=False, created_at=datetime.now())
+        .on_conflict_do_nothing(index_elements=[ImageBlob.key])
+        .returning(ImageBlob.key)
+    )
+    return result.scalar_one_or_none() is not None
+
+
+def unused_before() -> datetime:
+    # presigned URL 이 만료된 뒤 여유 시간까지 지난 행만 정리 (업로드 중이거나 곧 참조될 이미지는 남김)
+    return datetime.now() - timedelta(
+        seconds=settings.UPLOAD_PRESIGN_EXPIRES + settings.UPLOAD_PENDING_GRACE
+    )
+
+
+async def add_image_ref(session: AsyncSession, key: str) -> int:
+    """이미지 참조를 하나 늘리고 늘어난 참조 수를 반환합니다."""
+    insert_stmt = upsert_insert(session)
+    result = await session.execute(
+        insert_stmt(ImageBlob)
+        .values(key=key, ref_count=1, has_variants=False)
+        .on_conflict_do_update(
+            index_elements=[ImageBlob.key],
+            set_={"ref_count": ImageBlob.ref_count + 1},
+        )
+        .returning(ImageBlob.ref_count)
+    )
+    return result.scalar_one()  # type: ignore
+
+
+async def release_image(session: AsyncSession, key: Optional[str]) -> None:
+    """
+    이미지 참조를 하나 줄입니다. 스토리지에서 바로 지우지 않고,
+    참조가 0 이 된 이미지는 정리 작업이 삭제합니다.
+    """
+    await release_images(session, [key])
+
+
+async def release_images(session: AsyncSession, keys: list[Optional[str]]) -> None:
+    """여러 행을 한꺼번에 지울 때 이미지별 참조 수를 UPDATE 한 번으로 해제합니다."""
+    counts = Counter(key for key in keys if key)
+    if not counts:
+        return
+    released = case(counts, value=ImageBlob.key)
+    await session.execute(
+        update(ImageBlob)
+        .where(ImageBlob.key.in_(counts), ImageBlob.ref_count > 0)
+        .values(
+            ref_count=case(
+                (ImageBlob.ref_count > released, ImageBlob.ref_count - released),
+                else_=0,
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def store_image(
+    session: AsyncSession, fileobj: IO[bytes], content_type: str
+) -> str:
+    """
+    파일을 내용의 SHA-256 키로 저장하고 참조를 하나 늘린 뒤 객체 키를 반환합니다.
+    같은 내용의 이미지가 이미 있으면 업로드하지 않습니다.
+
+    확인과 업로드는 요청 트랜잭션 밖에서 합니다. (업로드 동안 DB 연결을 트랜잭션에 묶어 두지 않음)
+    새 키는 별도의 짧은 트랜잭션에서 참조 0 으로 먼저 커밋하므로, 요청이 롤백돼도 정리 작업이 객체를 지웁니다.
+    참조 증가만 호출자의 트랜잭션에서 합니다.
+    """
+    digest = await file_digest(fileobj)
+    key = content_key(digest, content_type)
+
+    async with AsyncSession(session.bind) as pending:
+        exists = await pending.scalar(select(ImageBlob.key).where(ImageBlob.key == key))
+        created = exists is None and await add_pending_upload(pending, key)
+        await pending.commit()
+    if created:
+        await upload_file(fileobj, key, content_type=content_type)
+
+    # 참조가 1 이면 확인 이후 정리 작업이 지웠을 수 있으므로 다시 업로드
+    # (정리 작업은 스토리지 삭제를 마친 뒤 행 삭제를 커밋하므로 이후 업로드는 지워지지 않음)
+    if await add_image_ref(session, key) == 1 and not created:
+        fileobj.seek(0)
+        await upload_file(fileobj, key, content_type=content_type)
+    return key
+
+
+async def purge_image_batch(session: AsyncSession, batch_size: int = 300) -> int:
+    """
+    참조가 0 인 이미지를 batch_size 개씩 스토리지에서 삭제합니다. 삭제한 수를 반환합니다.
+    만들어진 지 얼마 안 된 행(unused_before 이후)은 아직 업로드/참조 중일 수 있으므로 건너뜁니다.
+    행을 잠근 채로 스토리지에서 먼저 지우고 커밋하므로, 그 사이에 같은 이미지를 참조하려는
+    요청은 커밋을 기다렸다가 새 행을 만들고 다시 업로드합니다.
+    """
+    unused = (
+        select(ImageBlob.key)
+        .where(ImageBlob.ref_count == 0, ImageBlob.created_at < unused_before())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(
+        delete(ImageBlob)
+        .where(ImageBlob.key.in_(unused), ImageBlob.ref_count == 0)
+        .returning(ImageBlob.key)
+        .execution_options(synchronize_session=False)
+    )
+    keys = [key for key in result.scalars() if key]
+    await delete_images(keys)
+    return len(keys)
@@ -0,0 +1,112 @@
+import io
+import logging
+from typing import Any, Optional
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.config.storage import IMAGE_VARIANTS, read_file, upload_file, variant_key
+from src.diary.models import Diary
+from src.ex_diary.models import ExDiary
+from src.friend.models import FriendSummary
+from src.upload.models import ImageBlob
+from src.upload.service.uploads import UploadKind
+from src.user.models import User
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+# 이미지를 가진 테이블 (모두 img_url, img_key, img_thumbnail_key, img_webp_key 컬럼을 가짐)
+IMAGE_MODELS: dict[str, Any] = {
+    "diary": Diary,
+    "ex_diary": ExDiary,
+    "profile": User,
+}
+
+
+def render_variants(data: bytes) -> dict[str, bytes]:
+    """
+    원본 이미지로 변환 이미지를 만듭니다. (thumb: 목록용 썸네일, display: 상세 화면용)
+    EXIF 방향대로 회전한 뒤 EXIF 없이 WebP 로 저장하므로 촬영 위치 등의 메타데이터가 남지 않습니다.
+    """
+    sizes = {
+        "thumb": settings.IMAGE_THUMBNAIL_SIZE,
+        "display": settings.IMAGE_WEBP_SIZE,
+    }
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original) or original
+        if image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        variants: dict[str, bytes] = {}
+        for variant, size in sizes.items():
+            resized = image.copy()
+            resized.thumbnail((size, size))
+            buffer = io.BytesIO()
+            resized.save(buffer, "WEBP", quality=settings.IMAGE_WEBP_QUALITY)
+            variants[variant] = buffer.getvalue()
+    return variants
+
+
+async def create_image_variants(
+    session: AsyncSession, kind: UploadKind, row_id: int
+) -> bool:
+    """
+    행의 원본 이미지로 변환 이미지를 만들어 원본 옆에 저장하고 키를 기록합니다.
+    처리 중에 이미지가 바뀌었으면 기록하지 않습니다. 기록했으면 True 를 반환합니다.
+    """
+    model = IMAGE_MODELS[kind]
+    row = (
+        await session.execute(
+            select(model.img_url, model.img_key).where(model.id == row_id)
+        )
+    ).one_or_none()
+    if row is None or row.img_key is None:
+        return False
+    img_url: Optional[str] = row.img_url
+    key: str = row.img_key
+
+    keys = {variant: variant_key(key, variant) for variant in IMAGE_VARIANTS}
+    # 같은 내용의 이미지를 다른 행에서 이미 변환했으면 키만 기록
+    if not await session.scalar(
+        select(ImageBlob.has_variants).where(ImageBlob.key == key)
+    ):
+        data = await read_file(key)
+        try:
+            variants = render_variants(data)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            # Pillow 가 열지 못하는 형식(HEIC 등)은 원본을 그대로 사용
+            logger.warning(f"Image variants skipped: {kind} {row_id}, {str(e)}")
+            return False
+
+        for variant, body in variants.items():
+            await upload_file(
+                io.BytesIO(body), keys[variant], content_type="image/webp"
+            )
+        await session.execute(
+            update(ImageBlob).where(ImageBlob.key == key).values(has_variants=True)
+        )
+
+    result = await session.execute(
+        update(model)
+        .where(model.id == row_id, model.img_key == key)
+        .values(img_thumbnail_key=keys["thumb"], img_webp_key=keys["display"])
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        return False
+
+    if kind == "profile":
+        # 친구 목록에 보이는 프로필 사진도 썸네일로
+        await session.execute(
+            update(FriendSummary)
+            .where(
+                FriendSummary.friend_user_id == row_id,
+                FriendSummary.friend_profile_img == img_url,
+            )
+            .values(friend_profile_thumbnail_key=keys["thumb"])
+        )
+    return True
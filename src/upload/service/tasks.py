@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from celery import shared_task
+
+from src.config import Settings
+from src.config.database.connection import AsyncSessionFactory, async_engine
+from src.upload.service.blobs import purge_image_batch
+from src.upload.service.images import create_image_variants
+from src.upload.service.uploads import UploadKind
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+async def process_image_task(kind: UploadKind, row_id: int) -> bool:
+    async with AsyncSessionFactory() as session:
+        async with session.begin():
+            processed = await create_image_variants(session, kind, row_id)
+    logger.info(f"Image variants for {kind} {row_id}: {processed}")
+    return processed
+
+
+@shared_task(name="tasks.process_image")  # type: ignore
+def process_image(kind: UploadKind, row_id: int) -> bool:
+    async def run() -> bool:
+        try:
+            return await process_image_task(kind, row_id)
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이전 루프에 묶인 연결을 남기지 않음
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def enqueue_process_image(kind: UploadKind, row_id: int) -> None:
+    """
+    변환 작업을 큐에 넣습니다. 브로커 전송은 스레드에서 해서 응답을 막지 않고,
+    실패해도 원본 이미지로 서비스되므로 요청은 실패시키지 않습니다.
+    """
+    try:
+        await asyncio.to_thread(process_image.delay, kind, row_id)
+    except Exception as e:
+        logger.warning(f"Failed to enqueue image processing: {kind} {row_id}, {e}")
+
+
+async def purge_unused_images_task() -> int:
+    # 배치마다 별도 트랜잭션 (스토리지 삭제가 끝난 뒤 커밋)
+    logger.info("Purging unused images started...")
+    purged = 0
+    while True:
+        async with AsyncSessionFactory() as session:
+            async with session.begin():
+                count = await purge_image_batch(
+                    session, settings.IMAGE_PURGE_BATCH_SIZE
+                )
+        purged += count
+        if count < settings.IMAGE_PURGE_BATCH_SIZE:
+            break
+    logger.info(f"Unused images purged: {purged}")
+    return purged
+
+
+@shared_task(name="tasks.purge_unused_images")  # type: ignore
+def purge_unused_images() -> int:
+    async def run() -> int:
+        try:
+            return await purge_unused_images_task()
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(run())
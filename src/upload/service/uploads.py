@@ -0,0 +1,101 @@
+import os
+import uuid
+from typing import Literal
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import Settings
+from src.config.storage import (
+    IMAGE_EXTENSIONS,
+    IMAGE_SIGNATURES,
+    delete_key,
+    image_type,
+    read_head,
+)
+from src.upload.service.blobs import add_image_ref, add_pending_upload
+
+settings = Settings()
+
+UploadKind = Literal["diary", "ex_diary", "profile"]
+
+# 업로드 종류별 저장 경로
+UPLOAD_PREFIXES: dict[str, str] = {
+    "diary": "diaries",
+    "ex_diary": "ex_diaries",
+    "profile": "profiles",
+}
+
+ALLOWED_CONTENT_TYPES = {content_type for _, content_type in IMAGE_SIGNATURES}
+
+# 키의 확장자로 발급할 때 서명한 Content-Type 을 알 수 있음
+EXTENSION_CONTENT_TYPES = {
+    extension: content_type for content_type, extension in IMAGE_EXTENSIONS.items()
+}
+
+
+def key_prefix(kind: UploadKind, user_id: int) -> str:
+    # 키에 사용자 id 를 넣어서 다른 사용자가 올린 이미지를 가져다 쓰지 못하게 함
+    return f"{UPLOAD_PREFIXES[kind]}/{kind}_{user_id}_"
+
+
+def new_upload_key(kind: UploadKind, user_id: int, content_type: str) -> str:
+    """서버가 정하는 업로드 키. 지원하지 않는 Content-Type 이면 415 를 반환합니다."""
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="지원하지 않는 이미지 형식입니다.",
+        )
+    extension = IMAGE_EXTENSIONS.get(content_type, "")
+    return f"{key_prefix(kind, user_id)}{uuid.uuid4().hex}{extension}"
+
+
+async def issue_upload_key(
+    session: AsyncSession, kind: UploadKind, user_id: int, content_type: str
+) -> str:
+    """업로드 키를 만들고 참조 0 인 이미지로 기록합니다. (호출자가 커밋)"""
+    key = new_upload_key(kind, user_id, content_type)
+    await add_pending_upload(session, key)
+    return key
+
+
+async def claim_uploaded_image(
+    session: AsyncSession, kind: UploadKind, user_id: int, key: str
+) -> str:
+    """
+    presigned POST 로 올라온 이미지를 확인하고 참조를 하나 늘린 뒤 객체 키를 반환합니다.
+    본인의 키인지, 실제로 업로드됐는지 확인하고 앞 16바이트로 크기/형식을 검사합니다.
+    실제 형식이 발급할 때의 Content-Type 과 다르면 거부합니다.
+    검사에 실패한 객체는 삭제합니다.
+    """
+    prefix = key_prefix(kind, user_id)
+    if not key.startswith(prefix) or "/" in key[len(prefix) :]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 이미지 키입니다.",
+        )
+
+    head = await read_head(key)
+    if head is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="업로드된 이미지를 찾을 수 없습니다.",
+        )
+
+    size, data = head
+    if size > settings.UPLOAD_MAX_SIZE:
+        await delete_key(key)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"이미지는 {settings.UPLOAD_MAX_SIZE // (1024 * 1024)}MB 이하만 업로드할 수 있습니다.",
+        )
+    extension = os.path.splitext(key)[1]
+    if image_type(data) != EXTENSION_CONTENT_TYPES.get(extension):
+        await delete_key(key)
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="지원하지 않는 이미지 형식입니다.",
+        )
+
+    await add_image_ref(session, key)
+    return key
@@ -1,8 +1,7 @@
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Dict, Optional, Union
-from urllib.parse import urlparse
 
-import boto3
 import httpx
 import jwt
 from botocore.exceptions import ClientError
@@ -26,6 +25,11 @@ from starlette.responses import RedirectResponse
 from blacklist import blacklist_token
 from src.config import Settings
 from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import get_unit_of_work, when_committed
+from src.config.storage import image_size, public_url, sniff_image_type
+from src.upload.service.blobs import store_image
+from src.upload.service.tasks import enqueue_process_image
+from src.upload.service.uploads import claim_uploaded_image
 from src.user.models import User
 from src.user.repository import UserNotFoundException, UserRepository
 from src.user.schema.request import CreateRequestBody, LoginRequest, UserEmailRequest
@@ -44,11 +48,11 @@ from src.user.service.authentication import (
     authenticate,
     create_verification_token,
     decode_access_token,
+    decode_refresh_token,
     encode_access_token,
     encode_refresh_token,
-    hash_password,
-    verify_password,
 )
+from src.user.service.hashing import password_hasher
 from src.user.service.smtp import send_email
 
 settings = Settings()
@@ -71,7 +75,7 @@ async def create_user(
         name=user_data.name,
         nickname=user_data.nickname,
         email=user_data.email,
-        password=hash_password(user_data.password),  # 비밀번호 해싱 처리
+        password=await password_hasher.hash(user_data.password),  # 비밀번호 해싱 처리
         is_active=False,
         provider="",
     )
@@ -195,7 +199,7 @@ async def login_handler(
 
     if user is not None and user.id is not None:
         if user.is_active:
-            if verify_password(
+            if await password_hasher.verify(
                 plain_password=login_data.password, hashed_password=user.password
             ):
                 refresh_token = encode_refresh_token(user.id)
@@ -271,17 +275,20 @@ async def logout_handler(request: Request, response: Response) -> BasicResponse:
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
             )
 
-        # 토큰을 블랙리스트에 추가
-        if access_token:
-            await blacklist_token(access_token)
+        # 토큰을 만료 시각까지 블랙리스트에 추가
+        await blacklist_token(access_token, expires_at=payload["exp"])
         if refresh_token:
-            await blacklist_token(refresh_token)
+            try:
+                refresh_payload = decode_refresh_token(refresh_token)
+                await blacklist_token(refresh_token, expires_at=refresh_payload["exp"])
+            except jwt.PyJWTError:
+                pass  # 이미 만료되었거나 유효하지 않은 리프레시 토큰은 사용할 수 없음
         # 클라이언트의 쿠키 삭제
         response.delete_cookie(key="access_token")
         response.delete_cookie(key="refresh_token")
         return BasicResponse(message="로그아웃 되었습니다.", status="success")
 
-    except JWTError:
+    except (JWTError, jwt.PyJWTError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
@@ -435,6 +442,7 @@ async def callback(
     summary="회원 정보 수정",
     status_code=status.HTTP_200_OK,
     response_model=UserMeResponse,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def update_user(
     user_id: int = Depends(authenticate),  # 인증된 사용자 ID
@@ -442,71 +450,41 @@ async def update_user(
     password: str = Form(...),
     introduce: str = Form(...),
     image: Union[UploadFile, str] = File(default=None),
+    image_key: Optional[str] = Form(
+        default=None, description="/uploads/presign 으로 업로드한 이미지 키"
+    ),
     session: AsyncSession = Depends(get_async_session),
 ) -> UserMeResponse | dict[str, str]:
     user_repo = UserRepository(session)  # UserRepository 인스턴스 생성
 
     user = await user_repo.get_user_by_id(user_id)
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-    img_url: Optional[str] = None
-    # 이미지 업로드 처리
-    if image and image.filename:  # type: ignore
-        # 유저의 이전 프로필 사진이 s3에 있다면 삭제
-        if user and user.img_url:
-            parsed_url = urlparse(user.img_url)
-            s3_key = parsed_url.path.lstrip("/")
-            try:
-                # S3에서 객체 삭제
-                s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-                print("Previous image deleted successfully.")
-            except s3_client.exceptions.NoSuchKey:
-                print("Previous image not found.")
-
-        try:
-            # 파일 포인터 초기화
-            image.file.seek(0)  # type: ignore
-
-            # 고유한 파일명 생성
-            image_filename = (
-                f"profile_{user_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            )
-
-            # S3에 업로드
-            s3_key = f"profiles/{image_filename}"
-            s3_client.upload_fileobj(
-                image.file,  # type: ignore
-                settings.S3_BUCKET_NAME,
-                s3_key,
-                ExtraArgs={"ContentType": image.content_type},  # type: ignore
-            )
-
-            # 공개 URL 생성
-            # img_url = f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-            img_url = f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/{s3_key}"
-
-        except ClientError as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"S3 업로드 오류: {str(e)}",
-            )
+    img_key: Optional[str] = None
+    try:
+        # presigned POST 로 스토리지에 직접 올린 이미지 키를 우선 사용
+        if image_key:
+            img_key = await claim_uploaded_image(session, "profile", user_id, image_key)
+        # (이전 방식) multipart 로 받은 이미지를 서버에서 업로드
+        elif image and image.filename:  # type: ignore
+            # 새 이미지를 먼저 검사 (최대 크기 초과 413, 이미지가 아니면 415)
+            image_size(image.file)  # type: ignore
+            content_type = sniff_image_type(image.file)  # type: ignore
+
+            # 내용 해시 키로 저장 (같은 이미지는 다시 올리지 않음)
+            img_key = await store_image(session, image.file, content_type)  # type: ignore
+
+    except ClientError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"S3 업로드 오류: {str(e)}",
+        )
 
-    # 사용자 데이터 업데이트 (img_url 포함)
+    # 사용자 데이터 업데이트 (img_url 포함, 이전 프로필 사진의 참조는 같은 트랜잭션에서 해제)
     user_data_dict = {
         "nickname": nickname,
         "password": password,
         "introduce": introduce,
-        "img_url": img_url,  # S3에서 받은 URL 또는 None
+        "img_url": public_url(img_key) if img_key else None,
+        "img_key": img_key,
     }
 
     try:
@@ -517,6 +495,12 @@ async def update_user(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    # 프로필 썸네일/WebP 변환은 Celery 워커에서 처리 (커밋된 뒤에 등록)
+    if img_key:
+        await when_committed(
+            session, partial(enqueue_process_image, "profile", user_id)
+        )
+
     return UserMeResponse(
         id=updated_user.id,
         nickname=updated_user.nickname,
@@ -529,6 +513,7 @@ async def update_user(
     summary="회원 탈퇴(Soft Delete)",
     status_code=status.HTTP_200_OK,
     response_model=None,
+    dependencies=[Depends(get_unit_of_work)],
 )
 async def delete_user(
     user_id: int = Depends(authenticate),
@@ -570,6 +555,8 @@ async def recovery_possible(
         raise HTTPException(status_code=403, detail="Account is active")
     if user.deleted_at and user.deleted_at < datetime.now() - timedelta(days=7):
         raise HTTPException(status_code=403, detail="Deleted after 7 days")
+    if await user_repo.is_being_purged(user.id):
+        raise HTTPException(status_code=403, detail="Account is being deleted")
 
     token = create_verification_token(user.email)
     # 인증 링크 생성
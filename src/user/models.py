@@ -2,7 +2,7 @@ import re
 from datetime import datetime
 from typing import Optional, Type, TypeVar
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.config.database.orm import Base
@@ -24,6 +24,11 @@ class User(Base):
     introduce: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     password: Mapped[str] = mapped_column(String, nullable=False)
     img_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # 스토리지 객체 키 (URL 을 파싱하지 않고 삭제/변환에 사용)
+    img_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    # 백그라운드 작업이 만든 변환 이미지 키 (만들어지기 전에는 원본 사용)
+    img_thumbnail_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    img_webp_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     modified_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.now, onupdate=datetime.now
@@ -83,4 +88,23 @@ class User(Base):
         )
 
 
-__all__ = ["User", "Base"]
+class AccountPurge(Base):
+    """
+    탈퇴 회원 데이터 삭제의 진행 상황 (체크포인트).
+    삭제는 단계(stage)별로 나눠 커밋하므로, 작업이 중간에 실패하면 다음 실행이 이 단계부터 이어서 진행합니다.
+    회원 행이 삭제되면 함께 삭제됩니다.
+    """
+
+    __tablename__ = "account_purges"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    stage: Mapped[str] = mapped_column(String, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
+    )
+
+
+__all__ = ["User", "AccountPurge", "Base"]
@@ -9,11 +9,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.config.database.connection import get_async_session
+from src.config.database.unit_of_work import commit
+from src.friend.service.summary import update_friend_profile
+from src.upload.service.blobs import release_image
 
-from .models import User
+from .models import AccountPurge, User
 from .schema.request import UpdateRequestBody
 from .schema.response import SocialUser
-from .service.authentication import generate_password, hash_password
+from .service.authentication import generate_password
+from .service.hashing import password_hasher
 
 
 class UserNotFoundException(Exception):
@@ -27,27 +31,24 @@ class UserRepository:
     # 회원 가입 유저 생성
     async def create_user(self, user: User) -> User:
 
-        # 이메일 중복 확인
-        existing_email = await self.session.execute(
-            select(User).filter(User.email == user.email)
+        # 이메일 / 닉네임 중복 확인 (한 번의 쿼리)
+        existing = await self.session.execute(
+            select(User.email, User.nickname).filter(
+                or_(User.email == user.email, User.nickname == user.nickname)
+            )
         )
-        if existing_email.scalars().first():
+        rows = existing.all()
+        if any(row.email == user.email for row in rows):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Email already registered"
             )
-
-        # 닉네임 중복 확인
-        existing_nickname = await self.session.execute(
-            select(User).filter(User.nickname == user.nickname)
-        )
-        if existing_nickname.scalars().first():
+        if rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Nickname already taken"
             )
 
         self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        await commit(self.session)
         return user
 
     async def create_user_from_social(self, social_user: SocialUser) -> int:
@@ -60,8 +61,7 @@ class UserRepository:
             provider=social_user.provider,
         )
         self.session.add(new_user)
-        await self.session.commit()
-        await self.session.refresh(new_user)
+        await commit(self.session)
 
         return new_user.id
 
@@ -86,7 +86,7 @@ class UserRepository:
         if user is None:
             raise UserNotFoundException(f"User with id {user_id} not found")
         user.is_active = True
-        await self.session.commit()
+        await commit(self.session)
 
     # 사용자 정보 수정
     async def update_user(self, user_id: int, user_data: dict[str, Any]) -> User:
@@ -97,7 +97,16 @@ class UserRepository:
         # 사용자 정보 업데이트
         user.name = user_data.get("name", user.name)
         user.nickname = user_data.get("nickname", user.nickname)
-        user.img_url = user_data.get("img_url", user.img_url)
+        img_url = user_data.get("img_url", user.img_url)
+        if "img_key" in user_data:
+            # 새 이미지의 참조는 호출자가 늘렸으므로 이전 이미지의 참조를 해제 (같은 이미지여도)
+            await release_image(self.session, user.img_key)
+            user.img_key = user_data["img_key"]
+        if img_url != user.img_url:
+            # 새 이미지의 변환 이미지는 백그라운드 작업이 만들 때까지 원본 사용
+            user.img_thumbnail_key = None
+            user.img_webp_key = None
+        user.img_url = img_url
         user.introduce = user_data.get("introduce", user.introduce)
         user.is_active = user_data.get("is_active", user.is_active)
 
@@ -106,11 +115,14 @@ class UserRepository:
 
         # 비밀번호 처리
         if "password" in user_data and user_data["password"]:
-            hashed = hash_password(user_data["password"])
+            hashed = await password_hasher.hash(user_data["password"])
             user.password = hashed  # 비밀번호 업데이트
 
+        # 친구들의 친구 목록에 보이는 프로필도 함께 갱신
+        await update_friend_profile(self.session, user)
+
         # 변경 사항 커밋
-        await self.session.commit()
+        await commit(self.session)
 
         return user
 
@@ -122,7 +134,7 @@ class UserRepository:
 
         user.deleted_at = datetime.now()  # Soft delete 처리
         user.is_active = False
-        await self.session.commit()
+        await commit(self.session)
 
     # 비밀번호 분실
     async def forgot_password(self, user_email: str) -> str:
@@ -130,18 +142,33 @@ class UserRepository:
         if user is None:
             raise UserNotFoundException(f"User with email {user_email} not found")
         temp_password = generate_password() + "1@"
-        user.password = hash_password(temp_password)
-        await self.session.commit()
+        user.password = await password_hasher.hash(temp_password)
+        await commit(self.session)
         return temp_password
 
     # 계정 복구
+    # 탈퇴 회원 삭제 작업이 이미 시작됐는지 (체크포인트가 있으면 복구할 수 없음)
+    async def is_being_purged(self, user_id: int) -> bool:
+        result = await self.session.scalar(
+            select(AccountPurge.user_id).where(AccountPurge.user_id == user_id)
+        )
+        return result is not None
+
     async def recovery_account(self, user_email: str) -> None:
-        user = await self.get_user_by_email(user_email)
+        # 회원 행을 잠근 채로 확인 (삭제 작업이 체크포인트를 기록하는 것과 동시에 진행되지 않음)
+        user = await self.session.scalar(
+            select(User).where(User.email == user_email).with_for_update()
+        )
         if user is None:
             raise UserNotFoundException(f"User with email {user_email} not found")
+        if await self.is_being_purged(user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Account is being deleted",
+            )
         user.is_active = True
         user.deleted_at = None
-        await self.session.commit()
+        await commit(self.session)
 
     # 메일이나 닉네임으로 유저 검색
     async def search_user(self, word: str) -> list[User]:
@@ -11,7 +11,9 @@ from jose import JWTError
 from passlib.context import CryptContext
 from starlette import status
 
+from blacklist import check_blacklist
 from src.config import Settings
+from src.user.service.token_cache import VerifiedTokenCache
 
 settings = Settings()
 
@@ -21,6 +23,9 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 30
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 검증된 토큰 payload 캐시 (토큰 exp 시각에 만료)
+verified_token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_MAXSIZE)
+
 
 # 비밀번호 해싱 함수
 def hash_password(password: str) -> str:
@@ -67,16 +72,21 @@ def encode_refresh_token(user_id: int) -> str:
     return refresh_token
 
 
+# 서명 검증은 토큰당 한 번만 수행하고, 이후에는 캐시된 payload 를 사용
+def decode_verified_token(token: str) -> JWTPayload:
+    payload = verified_token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        verified_token_cache.put(token, payload)
+    return cast(JWTPayload, payload)
+
+
 def decode_access_token(access_token: str) -> JWTPayload:
-    return cast(
-        JWTPayload, jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
-    )
+    return decode_verified_token(access_token)
 
 
 def decode_refresh_token(refresh_token: str) -> JWTPayload:
-    return cast(
-        JWTPayload, jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
-    )
+    return decode_verified_token(refresh_token)
     # try:
     #     payload = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
     #     if payload.get("type") != "refresh":
@@ -184,7 +194,7 @@ def is_access_token_expired(
         )
 
 
-def authenticate(
+async def authenticate(
     request: Request,
     response: Response,
 ) -> int:
@@ -212,49 +222,65 @@ def authenticate(
 
         # Authorization 헤더에서 access_token 추출
         access_token = authorization_header.split(" ", 1)[1]
-    # 이하 기존 로직 동일
-    if is_access_token_expired(access_token):
-        refresh_token = request.cookies.get("refresh_token")
+    # 액세스 토큰은 한 번만 디코딩 (만료 여부도 디코딩 결과로 판단)
+    try:
+        payload = decode_access_token(access_token)
 
-        # 리프레시 토큰이 없거나 만료되었다면
-        if not refresh_token or is_refresh_token_expired(refresh_token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="다시 로그인 해주세요.",
-            )
+    except jwt.ExpiredSignatureError:
+        pass
 
-        try:
-            payload = decode_refresh_token(refresh_token)
-            new_access_token = encode_access_token(payload["user_id"])
-
-            # 쿠키 설정 개선
-            response.set_cookie(
-                key="access_token",
-                value=new_access_token,
-                httponly=True,
-                secure=True,
-                samesite="none",
-                path="/",
-                max_age=3600,
-                expires=datetime.now(timezone.utc) + timedelta(hours=1),
-            )
+    except jwt.PyJWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰"
+        )
 
-            return payload["user_id"]
+    else:
+        # 로그아웃으로 폐기된 토큰 거부
+        await check_blacklist(access_token)
+        return payload["user_id"]
 
-        except JWTError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 실패"
-            )
+    # 액세스 토큰이 만료된 경우 리프레시 토큰으로 재발급
+    refresh_token = request.cookies.get("refresh_token")
+
+    # 리프레시 토큰이 없거나 만료되었다면
+    if not refresh_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="다시 로그인 해주세요.",
+        )
 
     try:
-        payload = decode_access_token(access_token)
-        return payload["user_id"]
+        payload = decode_refresh_token(refresh_token)
 
-    except JWTError:
+    except jwt.ExpiredSignatureError:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="유효하지 않은 토큰"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="다시 로그인 해주세요.",
         )
 
+    except jwt.PyJWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="인증 실패"
+        )
+
+    await check_blacklist(refresh_token)
+
+    new_access_token = encode_access_token(payload["user_id"])
+
+    # 쿠키 설정 개선
+    response.set_cookie(
+        key="access_token",
+        value=new_access_token,
+        httponly=True,
+        secure=True,
+        samesite="none",
+        path="/",
+        max_age=3600,
+        expires=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+    return payload["user_id"]
+
 
 def create_verification_token(email: str) -> str:
     payload = {
@@ -0,0 +1,44 @@
+import struct
+import time
+from array import array
+from typing import Optional
+
+
+class ExpiringBloomFilter:
+    """
+    만료 시각을 저장하는 블룸 필터입니다.
+
+    일반 블룸 필터의 비트 대신 각 셀에 "그 셀을 마지막으로 세운 항목의 만료 시각"을 저장합니다.
+    조회 시 k 개 셀이 모두 현재 시각 이후를 가리킬 때만 포함 가능성이 있다고 판단하므로,
+    항목은 별도의 삭제나 재구성 없이 만료 시각이 지나면 자연스럽게 필터에서 빠집니다.
+    거짓 양성은 있을 수 있지만 거짓 음성은 없습니다.
+    """
+
+    def __init__(self, size: int = 1 << 20, hash_count: int = 4) -> None:
+        # 키는 SHA-256 다이제스트(32 bytes)에서 4 bytes 씩 잘라 쓰므로 최대 8개
+        if not 1 <= hash_count <= 8:
+            raise ValueError("hash_count must be between 1 and 8")
+
+        # 나머지 연산 대신 비트 마스크를 쓰기 위해 2의 거듭제곱으로 올림
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.hash_count = hash_count
+        self._mask = self.size - 1
+        self._unpack = struct.Struct(f">{hash_count}I").unpack_from
+        self._cells = array("I", bytes(4 * self.size))
+
+    def add(self, digest: bytes, expires_at: int) -> None:
+        cells, mask = self._cells, self._mask
+        for value in self._unpack(digest):
+            if cells[value & mask] < expires_at:
+                cells[value & mask] = expires_at
+
+    def might_contain(self, digest: bytes, now: Optional[float] = None) -> bool:
+        # 인증 요청마다 호출되는 경로이므로 첫 번째 빈 셀에서 바로 반환
+        if now is None:
+            now = time.time()
+
+        cells, mask = self._cells, self._mask
+        for value in self._unpack(digest):
+            if cells[value & mask] <= now:
+                return False
+        return True
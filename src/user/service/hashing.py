@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException, status
+
+from src.config import Settings
+from src.user.service.authentication import hash_password, verify_password
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 프로세스 풀에서 실행하는 비동기 서비스입니다.
+    이벤트 루프는 결과만 기다리므로 로그인이 몰려도 다른 API/웹소켓 요청이 멈추지 않습니다.
+    대기 중인 작업이 max_pending 에 도달하면 즉시 503 으로 거절합니다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._executor is None:
+            # 이벤트 루프/스레드풀이 떠 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., R], *args: Any) -> R:
+        # 대기열이 가득 차면 bcrypt 를 기다리지 않고 바로 거절
+        if self._pending >= self.max_pending:
+            logger.warning(f"Password hashing queue saturated: {self._pending}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": "1"},
+            )
+
+        self.start()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str | None) -> bool:
+        if hashed_password is None:
+            return False
+        return await self._run(verify_password, plain_password, hashed_password)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,229 @@
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import ColumnElement, delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import Diary
+from src.diary.service.rollup import add_to_rollups
+from src.ex_diary.models import ExDiary
+from src.friend.models import Friend, FriendEdge
+from src.friend.service.friendship_cache import friendship_cache
+from src.friend.service.summary import delete_friend_summaries
+from src.notification.models import Notification
+from src.upload.service.blobs import release_images
+from src.user.models import AccountPurge, User
+from src.websocket.models import Message
+
+logger = logging.getLogger(__name__)
+
+# 탈퇴 회원 데이터 삭제 단계 (순서대로 진행, 단계마다 체크포인트 기록)
+# 외래 키로 회원을 참조하는 행을 먼저 지우고 마지막에 회원 행을 삭제
+PURGE_STAGES = (
+    "diaries",
+    "friends",
+    "ex_diaries",
+    "messages",
+    "notifications",
+    "user",
+)
+
+
+async def delete_chunk(
+    session: AsyncSession, model: Any, condition: ColumnElement[bool], chunk_size: int
+) -> int:
+    """
+    condition 에 맞는 행을 id 순서로 chunk_size 개 삭제하고 삭제한 수를 반환합니다.
+    이미지가 있는 테이블이면 삭제된 행의 이미지 참조를 해제합니다.
+    (참조가 모두 없어진 이미지는 정리 작업이 스토리지에서 묶어서 삭제)
+    """
+    chunk = select(model.id).where(condition).order_by(model.id).limit(chunk_size)
+    has_image = hasattr(model, "img_key")
+    result = await session.execute(
+        delete(model)
+        .where(model.id.in_(chunk))
+        .returning(model.img_key if has_image else model.id)
+        .execution_options(synchronize_session=False)
+    )
+    rows = list(result.scalars())
+    if has_image:
+        await release_images(session, rows)
+    return len(rows)
+
+
+async def delete_all(
+    session: AsyncSession, model: Any, condition: ColumnElement[bool], chunk_size: int
+) -> int:
+    """condition 에 맞는 행을 chunk_size 개씩 나눠 삭제하고 조각마다 커밋합니다."""
+    deleted = 0
+    while True:
+        count = await delete_chunk(session, model, condition, chunk_size)
+        await session.commit()
+        deleted += count
+        if count < chunk_size:
+            return deleted
+
+
+async def purge_diaries(session: AsyncSession, user_id: int, chunk_size: int) -> None:
+    await delete_all(session, Diary, Diary.user_id == user_id, chunk_size)
+
+
+async def delete_shared_ex_diary_chunk(
+    session: AsyncSession, user_id: int, friend_id: int, chunk_size: int
+) -> int:
+    """
+    친구 관계의 교환일기(양쪽이 쓴 것 모두)를 chunk_size 개 삭제하고 삭제한 수를 반환합니다.
+    상대방이 쓴 교환일기는 같은 조각에서 상대방의 기분 롤업도 줄입니다. (delete_ex_diary 와 같음)
+    """
+    chunk = (
+        select(ExDiary.id)
+        .where(ExDiary.friend_id == friend_id)
+        .order_by(ExDiary.id)
+        .limit(chunk_size)
+    )
+    result = await session.execute(
+        delete(ExDiary)
+        .where(ExDiary.id.in_(chunk))
+        .returning(ExDiary.user_id, ExDiary.write_date, ExDiary.mood, ExDiary.img_key)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    await release_images(session, [row.img_key for row in rows])
+    moods = Counter(
+        (row.user_id, row.write_date, row.mood)
+        for row in rows
+        if row.user_id != user_id
+    )
+    for (writer_id, write_date, mood), count in moods.items():
+        await add_to_rollups(session, writer_id, "ex_diary", write_date, mood, -count)
+    return len(rows)
+
+
+async def purge_friends(session: AsyncSession, user_id: int, chunk_size: int) -> None:
+    """
+    친구 관계마다
+    1. friend_edges 를 먼저 삭제/커밋하고 캐시를 무효화해서 새 교환일기/채팅 작성을 막고
+    2. 교환일기와 채팅을 조각마다 커밋하며 삭제한 뒤
+    3. 친구 관계 행을 잠그고 그 사이에 들어온 행까지 지운 다음 관계를 삭제합니다.
+    (관계 행을 잠그면 교환 횟수 갱신/채팅 외래 키 확인을 하는 요청이 끝날 때까지 기다림)
+    """
+    while True:
+        friend_id = await session.scalar(
+            select(Friend.id)
+            .where(or_(Friend.user_id1 == user_id, Friend.user_id2 == user_id))
+            .order_by(Friend.id)
+            .limit(1)
+        )
+        if friend_id is None:
+            return
+
+        await delete_friend_summaries(session, friend_id)
+        deleted = await session.execute(
+            delete(FriendEdge)
+            .where(FriendEdge.friend_id == friend_id)
+            .returning(FriendEdge.user_id)
+        )
+        user_ids = list(deleted.scalars())
+        await session.commit()
+        if user_ids:
+            await friendship_cache.broadcast_invalidation(friend_id, user_ids)  # type: ignore
+
+        while True:
+            count = await delete_shared_ex_diary_chunk(
+                session, user_id, friend_id, chunk_size
+            )
+            await session.commit()
+            if count < chunk_size:
+                break
+        await delete_all(session, Message, Message.friend_id == friend_id, chunk_size)
+
+        await session.execute(
+            select(Friend.id).where(Friend.id == friend_id).with_for_update()
+        )
+        while (
+            await delete_shared_ex_diary_chunk(session, user_id, friend_id, chunk_size)
+            == chunk_size
+        ):
+            pass
+        condition = Message.friend_id == friend_id
+        while await delete_chunk(session, Message, condition, chunk_size) == chunk_size:
+            pass
+        await session.execute(delete(Friend).where(Friend.id == friend_id))
+        await session.commit()
+
+
+async def purge_ex_diaries(
+    session: AsyncSession, user_id: int, chunk_size: int
+) -> None:
+    await delete_all(session, ExDiary, ExDiary.user_id == user_id, chunk_size)
+
+
+async def purge_messages(session: AsyncSession, user_id: int, chunk_size: int) -> None:
+    await delete_all(session, Message, Message.user_id == user_id, chunk_size)
+
+
+async def purge_notifications(
+    session: AsyncSession, user_id: int, chunk_size: int
+) -> None:
+    await delete_all(session, Notification, Notification.user_id == user_id, chunk_size)
+
+
+async def purge_user_row(session: AsyncSession, user_id: int, chunk_size: int) -> None:
+    # 체크포인트와 회원 행을 같은 트랜잭션에서 삭제 (나머지 행은 CASCADE)
+    await session.execute(delete(AccountPurge).where(AccountPurge.user_id == user_id))
+    result = await session.execute(
+        delete(User)
+        .where(User.id == user_id)
+        .returning(User.img_key)
+        .execution_options(synchronize_session=False)
+    )
+    await release_images(session, list(result.scalars()))
+    await session.commit()
+
+
+STAGE_HANDLERS: dict[str, Callable[[AsyncSession, int, int], Awaitable[None]]] = {
+    "diaries": purge_diaries,
+    "friends": purge_friends,
+    "ex_diaries": purge_ex_diaries,
+    "messages": purge_messages,
+    "notifications": purge_notifications,
+    "user": purge_user_row,
+}
+
+
+async def purge_account(
+    session: AsyncSession, user_id: int, chunk_size: int = 1000
+) -> bool:
+    """
+    회원이 가진 모든 행을 단계별로 chunk_size 개씩 나눠 삭제하고 마지막에 회원 행을 삭제합니다.
+    체크포인트(account_purges)에 기록된 단계부터 시작하므로 중간에 실패해도 이어서 진행합니다.
+    그 사이에 복구된 회원이면 삭제하지 않고 False 를 반환합니다.
+    """
+    stage = await session.scalar(
+        select(AccountPurge.stage).where(AccountPurge.user_id == user_id)
+    )
+    if stage is None:
+        # 회원 행을 잠근 채로 확인하고 체크포인트를 기록 (계정 복구와 동시에 진행되지 않음)
+        deleted_at = await session.scalar(
+            select(User.deleted_at).where(User.id == user_id).with_for_update()
+        )
+        if deleted_at is None:
+            await session.rollback()
+            return False
+        stage = PURGE_STAGES[0]
+        await session.execute(insert(AccountPurge).values(user_id=user_id, stage=stage))
+        await session.commit()
+    elif stage != PURGE_STAGES[0]:
+        logger.info(f"Resuming account purge: user {user_id} from {stage}")
+
+    for stage in PURGE_STAGES[PURGE_STAGES.index(stage) :]:
+        await session.execute(
+            update(AccountPurge)
+            .where(AccountPurge.user_id == user_id)
+            .values(stage=stage, updated_at=datetime.now())
+        )
+        await session.commit()
+        await STAGE_HANDLERS[stage](session, user_id, chunk_size)
+    return True
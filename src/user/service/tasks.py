@@ -1,72 +1,66 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
-import boto3
-from botocore.exceptions import ClientError
 from celery import shared_task
-from sqlalchemy import delete, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import Settings
-from src.config.database.connection import AsyncSessionFactory
-from src.user.models import User
+from src.config.database.connection import AsyncSessionFactory, async_engine
+from src.upload.service.tasks import purge_unused_images_task
+from src.user.models import AccountPurge, User
+from src.user.service.purge import purge_account
 
 settings = Settings()
 logger = logging.getLogger(__name__)
 
 
-async def delete_expired_users_task() -> None:
-    # s3_client = boto3.client(
-    #     "s3",
-    #     aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    #     aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    #     region_name=settings.AWS_REGION,
-    # )
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.NCP_ACCESS_KEY,
-        aws_secret_access_key=settings.NCP_SECRET_KEY,
-        endpoint_url=settings.NCP_ENDPOINT_URL,
-    )
-
+async def delete_expired_users_task() -> int:
     async with AsyncSessionFactory() as session:
-        async with session.begin():
-            await delete_expired_users(session, s3_client)
+        deleted = await delete_expired_users(session)
+    # 삭제된 회원의 이미지 중 참조가 모두 없어진 것을 스토리지에서 묶어서 삭제
+    await purge_unused_images_task()
+    return deleted
 
 
 @shared_task(name="tasks.delete_expired_users")  # type: ignore
-async def delete_expired_users(session: AsyncSession, s3_client: boto3.client) -> None:
+def delete_expired_users_job() -> int:
+    async def run() -> int:
+        try:
+            return await delete_expired_users_task()
+        finally:
+            # 실행마다 새 이벤트 루프를 쓰므로 이전 루프에 묶인 연결을 남기지 않음
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+async def delete_expired_users(session: AsyncSession) -> int:
     logger.info("Deleting expired users started...")
 
     threshold_date = datetime.now() - timedelta(days=7)
+    batch_size = settings.ACCOUNT_PURGE_BATCH_SIZE
 
-    # 삭제 예정 사용자 먼저 조회
-    expired_users = await session.execute(
-        select(User).where(
-            User.deleted_at.isnot(None), User.deleted_at <= threshold_date
-        )
+    # 탈퇴 후 보관 기간이 지난 회원과, 이전 실행에서 삭제가 중단된 회원 (체크포인트가 남은 회원)
+    purge_targets = or_(
+        and_(User.deleted_at.isnot(None), User.deleted_at <= threshold_date),
+        User.id.in_(select(AccountPurge.user_id)),
     )
 
-    # S3에서 프로필 이미지 대량 삭제
-    for user in expired_users.scalars():
-        if user.img_url:
-            try:
-                # URL에서 S3 키 추출
-                s3_key = user.img_url.split(
-                    # f"{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/"
-                    f"{settings.NCP_ENDPOINT_URL}/{settings.NCP_BUCKET_NAME}/"
-                )[1]
-
-                s3_client.delete_object(Bucket=settings.S3_BUCKET_NAME, Key=s3_key)
-            except (ClientError, IndexError) as e:
-                logger.error(f"S3 프로필 이미지 삭제 실패: {user.id}, {str(e)}")
-    logger.info(f"Deleted S3 image for user {user.id}")
-
-    # 데이터베이스에서 대량 삭제
-    await session.execute(
-        delete(User).where(
-            User.deleted_at.isnot(None), User.deleted_at <= threshold_date
+    # batch_size 명씩 가져와서 한 명씩 삭제 (회원마다 단계/조각 단위로 커밋)
+    deleted = 0
+    while True:
+        user_ids = list(
+            await session.scalars(
+                select(User.id).where(purge_targets).order_by(User.id).limit(batch_size)
+            )
         )
-    )
-    await session.commit()
-    logger.info("Expired users deletion completed.")
+        for user_id in user_ids:
+            if await purge_account(session, user_id, settings.ACCOUNT_PURGE_CHUNK_SIZE):
+                deleted += 1
+        if len(user_ids) < batch_size:
+            break
+
+    logger.info(f"Expired users deletion completed: {deleted}")
+    return deleted
@@ -0,0 +1,29 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from src.config.lru_cache import ExpiringLRUCache
+
+
+def token_digest(token: str) -> bytes:
+    # 토큰 원문 대신 SHA-256 다이제스트를 키로 사용 (메모리에 토큰 원문을 남기지 않음)
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class VerifiedTokenCache(ExpiringLRUCache[bytes, Dict[str, Any]]):
+    """
+    서명 검증을 통과한 JWT payload 를 토큰의 exp 시각까지 보관하는 LRU 캐시입니다.
+    워커 프로세스마다 하나씩 존재하며, 같은 토큰은 수명 동안 한 번만 디코딩됩니다.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        super().__init__(maxsize)
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        # 만료된 토큰은 즉시 제거하고 재검증(= ExpiredSignatureError)으로 넘김
+        return self.lookup(token_digest(token))
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        # 만료 시각이 없는 토큰은 수명을 알 수 없으므로 캐시하지 않음
+        if "exp" not in payload:
+            return
+        self.store(token_digest(token), payload, payload["exp"])
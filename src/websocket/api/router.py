@@ -6,7 +6,11 @@ from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from blacklist import TokenBlacklist
 from src.config.database.connection_async import get_db
+from src.ex_diary.service.validate import ExDiaryService
+from src.friend.repository import FriendRepository
+from src.friend.service.summary import record_latest_message
 from src.user.service.authentication import decode_access_token
 from src.websocket.models import Message
 from src.websocket.schemas import MessageCreate
@@ -60,6 +64,16 @@ async def websocket_endpoint(
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
+        # 로그아웃으로 폐기된 토큰 거부
+        if await TokenBlacklist.is_blacklisted(token):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
+        # 친구 관계인 채팅방만 입장 가능
+        if not await FriendRepository(db).is_friend(user_id, friend_id):
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+            return
+
         # WebSocket 연결 등록
         await manager.connect(websocket, user_id, friend_id)
 
@@ -97,6 +111,8 @@ async def websocket_endpoint(
                 message=content,
             )
             db.add(new_message)
+            # 친구 목록의 마지막 메시지도 같은 트랜잭션에서 갱신
+            await record_latest_message(db, friend_id, content)
             await db.commit()
 
             # 발신자에게 메시지 표시
@@ -120,6 +136,9 @@ async def send_message(
     message: MessageCreate,
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, str]:
+    # 수락된 친구 관계의 채팅방에만 보낼 수 있음
+    await ExDiaryService.validate_friendship(message.user_id, message.friend_id, db)
+
     # 데이터베이스에 새 메시지 저장
     new_message = Message(
         user_id=message.user_id,
@@ -127,6 +146,7 @@ async def send_message(
         message=message.content,
     )
     db.add(new_message)
+    await record_latest_message(db, message.friend_id, message.content)
     await db.commit()
 
     # 발신자에게 보낼 메시지
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text
 
 from src.config.database.orm import Base
 
@@ -14,6 +14,11 @@ class Message(Base):
     message = Column(Text)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
 
+    # 채팅방(친구 관계)별 메시지 기록 조회
+    __table_args__ = (
+        Index("ix_messages_friend_id_created_at", "friend_id", "created_at"),
+    )
+
     @classmethod
     def create(
         cls,
@@ -1,12 +1,11 @@
 from typing import Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.config.database.connection_async import get_db
-from src.friend.models import Friend
+from src.config.database.unit_of_work import commit
 from src.websocket.models import Message
 
 
@@ -16,7 +15,7 @@ class ChatRepository:
 
     async def save(self, message: Message) -> None:
         self.session.add(message)
-        await self.session.commit()
+        await commit(self.session)
 
     async def get_messages_by_room(self, chatroom_id: int) -> Sequence[Message]:
         # 1) DB에서 조회(I/O -> await)
@@ -29,32 +28,30 @@ class ChatRepository:
         # 2) 데이터를 ORM 객체로 변환(I/O 대기 없음)
         return result.scalars().all()
 
-    async def get_latest_messages_by_room(
-        self, user_id: int
-    ) -> dict[int | None, Message | None]:
-        # Fetch all accepted friends for the user
-        result1 = await self.session.execute(
-            select(Friend)
-            .options(selectinload(Friend.user1), selectinload(Friend.user2))
-            .filter(
-                (
-                    (Friend.user_id1 == user_id) | (Friend.user_id2 == user_id)
-                )  # Friendships involving the user
-                & (Friend.is_accept == True)  # Only accepted friendships
+    async def get_latest_messages(self, friend_ids: list[int]) -> dict[int, Message]:
+        """
+        친구 관계(채팅방)별 마지막 메시지를 한 번의 쿼리로 조회합니다.
+        ix_messages_friend_id_created_at 인덱스 순서대로 읽어서 방마다 첫 행만 사용합니다.
+        """
+        if not friend_ids:
+            return {}
+
+        ranked = (
+            select(
+                Message.id,
+                func.row_number()
+                .over(
+                    partition_by=Message.friend_id,
+                    order_by=(Message.created_at.desc(), Message.id.desc()),
+                )
+                .label("rn"),
             )
+            .where(Message.friend_id.in_(friend_ids))
+            .subquery()
         )
-        friends = result1.scalars().all()
-
-        # Prepare a mapping of friend IDs to their latest message
-        latest_messages = {}
-        for friend in friends:
-            friend_id = friend.id
-            result2 = await self.session.execute(
-                select(Message)
-                .filter_by(friend_id=friend_id)
-                .order_by(Message.created_at.desc())  # Get the most recent message
-                .limit(1)
-            )
-            latest_messages[friend_id] = result2.scalar_one_or_none()
-
-        return latest_messages
+        result = await self.session.execute(
+            select(Message)
+            .join(ranked, ranked.c.id == Message.id)
+            .where(ranked.c.rn == 1)
+        )
+        return {message.friend_id: message for message in result.scalars()}  # type: ignore
@@ -1,11 +1,16 @@
 import os
+from typing import TYPE_CHECKING, Any, Iterator
 
 import pytest
 from dotenv import load_dotenv
+from moto import mock_aws
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.config.database.orm import Base
 
+if TYPE_CHECKING:
+    from src.user.models import User
+
 load_dotenv(override=True)
 
 # None 병합 연산자 (??) 사용
@@ -48,3 +53,76 @@ async def async_session():
     # 테스트 후 데이터베이스 삭제
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+
+
+# 애플리케이션 모듈은 pytest_configure 에서 환경 변수를 설정한 뒤에 import
+
+
+def new_user(i: int, **attrs: Any) -> "User":
+    """user{i} / nick{i} / user{i}@test.com 회원. attrs 는 생성 후 속성으로 지정합니다."""
+    from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+    from src.user.models import User
+    from src.websocket.models import Message  # noqa: F401
+
+    user = User(
+        name=f"user{i}",
+        nickname=f"nick{i}",
+        email=f"user{i}@test.com",
+        password="pw",
+        is_active=True,
+        provider="local",
+    )
+    for name, value in attrs.items():
+        setattr(user, name, value)
+    return user
+
+
+@pytest.fixture(autouse=True)
+def clear_friendship_cache() -> Iterator[None]:
+    # 테스트마다 DB 가 새로 만들어지므로 이전 테스트의 친구 관계 캐시 제거
+    from src.friend.service.friendship_cache import friendship_cache
+
+    friendship_cache.clear()
+    yield
+    friendship_cache.clear()
+
+
+@pytest.fixture
+async def session(
+    async_session: AsyncSession, request: pytest.FixtureRequest
+) -> AsyncSession:
+    """
+    회원 (user_count)명을 만들고 회원 1 이 나머지 중 앞의 (friend_count)명과 친구가 된 세션.
+    기본은 회원 2명, 친구 1명이고 다른 구성은 indirect 파라미터로 지정합니다.
+        @pytest.mark.parametrize("session", [(3, 2)], indirect=True)
+    회원 i+1 의 닉네임은 nick{i} 이고, 친구 관계 id 는 1 부터 차례로 붙습니다.
+    """
+    from src.friend.repository import FriendRepository
+
+    user_count, friend_count = getattr(request, "param", (2, 1))
+    users = [new_user(i) for i in range(user_count)]
+    async_session.add_all(users)
+    await async_session.commit()
+
+    repo = FriendRepository(async_session)
+    for other in users[1 : friend_count + 1]:
+        friend_request = await repo.create_friend_request(other.id, users[0].id)  # type: ignore
+        await repo.accept_friend_request(users[0].id, friend_request.id)  # type: ignore
+    return async_session
+
+
+TEST_BUCKET = "endofday-test"
+
+
+@pytest.fixture
+def storage_bucket(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """NCP 엔드포인트로 가는 스토리지 요청을 moto 의 로컬 S3 로 처리합니다."""
+    from src.config import storage
+
+    monkeypatch.setenv("MOTO_S3_CUSTOM_ENDPOINTS", storage.settings.NCP_ENDPOINT_URL)
+    monkeypatch.setattr(storage.settings, "NCP_BUCKET_NAME", TEST_BUCKET)
+    storage.close_storage()
+    with mock_aws():
+        storage.get_storage().create_bucket(Bucket=TEST_BUCKET)
+        yield TEST_BUCKET
+        storage.close_storage()
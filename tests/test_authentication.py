@@ -0,0 +1,220 @@
+import time
+
+import jwt
+import pytest
+import redis.asyncio as redis
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+import blacklist
+from src.user.service import authentication
+from src.user.service.authentication import (
+    ALGORITHM,
+    SECRET_KEY,
+    authenticate,
+    encode_access_token,
+    encode_refresh_token,
+    verified_token_cache,
+)
+from src.user.service.bloom_filter import ExpiringBloomFilter
+from src.user.service.hashing import PasswordHasher
+from src.user.service.token_cache import VerifiedTokenCache, token_digest
+
+
+def build_request(
+    path: str, token: str | None = None, cookies: dict[str, str] | None = None
+) -> Request:
+    headers = []
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    if cookies:
+        cookie = "; ".join(f"{k}={v}" for k, v in cookies.items())
+        headers.append((b"cookie", cookie.encode()))
+    return Request({"type": "http", "method": "GET", "path": path, "headers": headers})
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    verified_token_cache.clear()
+    yield
+    verified_token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def revoked_filter(monkeypatch) -> ExpiringBloomFilter:
+    # 프로세스 전역 필터에 테스트 항목이 남지 않도록 테스트마다 새 필터 사용
+    # (리스너가 필터를 채운 상태로 가정, 준비 전 동작은 따로 테스트)
+    bloom = ExpiringBloomFilter(size=1024, hash_count=4)
+    monkeypatch.setattr(blacklist, "revoked_token_filter", bloom)
+    monkeypatch.setattr(blacklist.pubsub_listener, "ready", True)
+    return bloom
+
+
+@pytest.fixture
+def decode_counter(monkeypatch):
+    calls = {"count": 0}
+    original = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls["count"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(authentication.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_cache_returns_payload_until_exp() -> None:
+    cache = VerifiedTokenCache(maxsize=8)
+    payload = {"user_id": 1, "exp": int(time.time()) + 60}
+    cache.put("token", payload)
+
+    assert cache.get("token") == payload
+    assert cache.hits == 1
+
+
+def test_cache_evicts_expired_entries() -> None:
+    cache = VerifiedTokenCache(maxsize=8)
+    cache.put("token", {"user_id": 1, "exp": int(time.time()) - 1})
+
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded_lru() -> None:
+    cache = VerifiedTokenCache(maxsize=2)
+    exp = int(time.time()) + 60
+    cache.put("a", {"user_id": 1, "exp": exp})
+    cache.put("b", {"user_id": 2, "exp": exp})
+    cache.get("a")  # a 를 최근 사용으로 갱신
+    cache.put("c", {"user_id": 3, "exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.parametrize("path", ["/diary", "/friends"])
+async def test_authenticate_decodes_token_once(path: str, decode_counter) -> None:
+    token = encode_access_token(user_id=7)
+
+    for _ in range(10):
+        assert await authenticate(build_request(path, token=token), Response()) == 7
+
+    assert decode_counter["count"] == 1
+
+
+async def test_authenticate_refreshes_expired_access_token(decode_counter) -> None:
+    expired = jwt.encode(
+        {"user_id": 7, "isa": 0, "exp": int(time.time()) - 10},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    refresh_token = encode_refresh_token(user_id=7)
+    response = Response()
+
+    user_id = await authenticate(
+        build_request(
+            "/diary", token=expired, cookies={"refresh_token": refresh_token}
+        ),
+        response,
+    )
+
+    assert user_id == 7
+    assert "access_token=" in response.headers["set-cookie"]
+    # 만료된 액세스 토큰 1회 + 리프레시 토큰 1회
+    assert decode_counter["count"] == 2
+
+
+async def test_authenticate_rejects_invalid_token() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await authenticate(build_request("/diary", token="not-a-jwt"), Response())
+
+    assert exc_info.value.status_code == 401
+
+
+def test_bloom_filter_entries_expire_with_token() -> None:
+    bloom = ExpiringBloomFilter(size=1024, hash_count=4)
+    digest = token_digest("revoked-token")
+    now = int(time.time())
+    bloom.add(digest, expires_at=now + 60)
+
+    assert bloom.might_contain(digest, now=now)
+    assert not bloom.might_contain(digest, now=now + 60)
+    assert not bloom.might_contain(token_digest("other-token"), now=now)
+
+
+async def test_authenticate_rejects_blacklisted_token(
+    monkeypatch, revoked_filter: ExpiringBloomFilter
+) -> None:
+    token = encode_access_token(user_id=7)
+    lookups = []
+
+    async def fake_exists(key: str) -> int:
+        lookups.append(key)
+        return 1
+
+    class FakeRedis:
+        exists = staticmethod(fake_exists)
+
+    monkeypatch.setattr(blacklist, "get_redis", lambda: FakeRedis())
+
+    # 필터에 없는 토큰은 Redis 를 조회하지 않음
+    assert await authenticate(build_request("/diary", token=token), Response()) == 7
+    assert lookups == []
+
+    revoked_filter.add(token_digest(token), int(time.time()) + 60)
+    with pytest.raises(HTTPException) as exc_info:
+        await authenticate(build_request("/diary", token=token), Response())
+
+    assert exc_info.value.status_code == 401
+    assert lookups == [f"blacklist:{token_digest(token).hex()}"]
+
+
+async def test_token_revoked_before_the_listener_is_ready(monkeypatch) -> None:
+    # 다른 워커에서 로그아웃했지만 이 워커의 필터는 아직 비어 있음
+    monkeypatch.setattr(blacklist.pubsub_listener, "ready", False)
+    token = encode_access_token(user_id=7)
+    revoked = {f"blacklist:{token_digest(token).hex()}"}
+
+    class FakeRedis:
+        @staticmethod
+        async def exists(key: str) -> int:
+            return int(key in revoked)
+
+    monkeypatch.setattr(blacklist, "get_redis", lambda: FakeRedis())
+    with pytest.raises(HTTPException) as exc_info:
+        await authenticate(build_request("/diary", token=token), Response())
+    assert exc_info.value.status_code == 401
+
+    # Redis 에 접속할 수 없으면 필터에 없는 토큰도 거부
+    class DownRedis:
+        @staticmethod
+        async def exists(key: str) -> int:
+            raise redis.ConnectionError("down")
+
+    other = encode_access_token(user_id=8)
+    monkeypatch.setattr(blacklist, "get_redis", lambda: DownRedis())
+    with pytest.raises(HTTPException) as exc_info:
+        await authenticate(build_request("/diary", token=other), Response())
+    assert exc_info.value.status_code == 401
+
+
+async def test_password_hasher_round_trip() -> None:
+    hasher = PasswordHasher(max_workers=1, max_pending=4)
+    try:
+        hashed = await hasher.hash("password123!")
+
+        assert await hasher.verify("password123!", hashed)
+        assert not await hasher.verify("wrong-password", hashed)
+        assert hasher.pending == 0
+    finally:
+        hasher.shutdown()
+
+
+async def test_password_hasher_rejects_when_saturated() -> None:
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash("password123!")
+
+    assert exc_info.value.status_code == 503
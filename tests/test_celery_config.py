@@ -0,0 +1,29 @@
+import json
+import subprocess
+import sys
+
+from src.config import celery_config
+
+# 다른 테스트가 작업 모듈을 이미 불러왔을 수 있으므로 새 프로세스에서 워커처럼 등록
+REGISTERED_TASKS = """
+import json
+from celery import Celery
+
+app = Celery("tasks")
+app.config_from_object("src.config.celery_config")
+app.loader.import_default_modules()
+print(json.dumps(sorted(app.tasks)))
+"""
+
+
+def test_worker_registers_every_scheduled_task() -> None:
+    output = subprocess.run(
+        [sys.executable, "-c", REGISTERED_TASKS],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    registered = set(json.loads(output.splitlines()[-1]))
+
+    scheduled = {entry["task"] for entry in celery_config.CELERYBEAT_SCHEDULE.values()}
+    assert scheduled <= registered
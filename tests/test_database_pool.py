@@ -0,0 +1,33 @@
+import os
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config.database.connection import InstrumentedQueuePool
+
+
+async def test_instrumented_pool_counts_checkouts_and_timeouts() -> None:
+    engine = create_async_engine(
+        os.environ["DATABASE_URL"],
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    try:
+        async with engine.connect():
+            # 풀이 가득 찬 상태에서 추가 연결 요청은 타임아웃
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+
+            stats = engine.pool.stats()  # type: ignore
+            assert stats["checked_out"] == 1
+            assert stats["timeouts"] == 1
+
+        stats = engine.pool.stats()  # type: ignore
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+from fastapi_pagination import Params, set_params
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import Diary, MoodEnum, WeatherEnum
+from src.diary.repository import DiaryRepository
+from src.diary.service.period import date_range
+from src.friend.models import Friend  # noqa: F401 (매퍼 관계 설정용)
+from src.notification.models import Notification  # noqa: F401
+from src.user.models import User
+from src.websocket.models import Message  # noqa: F401
+
+# (작성일, 기분)
+ENTRIES = [
+    (date(2024, 12, 31), MoodEnum.sad),
+    (date(2025, 1, 1), MoodEnum.sad),
+    (date(2025, 1, 1), MoodEnum.good),
+    (date(2025, 1, 1), MoodEnum.good),
+    (date(2025, 1, 15), MoodEnum.tired),
+    (date(2025, 1, 15), MoodEnum.happy),
+    (date(2025, 1, 31), MoodEnum.normal),
+    (date(2025, 2, 1), MoodEnum.happy),
+]
+
+
+@pytest.fixture
+async def diary_repo(async_session: AsyncSession) -> DiaryRepository:
+    user = User(
+        name="tester",
+        nickname="tester",
+        email="tester@test.com",
+        password="pw",
+        is_active=True,
+        provider="local",
+    )
+    async_session.add(user)
+    await async_session.flush()
+
+    for i, (write_date, mood) in enumerate(ENTRIES):
+        async_session.add(
+            Diary(
+                user_id=user.id,
+                title=f"일기 {i}",
+                content=f"내용 {i}",
+                write_date=write_date,
+                weather=WeatherEnum.clear,
+                mood=mood,
+            )
+        )
+    await async_session.commit()
+    set_params(Params(page=1, size=50))
+    return DiaryRepository(async_session)
+
+
+def test_date_range_is_half_open() -> None:
+    assert date_range(2025) == (date(2025, 1, 1), date(2026, 1, 1))
+    assert date_range(2025, 2) == (date(2025, 2, 1), date(2025, 3, 1))
+    assert date_range(2025, 12) == (date(2025, 12, 1), date(2026, 1, 1))
+
+
+async def test_year_month_filter_uses_month_boundaries(
+    diary_repo: DiaryRepository,
+) -> None:
+    january = await diary_repo.get_diary_list(1, year=2025, month=1)
+    year = await diary_repo.get_diary_list(1, year=2025)
+    any_january = await diary_repo.get_diary_list(1, month=1)
+
+    assert january.total == 6
+    assert year.total == 7
+    assert any_january.total == 6
+
+
+async def test_calendar_groups_by_day_with_dominant_mood(
+    diary_repo: DiaryRepository,
+) -> None:
+    rows = await diary_repo.get_calendar(1, 2025, 1)
+
+    assert [(r.write_date, r.diary_count, r.mood) for r in rows] == [
+        (date(2025, 1, 1), 3, MoodEnum.good),
+        # 동률이면 MoodEnum 정의 순서 (happy 가 tired 보다 앞)
+        (date(2025, 1, 15), 2, MoodEnum.happy),
+        (date(2025, 1, 31), 1, MoodEnum.normal),
+    ]
@@ -0,0 +1,83 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import Diary, MoodEnum, WeatherEnum
+from src.diary.repository import DiaryRepository
+from src.friend.models import Friend  # noqa: F401 (매퍼 관계 설정용)
+from src.notification.models import Notification  # noqa: F401
+from src.user.models import User
+from src.websocket.models import Message  # noqa: F401
+
+
+@pytest.fixture
+async def diary_repo(async_session: AsyncSession) -> DiaryRepository:
+    user = User(
+        name="tester",
+        nickname="tester",
+        email="tester@test.com",
+        password="pw",
+        is_active=True,
+        provider="local",
+    )
+    async_session.add(user)
+    await async_session.flush()
+
+    # 같은 created_at 을 가진 일기도 섞어서 id 로 순서가 정해지는지 확인
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    for i in range(25):
+        async_session.add(
+            Diary(
+                user_id=user.id,
+                title=f"일기 {i}",
+                content=f"내용 {i}",
+                write_date=date(2025, 1, 1) + timedelta(days=i // 2),
+                weather=WeatherEnum.clear,
+                mood=MoodEnum.good,
+                created_at=base + timedelta(minutes=i // 3),
+            )
+        )
+    await async_session.commit()
+    return DiaryRepository(async_session)
+
+
+@pytest.mark.parametrize("month", [None, 1])
+async def test_cursor_pages_cover_every_diary_once(
+    diary_repo: DiaryRepository, month: int | None
+) -> None:
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = await diary_repo.get_diary_list_by_cursor(
+            1, cursor=cursor, size=7, month=month
+        )
+        seen.extend(item.id for item in page.items)
+        assert page.total is None
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == 25
+    assert len(set(seen)) == 25
+
+
+async def test_cursor_page_with_total(diary_repo: DiaryRepository) -> None:
+    page = await diary_repo.get_diary_list_by_cursor(1, size=10, include_total=True)
+
+    assert page.total == 25
+    assert len(page.items) == 10
+    # 최신순 (created_at, id 내림차순)
+    assert page.items[0].title == "일기 24"
+
+
+async def test_cursor_from_other_sort_is_rejected(diary_repo: DiaryRepository) -> None:
+    page = await diary_repo.get_diary_list_by_cursor(1, size=5)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await diary_repo.get_diary_list_by_cursor(1, cursor=page.next_cursor, year=2025)
+    assert exc_info.value.status_code == 400
+
+    with pytest.raises(HTTPException):
+        await diary_repo.get_diary_list_by_cursor(1, cursor="not-a-cursor")
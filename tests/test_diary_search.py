@@ -0,0 +1,110 @@
+import os
+from datetime import date
+
+import pytest
+from fastapi_pagination import Params, set_params
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.config.database.orm import Base
+from src.diary.models import Diary, MoodEnum, WeatherEnum
+from src.diary.repository import DiaryRepository
+from src.diary.service.search import search_terms
+from src.friend.models import Friend  # noqa: F401 (매퍼 관계 설정용)
+from src.notification.models import Notification  # noqa: F401
+from src.user.models import User
+from src.websocket.models import Message  # noqa: F401
+
+DIARIES = [
+    ("학교 가는 길", "오늘은 학교에서 친구를 만났다. 날씨가 좋았다."),
+    ("주말", "집에서 하루 종일 영화를 봤다."),
+    ("여행 계획", "다음 주에 바다로 여행을 간다. 학교 친구들과 함께."),
+]
+
+
+def database_urls() -> list[str]:
+    # SQLite(FTS5) 는 항상, PostgreSQL(tsvector) 은 테스트 DB 가 있을 때만 실행
+    urls = ["sqlite+aiosqlite:///{tmp}/search.db"]
+    url = os.getenv("TEST_DATABASE_URL") or os.getenv("DATABASE_URL") or ""
+    if url.startswith("postgresql"):
+        urls.append(url)
+    return urls
+
+
+@pytest.fixture(params=database_urls(), ids=lambda url: url.split(":", 1)[0])
+async def session(request, tmp_path):
+    engine = create_async_engine(request.param.format(tmp=tmp_path), poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        user = User(
+            name="tester",
+            nickname="tester",
+            email="tester@test.com",
+            password="pw",
+            is_active=True,
+            provider="local",
+        )
+        session.add(user)
+        await session.flush()
+        for title, content in DIARIES:
+            session.add(
+                Diary(
+                    user_id=user.id,
+                    title=title,
+                    content=content,
+                    write_date=date(2025, 1, 1),
+                    weather=WeatherEnum.clear,
+                    mood=MoodEnum.good,
+                )
+            )
+        await session.commit()
+        set_params(Params(page=1, size=10))
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+def test_search_terms_strip_query_syntax() -> None:
+    assert search_terms("학교 & (친구):* 'drop'") == ["학교", "친구", "drop"]
+    assert search_terms("!!!") == []
+
+
+async def test_search_matches_prefix_and_highlights(session: AsyncSession) -> None:
+    repo = DiaryRepository(session)
+
+    page = await repo.get_diary_list(1, word="학교")
+
+    assert {item.title for item in page.items} == {"학교 가는 길", "여행 계획"}
+    assert page.total == 2
+    for item in page.items:
+        assert item.snippet is not None
+        assert "<b>" in item.snippet
+
+
+async def test_search_requires_every_term(session: AsyncSession) -> None:
+    repo = DiaryRepository(session)
+
+    page = await repo.get_diary_list(1, word="학교 바다로")
+
+    assert [item.title for item in page.items] == ["여행 계획"]
+
+
+async def test_search_excludes_deleted_diaries(session: AsyncSession) -> None:
+    repo = DiaryRepository(session)
+    diary = (await repo.get_diary_list(1, word="영화")).items[0]
+
+    await repo.delete(await repo.get_diary_detail(diary.id))  # type: ignore
+
+    assert (await repo.get_diary_list(1, word="영화")).items == []
+
+
+async def test_list_without_word_has_no_snippet(session: AsyncSession) -> None:
+    page = await DiaryRepository(session).get_diary_list(1)
+
+    assert len(page.items) == 3
+    assert all(item.snippet is None for item in page.items)
@@ -0,0 +1,153 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.diary.models import MoodEnum, WeatherEnum
+from src.ex_diary.models import ExDiary
+from src.ex_diary.repository import ExDiaryRepository
+from src.friend.models import Friend, FriendSummary
+from src.friend.service.exchange import reconcile_exchange_counts
+from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+from src.websocket.models import Message  # noqa: F401
+
+pytestmark = pytest.mark.parametrize("session", [(3, 2)], indirect=True)
+
+
+def new_ex_diary(friend_id: int = 1) -> ExDiary:
+    return ExDiary(
+        user_id=1,
+        friend_id=friend_id,
+        title="제목",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.good,
+        content="내용",
+    )
+
+
+async def counts(session: AsyncSession, friend_id: int = 1) -> tuple[int, int]:
+    friend_cnt = await session.scalar(
+        select(Friend.ex_diary_cnt)
+        .where(Friend.id == friend_id)
+        .execution_options(populate_existing=True)
+    )
+    summary_cnt = await session.scalar(
+        select(FriendSummary.ex_diary_cnt).where(
+            FriendSummary.friend_id == friend_id, FriendSummary.user_id == 1
+        )
+    )
+    return friend_cnt, summary_cnt  # type: ignore
+
+
+async def test_save_updates_counter_in_one_statement(session: AsyncSession) -> None:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        statements.append(" ".join(statement.split()).upper())
+
+    sync_engine = session.bind.sync_engine  # type: ignore
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await ExDiaryRepository(session).save(new_ex_diary())
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    # SELECT 후 갱신하지 않고 UPDATE ... RETURNING 한 번
+    friend_statements = [s for s in statements if " FRIENDS " in f"{s} "]
+    assert len(friend_statements) == 1
+    assert friend_statements[0].startswith("UPDATE FRIENDS")
+    assert "RETURNING" in friend_statements[0]
+    assert await counts(session) == (1, 1)
+
+
+async def test_concurrent_writes_do_not_lose_increments(
+    session: AsyncSession,
+) -> None:
+    factory = async_sessionmaker(session.bind, expire_on_commit=False)
+
+    async def write() -> None:
+        async with factory() as other:
+            await ExDiaryRepository(other).save(new_ex_diary())
+
+    await asyncio.gather(*(write() for _ in range(5)))
+
+    assert await counts(session) == (5, 5)
+
+
+async def test_delete_decrements_and_never_goes_negative(
+    session: AsyncSession,
+) -> None:
+    repo = ExDiaryRepository(session)
+    ex_diary = new_ex_diary()
+    await repo.save(ex_diary)
+    await session.execute(update(Friend).values(ex_diary_cnt=0))
+    await session.commit()
+
+    await repo.delete_ex_diary(
+        user_id=1, friend_id=1, ex_diary_id=ex_diary.id  # type: ignore
+    )
+
+    assert (await counts(session))[0] == 0
+
+
+async def test_save_to_missing_friendship_is_rolled_back(
+    session: AsyncSession,
+) -> None:
+    # SQLite 는 외래키를 검사하지 않으므로 UPDATE 결과로, PostgreSQL 은 외래키로 거부
+    with pytest.raises((ValueError, IntegrityError)):
+        await ExDiaryRepository(session).save(new_ex_diary(friend_id=99))
+    await session.rollback()
+
+    assert await session.scalar(select(ExDiary.id)) is None
+
+
+async def test_reconcile_fixes_drifted_counters_in_batches(
+    session: AsyncSession,
+) -> None:
+    repo = ExDiaryRepository(session)
+    for friend_id in (1, 1, 2):
+        await repo.save(new_ex_diary(friend_id))
+    await session.execute(update(Friend).values(ex_diary_cnt=7))
+    await session.commit()
+
+    fixed, after_id = 0, 0
+    batches = 0
+    while True:
+        count, next_id = await reconcile_exchange_counts(session, after_id, 1)
+        await session.commit()
+        fixed += count
+        batches += 1
+        if next_id is None:
+            break
+        after_id = next_id
+
+    assert fixed == 2
+    assert batches == 3  # 마지막 빈 배치에서 종료
+    assert await counts(session, 1) == (2, 2)
+    assert await counts(session, 2) == (1, 1)
+
+
+async def test_reconcile_counts_and_fixes_in_one_statement(
+    session: AsyncSession,
+) -> None:
+    await ExDiaryRepository(session).save(new_ex_diary(1))
+    await session.execute(update(Friend).values(ex_diary_cnt=7))
+    await session.commit()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)  # type: ignore
+    fixed, _ = await reconcile_exchange_counts(session)
+    await session.commit()
+
+    # 배치 id 조회, friends UPDATE 한 번, 요약 행 UPDATE 한 번
+    assert statements == ["SELECT", "UPDATE", "UPDATE"]
+    assert fixed == 2
+    assert await counts(session, 1) == (1, 1)
+    assert await counts(session, 2) == (0, 0)
@@ -0,0 +1,310 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import Diary, MoodEnum, MoodRollup, WeatherEnum
+from src.diary.service import tasks as diary_tasks
+from src.diary.service.rollup import add_to_rollups
+from src.diary.service.tasks import delete_expired_diaries, delete_expired_diaries_job
+from src.ex_diary.models import ExDiary
+from src.friend.models import Friend, FriendEdge, FriendSummary
+from src.friend.repository import FriendRepository
+from src.friend.service.friendship_cache import friendship_cache
+from src.notification.models import Notification
+from src.upload.models import ImageBlob
+from src.upload.service.blobs import add_image_ref
+from src.user.models import AccountPurge, User
+from src.user.repository import UserRepository
+from src.user.service import purge
+from src.user.service import tasks as user_tasks
+from src.user.service.tasks import delete_expired_users, delete_expired_users_job
+from src.websocket.models import Message
+from tests.conftest import new_user
+
+KEY = "images/abc.jpg"
+
+
+def new_diary(user_id: int, deleted_at: datetime | None = None) -> Diary:
+    return Diary(
+        user_id=user_id,
+        title="제목",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.good,
+        content="내용",
+        img_key=KEY,
+        deleted_at=deleted_at,
+    )
+
+
+def count_deletes(session: AsyncSession) -> list[str]:
+    deletes: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if statement.lstrip().upper().startswith("DELETE"):
+            deletes.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)  # type: ignore
+    return deletes
+
+
+async def ref_count(session: AsyncSession) -> int:
+    return await session.scalar(  # type: ignore
+        select(ImageBlob.ref_count).where(ImageBlob.key == KEY)
+    )
+
+
+async def test_expired_diaries_are_deleted_in_chunks(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(diary_tasks.settings, "EXPIRED_DELETE_BATCH_SIZE", 2)
+    expired_at = datetime.now() - timedelta(days=8)
+    async_session.add(new_user(1, img_key=KEY))
+    async_session.add_all([new_diary(1, expired_at) for _ in range(5)])
+    async_session.add(new_diary(1))
+    for _ in range(7):
+        await add_image_ref(async_session, KEY)
+    await async_session.commit()
+    deletes = count_deletes(async_session)
+
+    assert await delete_expired_diaries(async_session) == 5
+
+    assert len(deletes) == 3
+    assert await async_session.scalar(select(func.count()).select_from(Diary)) == 1
+    # 프로필과 남은 일기의 참조만 남음
+    assert await ref_count(async_session) == 2
+
+
+@pytest.fixture
+async def expired_diaries(async_session: AsyncSession) -> None:
+    async_session.add(new_user(1, img_key=KEY))
+    async_session.add_all(
+        [new_diary(1, datetime.now() - timedelta(days=8)) for _ in range(3)]
+    )
+    for _ in range(4):
+        await add_image_ref(async_session, KEY)
+    await async_session.commit()
+
+
+@pytest.mark.usefixtures("expired_diaries")
+def test_delete_expired_diaries_runs_as_a_celery_task() -> None:
+    # 워커처럼 동기 함수로 실행 (이벤트 루프가 없는 스레드에서 asyncio.run)
+    assert delete_expired_diaries_job.apply().get() == 3
+    assert delete_expired_diaries_job.name == "tasks.delete_expired_diaries"
+
+
+async def test_expired_users_are_deleted_in_batches(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(user_tasks.settings, "ACCOUNT_PURGE_BATCH_SIZE", 2)
+    expired_at = datetime.now() - timedelta(days=8)
+    async_session.add_all(
+        [new_user(i, img_key=KEY, deleted_at=expired_at) for i in range(1, 4)]
+    )
+    async_session.add(new_user(4, img_key=KEY))
+    await async_session.flush()
+    async_session.add_all([new_diary(user_id) for user_id in range(1, 5)])
+    for _ in range(8):
+        await add_image_ref(async_session, KEY)
+    await async_session.commit()
+
+    assert await delete_expired_users(async_session) == 3
+
+    assert await async_session.scalar(select(func.count()).select_from(User)) == 1
+    # 남은 회원의 프로필과 일기의 참조만 남음
+    assert await ref_count(async_session) == 2
+
+
+async def count(session: AsyncSession, model: type) -> int:
+    return await session.scalar(select(func.count()).select_from(model))  # type: ignore
+
+
+@pytest.fixture
+async def expired_account(
+    async_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> AsyncSession:
+    """
+    탈퇴한 회원 1 (일기 3개, 회원 2 와 교환일기 4개/채팅 5개, 알림 3개)
+    모든 행과 두 회원의 프로필이 같은 이미지를 참조합니다.
+    """
+    monkeypatch.setattr(user_tasks.settings, "ACCOUNT_PURGE_CHUNK_SIZE", 2)
+    async_session.add_all(
+        [
+            new_user(1, img_key=KEY, deleted_at=datetime.now() - timedelta(days=8)),
+            new_user(2, img_key=KEY),
+        ]
+    )
+    await async_session.commit()
+    repo = FriendRepository(async_session)
+    request = await repo.create_friend_request(1, 2)
+    await repo.accept_friend_request(2, request.id)  # type: ignore
+
+    async_session.add_all([new_diary(1) for _ in range(3)])
+    async_session.add_all(
+        [
+            ExDiary(
+                user_id=1 + i % 2,
+                friend_id=request.id,
+                title="제목",
+                write_date=date(2025, 1, 1),
+                weather=WeatherEnum.clear,
+                mood=MoodEnum.good,
+                content="내용",
+                img_key=KEY,
+            )
+            for i in range(4)
+        ]
+    )
+    async_session.add_all(
+        [
+            Message(user_id=1 + i % 2, friend_id=request.id, message="안녕")
+            for i in range(5)
+        ]
+    )
+    async_session.add_all(
+        [Notification(user_id=1, title="알림", message="message") for _ in range(3)]
+    )
+    async_session.add(Notification(user_id=2, title="알림", message="message"))
+    # 교환일기는 두 회원이 2개씩 작성
+    for writer_id in (1, 2):
+        await add_to_rollups(
+            async_session, writer_id, "ex_diary", date(2025, 1, 1), MoodEnum.good, 2
+        )
+    for _ in range(2 + 3 + 4):
+        await add_image_ref(async_session, KEY)
+    await async_session.commit()
+    return async_session
+
+
+async def test_account_purge_removes_every_owned_row(
+    expired_account: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = expired_account
+    invalidated: list[tuple[int, list[int]]] = []
+
+    async def broadcast(friend_id: int, user_ids: list[int]) -> None:
+        invalidated.append((friend_id, sorted(user_ids)))
+
+    monkeypatch.setattr(friendship_cache, "broadcast_invalidation", broadcast)
+
+    assert await delete_expired_users(session) == 1
+
+    assert list(await session.scalars(select(User.id))) == [2]
+    for model in (Diary, ExDiary, Message, Friend, FriendEdge, FriendSummary):
+        assert await count(session, model) == 0
+    assert await count(session, Notification) == 1
+    assert await count(session, AccountPurge) == 0
+    # 남은 회원 2 의 프로필 참조만 남음
+    assert await ref_count(session) == 1
+    # 회원 2 가 쓴 교환일기도 삭제됐으므로 회원 2 의 기분 롤업에서 빠짐
+    rollups = await session.scalars(
+        select(MoodRollup.count).where(MoodRollup.user_id == 2)
+    )
+    assert set(rollups) == {0}
+    # 다른 워커의 친구 관계 캐시도 무효화
+    assert invalidated == [(1, [1, 2])]
+
+
+async def test_account_purge_resumes_from_checkpoint(
+    expired_account: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = expired_account
+
+    async def fail(session: AsyncSession, user_id: int, chunk_size: int) -> None:
+        raise RuntimeError("작업 중단")
+
+    with monkeypatch.context() as m:
+        m.setitem(purge.STAGE_HANDLERS, "notifications", fail)
+        with pytest.raises(RuntimeError):
+            await delete_expired_users(session)
+
+    # 앞 단계까지는 커밋되고 체크포인트에 중단된 단계가 남음
+    assert await session.scalar(select(AccountPurge.stage)) == "notifications"
+    assert await count(session, Diary) == 0
+    assert await count(session, Friend) == 0
+
+    # 다시 실행하면 중단된 단계부터 이어서 삭제
+    assert await delete_expired_users(session) == 1
+    assert list(await session.scalars(select(User.id))) == [2]
+    assert await count(session, AccountPurge) == 0
+
+
+async def test_rows_written_while_the_friendship_is_purged_are_released(
+    expired_account: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = expired_account
+    delete_all = purge.delete_all
+
+    async def delete_all_then_write(*args, **kwargs):  # type: ignore
+        deleted = await delete_all(*args, **kwargs)
+        if args[1] is Message and await count(session, Friend):
+            # 관계 삭제 전에 이미 친구 확인을 통과한 요청이 교환일기/채팅을 씀
+            assert await count(session, FriendEdge) == 0
+            session.add(
+                ExDiary(
+                    user_id=2,
+                    friend_id=1,
+                    title="제목",
+                    write_date=date(2025, 1, 1),
+                    weather=WeatherEnum.clear,
+                    mood=MoodEnum.good,
+                    content="내용",
+                    img_key=KEY,
+                )
+            )
+            session.add(Message(user_id=2, friend_id=1, message="안녕"))
+            await add_to_rollups(
+                session, 2, "ex_diary", date(2025, 1, 1), MoodEnum.good, 1
+            )
+            await add_image_ref(session, KEY)
+            await session.commit()
+        return deleted
+
+    monkeypatch.setattr(purge, "delete_all", delete_all_then_write)
+
+    assert await delete_expired_users(session) == 1
+
+    for model in (ExDiary, Message, Friend):
+        assert await count(session, model) == 0
+    assert await ref_count(session) == 1
+    rollups = await session.scalars(
+        select(MoodRollup.count).where(MoodRollup.user_id == 2)
+    )
+    assert set(rollups) == {0}
+
+
+async def test_account_being_purged_cannot_be_recovered(
+    expired_account: AsyncSession,
+) -> None:
+    session = expired_account
+    session.add(AccountPurge(user_id=1, stage="friends"))
+    await session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        await UserRepository(session).recovery_account("user1@test.com")
+    assert exc.value.status_code == 403
+    await session.rollback()
+
+    assert await session.scalar(select(User.deleted_at).where(User.id == 1))
+
+
+async def test_recovered_account_is_not_purged(
+    expired_account: AsyncSession,
+) -> None:
+    session = expired_account
+    await UserRepository(session).recovery_account("user1@test.com")
+
+    assert not await purge.purge_account(session, 1)
+
+    assert await count(session, AccountPurge) == 0
+    assert await count(session, Diary) == 3
+
+
+@pytest.mark.usefixtures("expired_account", "storage_bucket")
+def test_delete_expired_users_runs_as_a_celery_task() -> None:
+    # 워커처럼 동기 함수로 실행 (이벤트 루프가 없는 스레드에서 asyncio.run)
+    assert delete_expired_users_job.apply().get() == 1
+    assert delete_expired_users_job.name == "tasks.delete_expired_users"
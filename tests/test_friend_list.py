@@ -0,0 +1,159 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import MoodEnum, WeatherEnum
+from src.ex_diary.api.router import ex_diary_delete, write_ex_diary
+from src.ex_diary.repository import ExDiaryRepository
+from src.ex_diary.service.validate import ExDiaryService
+from src.friend.api.router import list_friends
+from src.friend.models import Friend
+from src.friend.repository import FriendRepository
+from src.friend.service.summary import record_latest_message
+from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+from src.user.repository import UserRepository
+from src.websocket.models import Message
+from src.websocket.repository import ChatRepository
+
+FRIENDS = 5
+
+pytestmark = pytest.mark.parametrize("session", [(FRIENDS + 1, FRIENDS)], indirect=True)
+
+
+async def friends_of(session: AsyncSession, user_id: int) -> dict[str, object]:
+    response = await list_friends(
+        current_user_id=user_id, frd_repo=FriendRepository(session)
+    )
+    return {item.friend_nickname: item for item in response.friends}
+
+
+async def test_accept_creates_summary_for_both_users(session: AsyncSession) -> None:
+    assert set(await friends_of(session, 1)) == {
+        f"nick{i}" for i in range(1, FRIENDS + 1)
+    }
+    assert set(await friends_of(session, 2)) == {"nick0"}
+
+
+async def test_list_friends_is_single_query(session: AsyncSession) -> None:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        statements.append(statement)
+
+    sync_engine = session.bind.sync_engine  # type: ignore
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        friends = await friends_of(session, 1)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    # 친구 수와 관계없이 요약 테이블 조회 1회
+    assert len(statements) == 1
+    assert len(friends) == FRIENDS
+
+
+async def test_summary_follows_messages_and_profile(session: AsyncSession) -> None:
+    now = datetime(2025, 1, 1)
+    for minute in range(3):
+        session.add(Message(user_id=1, friend_id=1, message=f"hi {minute}"))
+        await record_latest_message(
+            session, 1, f"hi {minute}", now + timedelta(minutes=minute)
+        )
+    await session.commit()
+
+    await UserRepository(session).update_user(
+        2, {"nickname": "renamed", "introduce": "안녕하세요"}
+    )
+
+    friends = await friends_of(session, 1)
+    assert friends["renamed"].latest_message == "hi 2"  # type: ignore
+    assert friends["renamed"].friend_introduce == "안녕하세요"  # type: ignore
+    assert friends["nick3"].latest_message is None  # type: ignore
+    assert (await friends_of(session, 2))["nick0"].latest_message == "hi 2"  # type: ignore
+
+
+async def test_summary_follows_exchange_diaries(session: AsyncSession) -> None:
+    async def write() -> None:
+        await write_ex_diary(
+            friend_id=1,
+            user_id=1,
+            title="제목",
+            write_date=date(2025, 1, 1),
+            weather=WeatherEnum.clear,
+            mood=MoodEnum.good,
+            content="내용",
+            image=None,  # type: ignore
+            image_key=None,
+            ex_diary_repo=ExDiaryRepository(session),
+        )
+
+    await write()
+    await write()
+    friends = await friends_of(session, 2)
+    assert friends["nick0"].ex_diary_cnt == 2  # type: ignore
+    assert friends["nick0"].last_ex_date is not None  # type: ignore
+
+    await ex_diary_delete(
+        user_id=1,
+        friend_id=1,
+        ex_diary_id=1,
+        ex_diary_repo=ExDiaryRepository(session),
+    )
+    assert (await friends_of(session, 1))["nick1"].ex_diary_cnt == 1  # type: ignore
+
+
+async def test_delete_friend_removes_summaries(session: AsyncSession) -> None:
+    assert await FriendRepository(session).delete_friend(1, 1)
+
+    assert "nick1" not in await friends_of(session, 1)
+    assert await friends_of(session, 2) == {}
+
+
+async def test_edges_follow_request_accept_delete(session: AsyncSession) -> None:
+    repo = FriendRepository(session)
+    request = await repo.create_friend_request(2, 3)
+
+    # 신청만 한 상태: 양쪽 모두 관계는 있지만 친구는 아님
+    assert (await repo.check_friendship(3, 2)).id == request.id  # type: ignore
+    assert not await repo.is_friend(2, request.id)  # type: ignore
+    with pytest.raises(HTTPException):
+        await ExDiaryService.validate_friendship(3, request.id, session)  # type: ignore
+
+    await repo.accept_friend_request(3, request.id)  # type: ignore
+    assert await repo.is_friend(2, request.id)  # type: ignore
+    await ExDiaryService.validate_friendship(3, request.id, session)  # type: ignore
+    assert not await repo.is_friend(4, request.id)  # type: ignore
+    assert sorted(friend.id for friend in await repo.get_friends(3)) == [  # type: ignore
+        2,
+        request.id,
+    ]
+
+    assert await repo.delete_friend(3, request.id)  # type: ignore
+    assert await repo.check_friendship(2, 3) is None
+    assert not await repo.is_friend(2, request.id)  # type: ignore
+
+
+async def test_latest_messages_by_friend_ids(session: AsyncSession) -> None:
+    now = datetime(2025, 1, 1)
+    for friend_id in (1, 2):
+        for minute in range(3):
+            session.add(
+                Message(
+                    user_id=1,
+                    friend_id=friend_id,
+                    message=f"{friend_id}-{minute}",
+                    created_at=now + timedelta(minutes=minute),
+                )
+            )
+    await session.commit()
+
+    latest = await ChatRepository(session).get_latest_messages([1, 2, 3])
+
+    assert {key: value.message for key, value in latest.items()} == {
+        1: "1-2",
+        2: "2-2",
+    }
+    assert await ChatRepository(session).get_latest_messages([]) == {}
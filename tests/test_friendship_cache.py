@@ -0,0 +1,136 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.cache import pubsub_listener
+from src.ex_diary.api.router import ex_diary_list
+from src.ex_diary.repository import ExDiaryRepository
+from src.friend.models import Friend  # noqa: F401 (매퍼 관계 설정용)
+from src.friend.repository import FriendRepository
+from src.friend.service import friendship_cache as cache_module
+from src.friend.service.friendship_cache import FriendshipCache, friendship_cache
+from src.notification.models import Notification  # noqa: F401
+from src.websocket.api.router import send_message
+from src.websocket.models import Message  # noqa: F401
+from src.websocket.schemas import MessageCreate
+from tests.conftest import new_user
+
+
+@pytest.fixture(autouse=True)
+def published(monkeypatch) -> list[tuple[str, str]]:
+    messages: list[tuple[str, str]] = []
+
+    class FakeRedis:
+        async def publish(self, channel: str, data: str) -> None:
+            messages.append((channel, data))
+
+    monkeypatch.setattr(cache_module, "get_redis", lambda: FakeRedis())
+    return messages
+
+
+@pytest.fixture
+async def repo(async_session: AsyncSession) -> FriendRepository:
+    async_session.add_all([new_user(i) for i in range(3)])
+    await async_session.commit()
+
+    repo = FriendRepository(async_session)
+    request = await repo.create_friend_request(1, 2)
+    await repo.accept_friend_request(2, request.id)  # type: ignore
+    return repo
+
+
+def count_queries(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)  # type: ignore
+    return statements
+
+
+def test_cache_expires_and_evicts(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = FriendshipCache(maxsize=2, ttl=10)
+
+    cache.put(1, 1)
+    cache.put(2, 1)
+    cache.put(3, 2)  # 가장 오래된 (1, 1) 제거
+    assert not cache.get(1, 1)
+    assert cache.get(2, 1)
+
+    now[0] += 10
+    assert not cache.get(2, 1)
+    assert len(cache) == 1
+
+    cache.invalidate(2, [3])
+    assert len(cache) == 0
+
+
+async def test_membership_is_cached_after_first_lookup(
+    repo: FriendRepository,
+) -> None:
+    statements = count_queries(repo.session)
+
+    assert await repo.is_friend(1, 1)
+    assert await repo.is_friend(1, 1)
+    assert await repo.is_friend(2, 1)
+
+    # 두 사용자 각각 한 번씩만 조회
+    assert len(statements) == 2
+    assert friendship_cache.hits == 1
+
+
+async def test_non_friends_are_not_cached(repo: FriendRepository) -> None:
+    assert not await repo.is_friend(3, 1)
+    assert len(friendship_cache) == 0
+
+
+async def test_delete_friend_invalidates_cache(repo: FriendRepository) -> None:
+    assert await repo.is_friend(1, 1)
+    assert await repo.is_friend(2, 1)
+
+    assert await repo.delete_friend(2, 1)
+
+    assert not await repo.is_friend(1, 1)
+    assert not await repo.is_friend(2, 1)
+
+
+async def test_delete_friend_is_broadcast_to_other_workers(
+    repo: FriendRepository, published: list[tuple[str, str]]
+) -> None:
+    # 다른 워커의 캐시
+    other_worker = FriendshipCache()
+    other_worker.put(1, 1)
+    other_worker.put(2, 1)
+    other_worker.put(1, 5)
+
+    assert await repo.delete_friend(2, 1)
+    assert len(published) == 1
+
+    channel, data = published[0]
+    pubsub_listener.dispatch({"channel": channel, "data": data})
+    assert not friendship_cache.get(1, 1)
+
+    other_worker.apply(data)
+    assert not other_worker.get(1, 1)
+    assert not other_worker.get(2, 1)
+    assert other_worker.get(1, 5)
+
+
+async def test_ex_diary_routes_reject_non_friends(repo: FriendRepository) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await ex_diary_list(
+            friend_id=1, user_id=3, ex_diary_repo=ExDiaryRepository(repo.session)
+        )
+    assert exc_info.value.status_code == 400
+
+
+async def test_send_message_rejects_non_friends(repo: FriendRepository) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await send_message(
+            MessageCreate(user_id=3, friend_id=1, content="안녕"), db=repo.session
+        )
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,151 @@
+import io
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.storage import get_storage, public_url
+from src.diary.models import MoodEnum, WeatherEnum
+from src.ex_diary.models import ExDiary
+from src.ex_diary.repository import ExDiaryRepository
+from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+from src.upload.models import ImageBlob
+from src.upload.service.blobs import (
+    purge_image_batch,
+    release_image,
+    store_image,
+    unused_before,
+)
+from src.upload.service.images import create_image_variants
+from src.websocket.models import Message  # noqa: F401
+from tests.test_images import jpeg
+
+pytestmark = pytest.mark.usefixtures("storage_bucket")
+
+
+async def age_blobs(session: AsyncSession) -> None:
+    # presigned 업로드 유예 시간이 지난 것처럼 만듦
+    await session.execute(
+        update(ImageBlob).values(created_at=unused_before() - timedelta(seconds=1))
+    )
+
+
+def stored_keys(bucket: str) -> list[str]:
+    objects = get_storage().list_objects_v2(Bucket=bucket)
+    return sorted(item["Key"] for item in objects.get("Contents", []))
+
+
+async def test_same_image_is_stored_once(
+    async_session: AsyncSession, storage_bucket: str
+) -> None:
+    data = jpeg(800, 600)
+
+    first = await store_image(async_session, io.BytesIO(data), "image/jpeg")
+    second = await store_image(async_session, io.BytesIO(data), "image/jpeg")
+    await async_session.commit()
+
+    assert first == second
+    assert first.startswith("images/") and first.endswith(".jpg")
+    assert stored_keys(storage_bucket) == [first]
+    blob = await async_session.get(ImageBlob, first)
+    assert blob.ref_count == 2  # type: ignore
+
+
+async def test_image_is_purged_after_the_last_reference(
+    async_session: AsyncSession, storage_bucket: str
+) -> None:
+    data = jpeg(800, 600)
+    key = await store_image(async_session, io.BytesIO(data), "image/jpeg")
+    await store_image(async_session, io.BytesIO(data), "image/jpeg")
+    await async_session.commit()
+
+    # 아직 참조가 남아 있으면 지우지 않음
+    await release_image(async_session, key)
+    await age_blobs(async_session)
+    await async_session.commit()
+    assert await purge_image_batch(async_session) == 0
+    assert stored_keys(storage_bucket) == [key]
+
+    await release_image(async_session, key)
+    await async_session.commit()
+    assert await purge_image_batch(async_session) == 1
+    await async_session.commit()
+
+    assert stored_keys(storage_bucket) == []
+    assert await async_session.get(ImageBlob, key) is None
+
+
+async def test_purged_image_is_uploaded_again(
+    async_session: AsyncSession, storage_bucket: str
+) -> None:
+    data = jpeg(800, 600)
+    key = await store_image(async_session, io.BytesIO(data), "image/jpeg")
+    await release_image(async_session, key)
+    await age_blobs(async_session)
+    await async_session.commit()
+    await purge_image_batch(async_session)
+    await async_session.commit()
+
+    assert await store_image(async_session, io.BytesIO(data), "image/jpeg") == key
+    assert stored_keys(storage_bucket) == [key]
+
+
+async def test_image_of_a_rolled_back_request_is_purged(
+    async_session: AsyncSession, storage_bucket: str
+) -> None:
+    key = await store_image(async_session, io.BytesIO(jpeg(800, 600)), "image/jpeg")
+    # 예: 교환일기 저장이 실패해서 요청 트랜잭션이 롤백됨
+    await async_session.rollback()
+
+    # 업로드 전에 따로 커밋한 참조 0 행이 남아 있어서 정리 작업이 객체를 찾을 수 있음
+    blob = await async_session.get(ImageBlob, key)
+    assert blob.ref_count == 0  # type: ignore
+    assert stored_keys(storage_bucket) == [key]
+
+    await age_blobs(async_session)
+    assert await purge_image_batch(async_session) == 1
+    await async_session.commit()
+    assert stored_keys(storage_bucket) == []
+
+
+def new_ex_diary(img_key: str) -> ExDiary:
+    return ExDiary(
+        user_id=1,
+        friend_id=1,
+        title="제목",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.good,
+        content="내용",
+        img_url=public_url(img_key),
+        img_key=img_key,
+    )
+
+
+async def test_variants_are_shared_and_purged_with_the_image(
+    session: AsyncSession, storage_bucket: str
+) -> None:
+    data = jpeg(800, 600)
+    repo = ExDiaryRepository(session)
+    ex_diaries = []
+    for _ in range(2):
+        img_key = await store_image(session, io.BytesIO(data), "image/jpeg")
+        ex_diary = new_ex_diary(img_key)
+        await repo.save(ex_diary)
+        ex_diaries.append(ex_diary)
+
+    for ex_diary in ex_diaries:
+        assert await create_image_variants(session, "ex_diary", ex_diary.id)  # type: ignore
+    await session.commit()
+    # 두 번째 일기는 이미 만든 변환 이미지를 그대로 사용
+    assert ex_diaries[0].img_thumbnail_key == ex_diaries[1].img_thumbnail_key
+    assert len(stored_keys(storage_bucket)) == 3
+
+    for ex_diary in ex_diaries:
+        await repo.delete_ex_diary(1, 1, ex_diary.id)  # type: ignore
+    await age_blobs(session)
+    assert await purge_image_batch(session) == 1
+    await session.commit()
+
+    assert stored_keys(storage_bucket) == []
@@ -0,0 +1,140 @@
+import io
+from datetime import date
+
+import pytest
+from PIL import Image
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.storage import public_url, upload_file
+from src.diary.models import MoodEnum, WeatherEnum
+from src.ex_diary.models import ExDiary
+from src.ex_diary.schema.response import ExDiaryBriefResponse, ExDiaryResponse
+from src.friend.models import FriendSummary
+from src.friend.schema.response import FriendsResponse
+from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+from src.upload.service.images import create_image_variants, render_variants
+from src.user.models import User
+from src.user.repository import UserRepository
+from src.websocket.models import Message  # noqa: F401
+
+pytestmark = pytest.mark.usefixtures("storage_bucket")
+
+# EXIF Orientation 태그 번호
+ORIENTATION = 0x0112
+
+
+def jpeg(width: int, height: int, orientation: int = 1) -> bytes:
+    exif = Image.Exif()
+    exif[ORIENTATION] = orientation
+    exif[0x010F] = "Camera maker"
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, "JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_variants_are_rotated_resized_and_stripped() -> None:
+    # 90도 회전(6)으로 찍힌 가로 2000 x 세로 1000 사진 -> 세로 사진
+    variants = render_variants(jpeg(2000, 1000, orientation=6))
+
+    with Image.open(io.BytesIO(variants["thumb"])) as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (160, 320)
+        assert not thumb.getexif()
+    with Image.open(io.BytesIO(variants["display"])) as webp:
+        assert webp.size == (640, 1280)
+        assert not webp.getexif()
+
+
+def test_small_images_are_not_upscaled() -> None:
+    variants = render_variants(jpeg(100, 50))
+
+    with Image.open(io.BytesIO(variants["display"])) as webp:
+        assert webp.size == (100, 50)
+
+
+async def test_ex_diary_list_uses_thumbnail_and_detail_the_stripped_webp(
+    session: AsyncSession,
+) -> None:
+    img_url = await upload_file(io.BytesIO(jpeg(800, 600)), "ex_diaries/ex_1.jpg")
+    ex_diary = ExDiary(
+        user_id=1,
+        friend_id=1,
+        title="제목",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.good,
+        content="내용",
+        img_url=img_url,
+        img_key="ex_diaries/ex_1.jpg",
+    )
+    session.add(ex_diary)
+    await session.commit()
+
+    # 변환 전에는 목록/상세 모두 원본
+    user = await session.get(User, 1)
+    assert ExDiaryBriefResponse.build(ex_diary, 1).img_url == img_url
+    assert ExDiaryResponse.build(ex_diary, user).img_url == img_url  # type: ignore
+
+    assert await create_image_variants(session, "ex_diary", ex_diary.id)  # type: ignore
+    await session.commit()
+    await session.refresh(ex_diary)
+
+    assert ex_diary.img_thumbnail_key == "ex_diaries/ex_1.thumb.webp"
+    assert ExDiaryBriefResponse.build(ex_diary, 1).img_url == public_url(
+        "ex_diaries/ex_1.thumb.webp"
+    )
+    detail = ExDiaryResponse.build(ex_diary, user)  # type: ignore
+    # 상세 이미지는 EXIF 를 지운 WebP
+    assert detail.img_url == public_url("ex_diaries/ex_1.display.webp")
+    assert detail.webp_url == detail.img_url
+
+
+async def test_profile_thumbnail_reaches_friend_list(session: AsyncSession) -> None:
+    img_url = await upload_file(io.BytesIO(jpeg(800, 600)), "profiles/profile_2_1")
+    await UserRepository(session).update_user(
+        2, {"img_url": img_url, "img_key": "profiles/profile_2_1"}
+    )
+
+    assert await create_image_variants(session, "profile", 2)
+    await session.commit()
+
+    summary = await session.scalar(
+        select(FriendSummary).where(FriendSummary.user_id == 1)
+    )
+    assert FriendsResponse.build(summary).friend_profile_img == public_url(  # type: ignore
+        "profiles/profile_2_1.thumb.webp"
+    )
+
+    # 새 프로필 사진으로 바꾸면 새 썸네일이 만들어질 때까지 원본
+    new_url = await upload_file(io.BytesIO(jpeg(800, 600)), "profiles/profile_2_2")
+    await UserRepository(session).update_user(
+        2, {"img_url": new_url, "img_key": "profiles/profile_2_2"}
+    )
+    await session.refresh(summary)
+    assert FriendsResponse.build(summary).friend_profile_img == new_url  # type: ignore
+
+
+async def test_removed_image_is_skipped(session: AsyncSession) -> None:
+    await upload_file(io.BytesIO(jpeg(800, 600)), "profiles/profile_2_1")
+    await UserRepository(session).update_user(
+        2,
+        {
+            "img_url": public_url("profiles/profile_2_1"),
+            "img_key": "profiles/profile_2_1",
+        },
+    )
+    await UserRepository(session).update_user(2, {"img_url": None, "img_key": None})
+
+    assert not await create_image_variants(session, "profile", 2)
+
+
+async def test_unreadable_images_keep_the_original(session: AsyncSession) -> None:
+    img_url = await upload_file(io.BytesIO(b"\x00" * 100), "profiles/profile_2_1")
+    await UserRepository(session).update_user(
+        2, {"img_url": img_url, "img_key": "profiles/profile_2_1"}
+    )
+
+    assert not await create_image_variants(session, "profile", 2)
+    user = await session.get(User, 2)
+    assert user.img_thumbnail_key is None  # type: ignore
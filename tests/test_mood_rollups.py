@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.diary.models import Diary, MoodEnum, MoodRollup, WeatherEnum
+from src.diary.repository import DiaryRepository
+from src.diary.service.rollup import period_start, period_starts, rebuild_rollups
+from src.ex_diary.models import ExDiary
+from src.ex_diary.repository import ExDiaryRepository
+from src.friend.models import Friend
+from src.notification.models import Notification  # noqa: F401 (매퍼 관계 설정용)
+from src.user.models import User
+from src.websocket.models import Message  # noqa: F401
+
+
+@pytest.fixture
+async def session(async_session: AsyncSession) -> AsyncSession:
+    for i in (1, 2):
+        async_session.add(
+            User(
+                name=f"tester{i}",
+                nickname=f"tester{i}",
+                email=f"tester{i}@test.com",
+                password="pw",
+                is_active=True,
+                provider="local",
+            )
+        )
+    await async_session.flush()
+    async_session.add(Friend(user_id1=1, user_id2=2, is_accept=True))
+    await async_session.commit()
+    return async_session
+
+
+def new_diary(write_date: date, mood: MoodEnum) -> Diary:
+    return Diary(
+        user_id=1,
+        title="제목",
+        content="내용",
+        write_date=write_date,
+        weather=WeatherEnum.clear,
+        mood=mood,
+    )
+
+
+def test_period_boundaries() -> None:
+    # 2025-01-01 은 수요일
+    assert period_start("week", date(2025, 1, 1)) == date(2024, 12, 30)
+    assert period_start("month", date(2025, 1, 31)) == date(2025, 1, 1)
+    assert period_starts("month", date(2024, 12, 15), date(2025, 2, 1)) == [
+        date(2024, 12, 1),
+        date(2025, 1, 1),
+        date(2025, 2, 1),
+    ]
+
+
+async def test_rollups_follow_writes_and_match_rebuild(session: AsyncSession) -> None:
+    diary_repo = DiaryRepository(session)
+    ex_diary_repo = ExDiaryRepository(session)
+
+    diaries = [
+        new_diary(date(2025, 1, 6), MoodEnum.good),
+        new_diary(date(2025, 1, 7), MoodEnum.good),
+        new_diary(date(2025, 1, 20), MoodEnum.sad),
+        new_diary(date(2025, 2, 3), MoodEnum.happy),
+    ]
+    for diary in diaries:
+        await diary_repo.save(diary)
+    await diary_repo.delete(diaries[1])
+
+    ex_diary = await ExDiary.create(
+        user_id=1,
+        friend_id=1,
+        title="교환일기",
+        write_date=date(2025, 1, 8),  # type: ignore
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.tired,
+        content="내용",
+    )
+    await ex_diary_repo.save(ex_diary)
+
+    start, end = date(2025, 1, 1), date(2025, 2, 28)
+    monthly = await diary_repo.get_mood_trends(
+        1, "month", start, end, sources=("diary", "ex_diary")
+    )
+    assert monthly[date(2025, 1, 1)][MoodEnum.good] == 1
+    assert monthly[date(2025, 1, 1)][MoodEnum.tired] == 1
+    assert monthly[date(2025, 2, 1)][MoodEnum.happy] == 1
+
+    weekly = await diary_repo.get_mood_trends(1, "week", start, end, sources=("diary",))
+    # 빈 주도 0 으로 채워서 반환
+    assert len(weekly) == 9
+    assert weekly[date(2025, 1, 6)][MoodEnum.good] == 1
+    assert weekly[date(2025, 1, 6)][MoodEnum.tired] == 0
+
+    # 롤업을 지운 뒤 원본 기준으로 다시 계산해도 같은 결과
+    await session.execute(delete(MoodRollup))
+    await rebuild_rollups(session, since=date(2024, 12, 1))
+    await session.commit()
+
+    assert (
+        await diary_repo.get_mood_trends(
+            1, "month", start, end, sources=("diary", "ex_diary")
+        )
+        == monthly
+    )
+    assert (
+        await diary_repo.get_mood_trends(1, "week", start, end, sources=("diary",))
+        == weekly
+    )
@@ -0,0 +1,83 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.diary.models import Diary, MoodEnum, WeatherEnum
+from src.diary.repository import DiaryRepository
+from src.friend.models import Friend  # noqa: F401 (매퍼 관계 설정용)
+from src.notification.models import Notification  # noqa: F401
+from src.user.models import User
+from src.websocket.models import Message  # noqa: F401
+
+
+@pytest.fixture
+async def diary_repo(async_session: AsyncSession) -> DiaryRepository:
+    user = User(
+        name="tester",
+        nickname="tester",
+        email="tester@test.com",
+        password="pw",
+        is_active=True,
+        provider="local",
+    )
+    async_session.add(user)
+    await async_session.commit()
+    return DiaryRepository(async_session)
+
+
+def new_diary(mood: MoodEnum) -> Diary:
+    return Diary(
+        user_id=1,
+        title="제목",
+        content="내용",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=mood,
+    )
+
+
+async def test_counters_follow_write_delete_restore(
+    diary_repo: DiaryRepository,
+) -> None:
+    diaries = [new_diary(m) for m in (MoodEnum.good, MoodEnum.good, MoodEnum.sad)]
+    for diary in diaries:
+        await diary_repo.save(diary)
+
+    assert await diary_repo.get_mood_counts(1) == {MoodEnum.good: 2, MoodEnum.sad: 1}
+
+    await diary_repo.delete(diaries[0])
+    await diary_repo.delete(diaries[0])  # 중복 삭제는 카운터에 영향 없음
+    assert (await diary_repo.get_mood_counts(1))[MoodEnum.good] == 1
+
+    await diary_repo.restore_diary(diaries[0].id, user_id=1)  # type: ignore
+    assert (await diary_repo.get_mood_counts(1))[MoodEnum.good] == 2
+
+    # 카운터와 GROUP BY 집계 결과가 같아야 함
+    assert await diary_repo.count_moods(1) == await diary_repo.get_mood_counts(1)
+
+
+async def test_concurrent_delete_and_restore_count_once(
+    diary_repo: DiaryRepository,
+) -> None:
+    diary = new_diary(MoodEnum.good)
+    await diary_repo.save(diary)
+    factory = async_sessionmaker(diary_repo.session.bind, expire_on_commit=False)
+
+    # 두 요청이 모두 삭제되지 않은 상태의 일기를 읽은 뒤 동시에 삭제
+    async with factory() as first, factory() as second:
+        repos = [DiaryRepository(first), DiaryRepository(second)]
+        loaded = [await repo.get_diary_detail(diary_id=diary.id) for repo in repos]  # type: ignore
+        await asyncio.gather(
+            *(repo.delete(item) for repo, item in zip(repos, loaded))  # type: ignore
+        )
+    assert (await diary_repo.get_mood_counts(1))[MoodEnum.good] == 0
+
+    async def restore() -> None:
+        async with factory() as session:
+            await DiaryRepository(session).restore_diary(diary.id, user_id=1)  # type: ignore
+
+    await asyncio.gather(restore(), restore())
+    assert (await diary_repo.get_mood_counts(1))[MoodEnum.good] == 1
+    assert await diary_repo.count_moods(1) == await diary_repo.get_mood_counts(1)
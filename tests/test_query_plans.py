@@ -0,0 +1,257 @@
+import os
+from typing import Any, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from fastapi_pagination import Params, set_params
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.config.database.orm import Base
+from src.diary.repository import DiaryRepository
+from src.ex_diary.repository import ExDiaryRepository
+from src.friend.repository import FriendRepository
+from src.notification.models import Notification
+from src.websocket.models import Message
+from src.websocket.repository import ChatRepository
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL") or os.environ["DATABASE_URL"]
+
+# 데이터는 모듈에서 한 번만 생성하므로 같은 이벤트 루프에서 실행
+pytestmark = [
+    pytest.mark.skipif(
+        not DATABASE_URL.startswith("postgresql"),
+        reason="EXPLAIN 검증은 PostgreSQL 에서만 실행",
+    ),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+USERS = 2_000
+FRIENDS = 20_000
+ROWS = 100_000
+
+# 실제 분포와 비슷하게 사용자/친구 관계별로 행을 나눠서 생성
+SEED = [
+    f"""
+    INSERT INTO users (id, name, nickname, email, password, is_active, provider,
+                       created_at, modified_at)
+    SELECT i, 'user' || i, 'nick' || i, 'user' || i || '@test.com', 'pw', true,
+           'local', now(), now()
+    FROM generate_series(1, {USERS}) AS i
+    """,
+    f"""
+    INSERT INTO friends (id, user_id1, user_id2, is_accept, ex_diary_cnt, created_at)
+    SELECT i, i % {USERS} + 1, (i * 7 + 3) % {USERS} + 1, i % 3 <> 0, 0,
+           now() - i * interval '1 minute'
+    FROM generate_series(1, {FRIENDS}) AS i
+    """,
+    f"""
+    INSERT INTO diaries (user_id, title, write_date, weather, mood, content,
+                         created_at, deleted_at)
+    SELECT i % {USERS} + 1, 'title ' || i, current_date - (i % 700), 'clear',
+           (ARRAY['happy', 'good', 'normal', 'tired', 'sad'])[i % 5 + 1]::moodenum,
+           'content ' || i, now() - i * interval '1 minute',
+           CASE WHEN i % 10 = 0 THEN now() END
+    FROM generate_series(1, {ROWS}) AS i
+    """,
+    f"""
+    INSERT INTO ex_diaries (user_id, friend_id, title, write_date, weather, mood,
+                            content, created_at)
+    SELECT i % {USERS} + 1, i % {FRIENDS} + 1, 'title ' || i, current_date,
+           'clear', 'good', 'content ' || i, now() - i * interval '1 minute'
+    FROM generate_series(1, {ROWS}) AS i
+    """,
+    f"""
+    INSERT INTO messages (user_id, friend_id, message, created_at)
+    SELECT i % {USERS} + 1, i % {FRIENDS} + 1, 'message ' || i,
+           now() - i * interval '1 second'
+    FROM generate_series(1, {ROWS}) AS i
+    """,
+    """
+    INSERT INTO friend_edges (user_id, other_user_id, friend_id, is_accept)
+    SELECT DISTINCT ON (pair.user_id, pair.other_user_id)
+           pair.user_id, pair.other_user_id, f.id, f.is_accept
+    FROM friends f
+    CROSS JOIN LATERAL (
+        VALUES (f.user_id1, f.user_id2), (f.user_id2, f.user_id1)
+    ) AS pair (user_id, other_user_id)
+    WHERE f.user_id1 <> f.user_id2
+    ORDER BY pair.user_id, pair.other_user_id, f.is_accept DESC, f.id
+    """,
+    """
+    INSERT INTO friend_summaries (user_id, friend_id, friend_user_id,
+                                  friend_nickname, ex_diary_cnt, created_at)
+    SELECT f.user_id1, f.id, u.id, u.nickname, 0, f.created_at
+    FROM friends f JOIN users u ON u.id = f.user_id2
+    WHERE f.is_accept
+    UNION ALL
+    SELECT f.user_id2, f.id, u.id, u.nickname, 0, f.created_at
+    FROM friends f JOIN users u ON u.id = f.user_id1
+    WHERE f.is_accept
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO notifications (user_id, title, message, is_read, created_at)
+    SELECT i % {USERS} + 1, 'title', 'message ' || i, false,
+           now() - i * interval '1 minute'
+    FROM generate_series(1, {ROWS}) AS i
+    """,
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_engine():
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in SEED:
+            await conn.execute(text(statement))
+        await conn.execute(text("ANALYZE"))
+
+    yield engine
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def seeded_session(seeded_engine):
+    async with async_sessionmaker(seeded_engine, expire_on_commit=False)() as session:
+        yield session
+        await session.rollback()
+
+
+async def explain(
+    session: AsyncSession, call: Callable[[], Awaitable[Any]], table: str
+) -> list[str]:
+    """repository 호출 중 실행된 SELECT 중 table 을 조회한 쿼리의 실행 계획을 반환합니다."""
+    statements: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine  # type: ignore
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        await call()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    conn = await session.connection()
+    plans = []
+    for statement, parameters in statements:
+        if f"FROM {table}" not in statement:
+            continue
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in result))
+
+    assert plans, f"{table} 를 조회한 쿼리가 없습니다."
+    return plans
+
+
+def assert_index_scan(plans: list[str], table: str) -> None:
+    for plan in plans:
+        assert f"Seq Scan on {table}" not in plan, plan
+        assert "Index" in plan, plan
+
+
+async def test_diary_list_uses_index(seeded_session: AsyncSession) -> None:
+    repo = DiaryRepository(seeded_session)
+    set_params(Params(page=1, size=10))
+
+    plans = await explain(seeded_session, lambda: repo.get_diary_list(42), "diaries")
+    assert_index_scan(plans, "diaries")
+
+    plans = await explain(
+        seeded_session, lambda: repo.get_diary_list(42, year=2025), "diaries"
+    )
+    assert_index_scan(plans, "diaries")
+
+    plans = await explain(
+        seeded_session, lambda: repo.get_diary_list(42, word="conte"), "diaries"
+    )
+    assert_index_scan(plans, "diaries")
+
+    plans = await explain(
+        seeded_session, lambda: repo.get_calendar(42, 2025, 1), "diaries"
+    )
+    assert_index_scan(plans, "diaries")
+
+    # 커서 페이지네이션은 COUNT 없이 인덱스 범위 스캔 한 번
+    first = await repo.get_diary_list_by_cursor(42, size=10)
+    plans = await explain(
+        seeded_session,
+        lambda: repo.get_diary_list_by_cursor(42, cursor=first.next_cursor, size=10),
+        "diaries",
+    )
+    assert len(plans) == 1
+    assert_index_scan(plans, "diaries")
+
+
+async def test_ex_diary_list_uses_index(seeded_session: AsyncSession) -> None:
+    repo = ExDiaryRepository(seeded_session)
+
+    plans = await explain(
+        seeded_session, lambda: repo.get_ex_diary_list(42), "ex_diaries"
+    )
+    assert_index_scan(plans, "ex_diaries")
+
+
+async def test_message_history_uses_index(seeded_session: AsyncSession) -> None:
+    # 웹소켓 연결 시 이전 메시지 조회 쿼리
+    async def history() -> None:
+        await seeded_session.execute(
+            select(Message).where(Message.friend_id == 42).order_by(Message.created_at)
+        )
+
+    plans = await explain(seeded_session, history, "messages")
+    assert_index_scan(plans, "messages")
+
+    repo = ChatRepository(seeded_session)
+    plans = await explain(
+        seeded_session,
+        lambda: repo.get_latest_messages(list(range(1, 201))),
+        "messages",
+    )
+    assert_index_scan(plans, "messages")
+
+
+async def test_friend_queries_use_index(seeded_session: AsyncSession) -> None:
+    repo = FriendRepository(seeded_session)
+
+    for call in (
+        lambda: repo.get_friends(42),
+        lambda: repo.check_friendship(42, 297),
+        lambda: repo.get_friend_request_list(42),
+        lambda: repo.sent_friend_request_list(42),
+    ):
+        plans = await explain(seeded_session, call, "friends")
+        assert_index_scan(plans, "friends")
+
+    plans = await explain(
+        seeded_session, lambda: repo.get_friend_summaries(42), "friend_summaries"
+    )
+    assert_index_scan(plans, "friend_summaries")
+
+    # 친구 관계 확인은 friend_edges 인덱스만 읽음
+    plans = await explain(
+        seeded_session, lambda: repo.is_friend(42, 41), "friend_edges"
+    )
+    assert_index_scan(plans, "friend_edges")
+
+
+async def test_notification_list_uses_index(seeded_session: AsyncSession) -> None:
+    # 사용자별 알림 조회 (최신순)
+    async def notifications() -> None:
+        await seeded_session.execute(
+            select(Notification)
+            .where(Notification.user_id == 42)
+            .order_by(Notification.created_at.desc())
+        )
+
+    plans = await explain(seeded_session, notifications, "notifications")
+    assert_index_scan(plans, "notifications")
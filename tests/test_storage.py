@@ -0,0 +1,195 @@
+import asyncio
+import io
+import threading
+import time
+from typing import Any, Iterator
+
+import pytest
+from fastapi import HTTPException
+
+from src.config import storage
+from src.config.storage import (
+    close_storage,
+    delete_images,
+    get_storage,
+    image_size,
+    public_url,
+    settings,
+    sniff_image_type,
+    transfer_config,
+    upload_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_storage() -> Iterator[None]:
+    close_storage()
+    yield
+    close_storage()
+
+
+def test_storage_client_is_shared_and_pooled() -> None:
+    client = get_storage()
+
+    assert get_storage() is client
+    assert (
+        client.meta.config.max_pool_connections == settings.STORAGE_MAX_POOL_CONNECTIONS
+    )
+
+
+def test_close_storage_drops_the_client() -> None:
+    client = get_storage()
+    close_storage()
+
+    assert storage._client is None
+    assert get_storage() is not client
+
+
+async def test_delete_images_without_keys_makes_no_request() -> None:
+    await delete_images([])
+    assert storage._client is None
+
+
+class DeleteClient:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def delete_objects(self, Bucket: str, Delete: dict[str, Any]) -> None:
+        self.requests.append([item["Key"] for item in Delete["Objects"]])
+
+    def close(self) -> None:
+        pass
+
+
+async def test_delete_images_batches_keys_with_variants() -> None:
+    client = DeleteClient()
+    storage._client = client
+
+    await delete_images([f"images/{i}.jpg" for i in range(400)])
+
+    # 이미지당 원본 + 변환 이미지 2개, 요청당 최대 1000개
+    assert [len(keys) for keys in client.requests] == [1000, 200]
+    assert client.requests[0][:3] == [
+        "images/0.jpg",
+        "images/0.thumb.webp",
+        "images/0.display.webp",
+    ]
+
+
+class SlowClient:
+    """업로드마다 0.2초 걸리는 클라이언트. 실행된 스레드와 동시 실행 수를 기록합니다."""
+
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def upload_fileobj(
+        self, fileobj: Any, bucket: str, key: str, **kwargs: Any
+    ) -> None:
+        with self.lock:
+            self.threads.append(threading.current_thread().name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.2)
+        with self.lock:
+            self.running -= 1
+        assert kwargs["Config"] is transfer_config
+
+    def close(self) -> None:
+        pass
+
+
+async def test_upload_does_not_block_the_event_loop() -> None:
+    client = SlowClient()
+    storage._client = client
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    url = await upload_file(io.BytesIO(b"image"), "diaries/diary_1.png")
+    ticker.cancel()
+
+    assert url == public_url("diaries/diary_1.png")
+    assert client.threads[0].startswith("storage")
+    # 업로드를 기다리는 동안에도 다른 코루틴이 계속 실행됨
+    assert ticks >= 10
+
+
+async def test_concurrent_uploads_are_capped() -> None:
+    client = SlowClient()
+    storage._client = client
+
+    await asyncio.gather(
+        *(
+            upload_file(io.BytesIO(b"image"), f"diaries/diary_{i}.png")
+            for i in range(settings.STORAGE_MAX_CONCURRENCY + 3)
+        )
+    )
+
+    assert client.max_running == settings.STORAGE_MAX_CONCURRENCY
+
+
+class NoReadFile(io.BytesIO):
+    """read() 로 내용을 통째로 읽으면 실패하는 파일."""
+
+    def read(self, size: int | None = -1) -> bytes:
+        assert size is not None and 0 <= size <= 16
+        return super().read(size)
+
+
+def test_image_size_does_not_read_the_file() -> None:
+    fileobj = NoReadFile(b"\x89PNG\r\n\x1a\n" + b"0" * 1000)
+    fileobj.seek(5)
+
+    assert image_size(fileobj) == 1008
+    assert fileobj.tell() == 0
+    assert sniff_image_type(fileobj) == "image/png"
+
+
+def test_image_size_rejects_large_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "UPLOAD_MAX_SIZE", 10)
+
+    with pytest.raises(HTTPException) as exc:
+        image_size(io.BytesIO(b"0" * 11))
+    assert exc.value.status_code == 413
+
+
+@pytest.mark.parametrize(
+    "head, content_type",
+    [
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+        (b"GIF89a\x01\x00", "image/gif"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"\x00\x00\x00\x18ftypheic", "image/heic"),
+    ],
+)
+def test_sniff_image_type(head: bytes, content_type: str) -> None:
+    assert sniff_image_type(io.BytesIO(head)) == content_type
+
+
+def test_sniff_image_type_rejects_non_images() -> None:
+    with pytest.raises(HTTPException) as exc:
+        sniff_image_type(io.BytesIO(b"<script>alert(1)</script>"))
+    assert exc.value.status_code == 415
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        # WEBP 브랜드만 있고 RIFF 컨테이너가 아닌 파일
+        b"<svg\x24\x00\x00\x00WEBPVP8 ",
+        # heic 브랜드만 있고 ftyp 박스가 아닌 파일
+        b"<scr\x00\x00\x00\x18heic",
+    ],
+)
+def test_sniff_image_type_requires_the_container_header(head: bytes) -> None:
+    with pytest.raises(HTTPException) as exc:
+        sniff_image_type(io.BytesIO(head))
+    assert exc.value.status_code == 415
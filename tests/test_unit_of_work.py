@@ -0,0 +1,217 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.database.unit_of_work import (
+    AFTER_COMMIT,
+    get_unit_of_work,
+    unit_of_work,
+    when_committed,
+)
+from src.diary.models import MoodEnum, WeatherEnum
+from src.ex_diary.models import ExDiary
+from src.ex_diary.repository import ExDiaryRepository
+from src.friend.models import Friend
+from src.friend.repository import FriendRepository
+from src.friend.service.friendship_cache import friendship_cache
+from src.notification.models import Notification
+from src.notification.repository import NotificationRepository
+from src.user.repository import UserRepository
+from src.websocket.models import Message  # noqa: F401 (매퍼 관계 설정용)
+from tests.conftest import new_user
+
+pytestmark = pytest.mark.parametrize("session", [(2, 0)], indirect=True)
+
+
+def record_statements(session: AsyncSession) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore
+        statements.append(statement.lstrip().split()[0].upper())
+
+    def record_commit(conn):  # type: ignore
+        statements.append("COMMIT")
+
+    sync_engine = session.bind.sync_engine  # type: ignore
+    event.listen(sync_engine, "before_cursor_execute", record)
+    event.listen(sync_engine, "commit", record_commit)
+    return statements
+
+
+async def test_friend_request_is_one_transaction_without_refresh(
+    session: AsyncSession,
+) -> None:
+    statements = record_statements(session)
+
+    async with unit_of_work(session):
+        notification = await NotificationRepository(session).create_notification(
+            Notification(user_id=2, title="친구 요청", message="message")
+        )
+        friend = await FriendRepository(session).create_friend_request(1, 2)
+
+    # INSERT ... RETURNING 으로 id 를 받으므로 refresh SELECT 없음
+    assert "SELECT" not in statements
+    assert statements.count("COMMIT") == 1
+    assert notification.id is not None and friend.id is not None
+
+
+async def test_unit_of_work_rolls_back_every_repository(
+    session: AsyncSession,
+) -> None:
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(session):
+            await NotificationRepository(session).create_notification(
+                Notification(user_id=2, title="친구 요청", message="message")
+            )
+            await FriendRepository(session).create_friend_request(1, 2)
+            raise RuntimeError("실패")
+
+    assert await session.scalar(select(func.count()).select_from(Friend)) == 0
+    assert await session.scalar(select(func.count()).select_from(Notification)) == 0
+
+
+async def test_nested_unit_of_work_commits_once(session: AsyncSession) -> None:
+    statements = record_statements(session)
+
+    async with unit_of_work(session):
+        async with unit_of_work(session):
+            await FriendRepository(session).create_friend_request(1, 2)
+        assert "COMMIT" not in statements
+
+    assert statements.count("COMMIT") == 1
+
+
+async def test_request_unit_of_work_rolls_back_on_http_error(
+    session: AsyncSession,
+) -> None:
+    # 쓰기 라우트의 의존성: 라우트에서 HTTPException 이 나면 그 전의 쓰기도 모두 롤백
+    dependency = get_unit_of_work(session)
+    request_session = await anext(dependency)
+    await NotificationRepository(request_session).create_notification(
+        Notification(user_id=2, title="친구 요청", message="message")
+    )
+    await FriendRepository(request_session).create_friend_request(1, 2)
+
+    with pytest.raises(HTTPException):
+        await dependency.athrow(HTTPException(status_code=404))
+
+    assert await session.scalar(select(func.count()).select_from(Friend)) == 0
+    assert await session.scalar(select(func.count()).select_from(Notification)) == 0
+
+
+async def test_work_after_commit_waits_for_the_request_commit(
+    session: AsyncSession,
+) -> None:
+    statements = record_statements(session)
+    enqueued: list[list[str]] = []
+
+    dependency = get_unit_of_work(session)
+    request_session = await anext(dependency)
+    await FriendRepository(request_session).create_friend_request(1, 2)
+    await when_committed(request_session, lambda: enqueued.append(list(statements)))
+    assert enqueued == []
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+
+    # Celery 작업은 커밋된 뒤에 등록되어 워커가 행을 찾을 수 있음
+    assert len(enqueued) == 1 and enqueued[0][-1] == "COMMIT"
+
+    # unit_of_work 밖에서는 이미 커밋됐으므로 바로 실행
+    await when_committed(session, lambda: enqueued.append([]))
+    assert len(enqueued) == 2
+
+
+async def test_signup_checks_duplicates_in_one_query(session: AsyncSession) -> None:
+    statements = record_statements(session)
+
+    user = await UserRepository(session).create_user(new_user(3))
+
+    assert statements == ["SELECT", "INSERT", "COMMIT"]
+    assert user.id is not None
+
+
+async def test_signup_reports_which_field_is_taken(session: AsyncSession) -> None:
+    repo = UserRepository(session)
+
+    duplicate_email = new_user(3)
+    duplicate_email.email = "user1@test.com"
+    with pytest.raises(HTTPException, match="Email already registered"):
+        await repo.create_user(duplicate_email)
+
+    duplicate_nickname = new_user(3)
+    duplicate_nickname.nickname = "nick1"
+    with pytest.raises(HTTPException, match="Nickname already taken"):
+        await repo.create_user(duplicate_nickname)
+
+
+@pytest.fixture
+async def friendship(session: AsyncSession) -> int:
+    repo = FriendRepository(session)
+    request = await repo.create_friend_request(1, 2)
+    await repo.accept_friend_request(2, request.id)  # type: ignore
+    assert await repo.is_friend(1, request.id)  # type: ignore
+    return request.id  # type: ignore
+
+
+async def test_cache_is_invalidated_after_the_outer_commit(
+    session: AsyncSession, friendship: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    published: list[str] = []
+
+    async def broadcast(friend_id: int, user_ids: list[int]) -> None:
+        published.append(f"{friend_id}")
+        friendship_cache.invalidate(friend_id, user_ids)
+
+    monkeypatch.setattr(friendship_cache, "broadcast_invalidation", broadcast)
+
+    async with unit_of_work(session):
+        await FriendRepository(session).delete_friend(1, friendship)
+        # 블록 안에서는 아직 커밋 전이므로 캐시를 건드리지 않음
+        assert friendship_cache.get(1, friendship)
+        assert published == []
+
+    assert not friendship_cache.get(1, friendship)
+    assert published == [f"{friendship}"]
+
+
+async def test_rolled_back_delete_keeps_the_cache(
+    session: AsyncSession, friendship: int
+) -> None:
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(session):
+            await FriendRepository(session).delete_friend(1, friendship)
+            raise RuntimeError("실패")
+
+    assert friendship_cache.get(1, friendship)
+    assert await session.get(Friend, friendship) is not None
+    assert AFTER_COMMIT not in session.info
+
+
+async def test_failed_ex_diary_save_rolls_back_the_outer_block(
+    session: AsyncSession,
+) -> None:
+    ex_diary = ExDiary(
+        user_id=1,
+        friend_id=99,
+        title="제목",
+        write_date=date(2025, 1, 1),
+        weather=WeatherEnum.clear,
+        mood=MoodEnum.good,
+        content="내용",
+    )
+
+    # SQLite 는 외래키를 검사하지 않으므로 UPDATE 결과로, PostgreSQL 은 외래키로 거부
+    with pytest.raises((ValueError, IntegrityError)):
+        async with unit_of_work(session):
+            await NotificationRepository(session).create_notification(
+                Notification(user_id=2, title="교환일기", message="message")
+            )
+            await ExDiaryRepository(session).save(ex_diary)
+
+    assert await session.scalar(select(func.count()).select_from(Notification)) == 0
+    assert await session.scalar(select(func.count()).select_from(ExDiary)) == 0
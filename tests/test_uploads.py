@@ -0,0 +1,161 @@
+from datetime import timedelta
+from typing import Iterator
+
+import pytest
+import requests
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.storage import get_storage
+from src.main import app
+from src.upload.api.router import presign_upload
+from src.upload.models import ImageBlob
+from src.upload.schema.request import PresignRequest
+from src.upload.service import uploads
+from src.upload.service.blobs import purge_image_batch, unused_before
+from src.upload.service.uploads import claim_uploaded_image
+from src.user.service.authentication import authenticate
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"0" * 100
+
+pytestmark = pytest.mark.usefixtures("storage_bucket")
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    app.dependency_overrides[authenticate] = lambda: 1
+    yield TestClient(app)
+    app.dependency_overrides.pop(authenticate, None)
+
+
+async def presign(session: AsyncSession, kind: str, content_type: str = "image/png") -> dict:  # type: ignore
+    response = await presign_upload(
+        PresignRequest(kind=kind, content_type=content_type),  # type: ignore
+        user_id=1,
+        session=session,
+    )
+    return response.model_dump()
+
+
+def post_file(presigned: dict, content: bytes) -> None:  # type: ignore
+    response = requests.post(
+        presigned["url"],
+        data=presigned["fields"],
+        files={"file": ("image.png", content)},
+    )
+    assert response.status_code == 204
+
+
+@pytest.mark.parametrize(
+    "kind, prefix",
+    [
+        ("diary", "diaries/diary_1_"),
+        ("ex_diary", "ex_diaries/ex_diary_1_"),
+        ("profile", "profiles/profile_1_"),
+    ],
+)
+async def test_presign_returns_server_chosen_key(
+    async_session: AsyncSession, kind: str, prefix: str
+) -> None:
+    presigned = await presign(async_session, kind)
+
+    assert presigned["key"].startswith(prefix)
+    assert presigned["key"].endswith(".png")
+    assert presigned["fields"]["key"] == presigned["key"]
+    assert presigned["fields"]["Content-Type"] == "image/png"
+
+
+def test_presign_rejects_non_image_types(client: TestClient) -> None:
+    response = client.post(
+        "/uploads/presign", json={"kind": "diary", "content_type": "text/html"}
+    )
+
+    assert response.status_code == 415
+
+
+async def test_uploaded_image_is_claimed_by_key(
+    async_session: AsyncSession,
+) -> None:
+    presigned = await presign(async_session, "diary")
+    post_file(presigned, PNG)
+
+    key = await claim_uploaded_image(async_session, "diary", 1, presigned["key"])
+
+    assert key == presigned["key"]
+    blob = await async_session.get(ImageBlob, key)
+    assert blob.ref_count == 1  # type: ignore
+
+
+async def test_claim_rejects_keys_of_other_users_and_kinds(
+    async_session: AsyncSession,
+) -> None:
+    presigned = await presign(async_session, "diary")
+    post_file(presigned, PNG)
+
+    for kind, user_id in (("diary", 2), ("profile", 1)):
+        with pytest.raises(HTTPException) as exc:
+            await claim_uploaded_image(async_session, kind, user_id, presigned["key"])  # type: ignore
+        assert exc.value.status_code == 400
+
+
+async def test_claim_rejects_missing_uploads(
+    async_session: AsyncSession,
+) -> None:
+    presigned = await presign(async_session, "diary")
+
+    with pytest.raises(HTTPException) as exc:
+        await claim_uploaded_image(async_session, "diary", 1, presigned["key"])
+    assert exc.value.status_code == 400
+
+
+async def test_claim_deletes_invalid_uploads(
+    async_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    storage_bucket: str,
+) -> None:
+    not_image = await presign(async_session, "diary")
+    post_file(not_image, b"<script>alert(1)</script>")
+    monkeypatch.setattr(uploads.settings, "UPLOAD_MAX_SIZE", 50)
+    too_large = await presign(async_session, "diary")
+    post_file(too_large, PNG)
+
+    # 발급할 때 서명한 형식과 실제 형식이 다른 파일 (PNG 키에 올린 JPEG)
+    mismatched = await presign(async_session, "diary")
+    post_file(mismatched, b"\xff\xd8\xff\xe0\x00\x10JFIF" + b"0" * 10)
+
+    for presigned, status_code in (
+        (not_image, 415),
+        (too_large, 413),
+        (mismatched, 415),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await claim_uploaded_image(async_session, "diary", 1, presigned["key"])
+        assert exc.value.status_code == status_code
+
+    assert get_storage().list_objects_v2(Bucket=storage_bucket)["KeyCount"] == 0
+
+
+async def test_unclaimed_uploads_are_purged_after_the_presign_expires(
+    async_session: AsyncSession, storage_bucket: str
+) -> None:
+    unclaimed = await presign(async_session, "diary")
+    post_file(unclaimed, PNG)
+    claimed = await presign(async_session, "diary")
+    post_file(claimed, PNG)
+    await claim_uploaded_image(async_session, "diary", 1, claimed["key"])
+    await async_session.commit()
+
+    # 발급 직후에는 아직 업로드/참조 중일 수 있으므로 지우지 않음
+    assert await purge_image_batch(async_session) == 0
+
+    await async_session.execute(
+        update(ImageBlob).values(created_at=unused_before() - timedelta(seconds=1))
+    )
+    assert await purge_image_batch(async_session) == 1
+    await async_session.commit()
+
+    objects = get_storage().list_objects_v2(Bucket=storage_bucket)
+    assert [item["Key"] for item in objects["Contents"]] == [claimed["key"]]
+    assert await async_session.get(ImageBlob, unclaimed["key"]) is None